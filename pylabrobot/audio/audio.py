@@ -4,19 +4,30 @@ Source of audio: https://simpleguics2pygame.readthedocs.io/en/latest/_static/lin
 """
 
 import functools
+from typing import Any, Optional
 
-try:
-  from IPython.display import Audio, display
+# IPython takes a long time to import, so it is only imported when audio is first played.
+USE_AUDIO: Optional[bool] = None
+Audio: Any = None
+display: Any = None
 
-  USE_AUDIO = True
-except ImportError:
-  USE_AUDIO = False
+
+def _import_ipython() -> bool:
+  global USE_AUDIO, Audio, display
+  if USE_AUDIO is None:
+    try:
+      from IPython.display import Audio, display
+
+      USE_AUDIO = True
+    except ImportError:
+      USE_AUDIO = False
+  return USE_AUDIO
 
 
 def _audio_check(func):
   @functools.wraps(func)
   def wrapper(*args, **kwargs):
-    if not USE_AUDIO:
+    if not _import_ipython():
       return
     return func(*args, **kwargs)
 
@@ -1,14 +1,45 @@
-from .backends import *
-from .liquid_handler import LiquidHandler
-from .standard import (
-  Aspiration,
-  AspirationPlate,
-  Dispense,
-  DispensePlate,
-  Drop,
-  DropTipRack,
-  Pickup,
-  PickupTipRack,
-  ResourceMove,
+from typing import TYPE_CHECKING
+
+from pylabrobot.utils.lazy_import import lazy_import
+
+# Submodules, including the backends, are imported when they are first used, see `lazy_import`.
+# Keep this in sync with the imports below, which are for type checkers.
+__getattr__, __dir__ = lazy_import(
+  __name__,
+  {
+    "LiquidHandler": ".liquid_handler",
+    "Aspiration": ".standard",
+    "AspirationPlate": ".standard",
+    "Dispense": ".standard",
+    "DispensePlate": ".standard",
+    "Drop": ".standard",
+    "DropTipRack": ".standard",
+    "Pickup": ".standard",
+    "PickupTipRack": ".standard",
+    "ResourceMove": ".standard",
+    "Strictness": ".strictness",
+    "get_strictness": ".strictness",
+    "set_strictness": ".strictness",
+    "Transfer": ".transfer_planner",
+    "TransferBatch": ".transfer_planner",
+    "plan_transfers": ".transfer_planner",
+  },
+  star_modules=[".backends"],
 )
-from .strictness import Strictness, get_strictness, set_strictness
+
+if TYPE_CHECKING:
+  from .backends import *
+  from .liquid_handler import LiquidHandler
+  from .standard import (
+    Aspiration,
+    AspirationPlate,
+    Dispense,
+    DispensePlate,
+    Drop,
+    DropTipRack,
+    Pickup,
+    PickupTipRack,
+    ResourceMove,
+  )
+  from .strictness import Strictness, get_strictness, set_strictness
+  from .transfer_planner import Transfer, TransferBatch, plan_transfers
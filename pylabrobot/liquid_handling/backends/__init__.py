@@ -1,16 +1,39 @@
-from .backend import LiquidHandlerBackend
-from .chatterbox import LiquidHandlerChatterboxBackend
-from .chatterbox_backend import ChatterBoxBackend
-from .hamilton.STAR import STAR
-from .hamilton.vantage import Vantage
-from .http import HTTPBackend
-from .opentrons_backend import OpentronsBackend
-from .saver_backend import SaverBackend
-from .serializing_backend import (
-  SerializingBackend,
-  SerializingSavingBackend,
+from typing import TYPE_CHECKING
+
+from pylabrobot.utils.lazy_import import lazy_import
+
+# Backends are imported when they are first used, see `lazy_import`. Keep this list in sync with the
+# imports below, which are for type checkers.
+__getattr__, __dir__ = lazy_import(
+  __name__,
+  {
+    "LiquidHandlerBackend": ".backend",
+    "LiquidHandlerChatterboxBackend": ".chatterbox",
+    "ChatterBoxBackend": ".chatterbox_backend",
+    "STAR": ".hamilton.STAR",
+    "Vantage": ".hamilton.vantage",
+    "HTTPBackend": ".http",
+    "OpentronsBackend": ".opentrons_backend",
+    "SaverBackend": ".saver_backend",
+    "SerializingBackend": ".serializing_backend",
+    "SerializingSavingBackend": ".serializing_backend",
+    "EVO": ".tecan.EVO",
+    "WebSocketBackend": ".websocket",
+  },
 )
-from .tecan.EVO import EVO
 
-# many rely on this
-from .websocket import WebSocketBackend
+if TYPE_CHECKING:
+  from .backend import LiquidHandlerBackend
+  from .chatterbox import LiquidHandlerChatterboxBackend
+  from .chatterbox_backend import ChatterBoxBackend
+  from .hamilton.STAR import STAR
+  from .hamilton.vantage import Vantage
+  from .http import HTTPBackend
+  from .opentrons_backend import OpentronsBackend
+  from .saver_backend import SaverBackend
+  from .serializing_backend import (
+    SerializingBackend,
+    SerializingSavingBackend,
+  )
+  from .tecan.EVO import EVO
+  from .websocket import WebSocketBackend
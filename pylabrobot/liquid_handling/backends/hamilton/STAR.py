@@ -9,8 +9,11 @@ from typing import (
   Dict,
   List,
   Literal,
+  NamedTuple,
   Optional,
+  Pattern,
   Sequence,
+  Tuple,
   Type,
   TypeVar,
   Union,
@@ -47,6 +50,7 @@ from pylabrobot.resources import (
   Carrier,
   Coordinate,
   Resource,
+  Rotation,
   TipRack,
   TipSpot,
   Well,
@@ -169,10 +173,58 @@ def parse_star_fw_string(resp: str, fmt: str = "") -> dict:
   # Remove device and cmd identifier from response.
   resp = resp[4:]
 
-  # Parse the parameters in the fmt string.
-  info = {}
+  parser = _compile_star_fw_fmt(fmt)
+  match = parser.pattern.match(resp)
+  if match is None:
+    # Find the first parameter that is missing, for the error message.
+    for (name, _, _), field_pattern in zip(parser.fields, parser.field_patterns):
+      if field_pattern.search(resp) is None:
+        raise ValueError(f"could not find matches for parameter {name}")
+    raise ValueError(f"could not parse response {resp}")
+
+  info: dict = {}
+  for (name, type_, is_list), m in zip(parser.fields, match.groups()):
+    if is_list:
+      m = m.split(" ")
+
+      if type_ == "str":
+        info[name] = m
+      elif type_ == "int":
+        info[name] = [int(m_) for m_ in m if m_ != ""]
+      elif type_ == "hex":
+        info[name] = [int(m_, base=16) for m_ in m if m_ != ""]
+    else:
+      if type_ == "str":
+        info[name] = m
+      elif type_ == "int":
+        info[name] = int(m)
+      elif type_ == "hex":
+        info[name] = int(m, base=16)
+
+  return info
+
+
+class _STARFwParser(NamedTuple):
+  """A compiled `fmt` for :func:`parse_star_fw_string`."""
+
+  fields: Tuple[Tuple[str, str, bool], ...]  # (name, type, is_list)
+  pattern: Pattern[str]  # matches all fields at once
+  field_patterns: Tuple[Pattern[str], ...]  # one per field, used for error messages
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_star_fw_fmt(fmt: str) -> _STARFwParser:
+  """Compile a format string for :func:`parse_star_fw_string`.
 
-  def find_param(param):
+  Each parameter becomes a regex, and the regexes of all parameters are combined into a single
+  pattern of lookaheads, so that a response is parsed with a single match. Like a separate search
+  per parameter, each lookahead finds the first match of its parameter anywhere in the response.
+  """
+
+  fields: List[Tuple[str, str, bool]] = []
+  regexes: List[str] = []
+
+  def add_param(param: str):
     name, data = param[0:2], param[2:]
     type_ = {"#": "int", "*": "hex", "&": "str"}[data[0]]
 
@@ -192,32 +244,8 @@ def parse_star_fw_string(resp: str, fmt: str = "") -> dict:
       regex += "))"
       is_list = False
 
-    # Match response against regex, save results in right datatype.
-    r = re.search(regex, resp)
-    if r is None:
-      raise ValueError(f"could not find matches for parameter {name}")
-
-    g = r.groups()
-    if len(g) == 0:
-      raise ValueError(f"could not find value for parameter {name}")
-    m = g[0]
-
-    if is_list:
-      m = m.split(" ")
-
-      if type_ == "str":
-        info[name] = m
-      elif type_ == "int":
-        info[name] = [int(m_) for m_ in m if m_ != ""]
-      elif type_ == "hex":
-        info[name] = [int(m_, base=16) for m_ in m if m_ != ""]
-    else:
-      if type_ == "str":
-        info[name] = m
-      elif type_ == "int":
-        info[name] = int(m)
-      elif type_ == "hex":
-        info[name] = int(m, base=16)
+    fields.append((name, type_, is_list))
+    regexes.append(regex)
 
   # Find params in string. All params are identified by 2 lowercase chars.
   param = ""
@@ -225,18 +253,23 @@ def parse_star_fw_string(resp: str, fmt: str = "") -> dict:
   for char in fmt:
     if char.islower() and prevchar != "(":
       if len(param) > 2:
-        find_param(param)
+        add_param(param)
         param = ""
     param += char
     prevchar = char
   if param != "":
-    find_param(param)  # last parameter is not closed by loop.
+    add_param(param)  # last parameter is not closed by loop.
 
   # If id not in fmt, add it.
-  if "id" not in info:
-    find_param("id####")
+  if "id" not in (name for name, _, _ in fields):
+    add_param("id####")
 
-  return info
+  return _STARFwParser(
+    fields=tuple(fields),
+    # `[\s\S]` also skips newlines, without making `.` in the "str" regexes match newlines.
+    pattern=re.compile("".join(rf"(?=[\s\S]*?{regex})" for regex in regexes)),
+    field_patterns=tuple(re.compile(regex) for regex in regexes),
+  )
 
 
 class STARModuleError(Exception, metaclass=ABCMeta):
@@ -1665,7 +1698,7 @@ class STAR(HamiltonLiquidHandler):
       min_z_endpos: The minimum height to move to, this is the end of aspiration.
 
       hamilton_liquid_classes: Override the default liquid classes. See
-        pylabrobot/liquid_handling/liquid_classes/hamilton/star.py
+        pylabrobot/liquid_handling/liquid_classes/hamilton/star.json
       liquid_surface_no_lld: Liquid surface at function without LLD [mm]. Must be between 0
           and 360. Defaults to well bottom + liquid height. Should use absolute z.
     """
@@ -1951,7 +1984,7 @@ class STAR(HamiltonLiquidHandler):
       side_touch_off_distance: The distance to move to the side from the well for a dispense.
 
       hamilton_liquid_classes: Override the default liquid classes. See
-        pylabrobot/liquid_handling/liquid_classes/hamilton/star.py
+        pylabrobot/liquid_handling/liquid_classes/hamilton/star.json
 
       jet: Whether to use jetting for each dispense. Defaults to `False` for all. Used for
         determining the dispense mode. True for dispense mode 0 or 1.
@@ -2890,14 +2923,13 @@ class STAR(HamiltonLiquidHandler):
       # grip_direction here is the drop_direction. We use `rotation` to cancel it out and get the
       # original grip direction. Hack.
       # the resource still has its original orientation.
+      rotation = drop.resource.rotation + Rotation(
+        z=drop.rotation + drop.destination_absolute_rotation.z
+      )
       if drop.direction in (GripDirection.FRONT, GripDirection.BACK):
-        plate_width = drop.resource.rotated(
-          z=drop.rotation + drop.destination_absolute_rotation.z
-        ).get_absolute_size_x()
+        plate_width = drop.resource.get_rotated_size(rotation).x
       elif drop.direction in (GripDirection.RIGHT, GripDirection.LEFT):
-        plate_width = drop.resource.rotated(
-          z=drop.rotation + drop.destination_absolute_rotation.z
-        ).get_absolute_size_y()
+        plate_width = drop.resource.get_rotated_size(rotation).y
       else:
         raise ValueError("Invalid grip direction")
 
@@ -2905,9 +2937,7 @@ class STAR(HamiltonLiquidHandler):
       # The computation of the center has to be rotated so that the offset is in absolute space.
       center_in_absolute_space = Coordinate(
         *matrix_vector_multiply_3x3(
-          drop.resource.rotated(z=drop.rotation + drop.destination_absolute_rotation.z)
-          .get_absolute_rotation()
-          .get_rotation_matrix(),
+          rotation.get_rotation_matrix(),
           drop.resource.center().vector(),
         )
       )
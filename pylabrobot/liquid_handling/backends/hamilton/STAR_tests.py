@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 import unittest.mock
 from typing import cast
@@ -22,7 +23,7 @@ from pylabrobot.resources import (
   no_volume_tracking,
 )
 from pylabrobot.resources.hamilton import STF, STARLetDeck
-from tests.usb import MockDev, MockEndpoint
+from tests.usb import LoopbackDev, MockDev, MockEndpoint
 
 from .STAR import (
   STAR,
@@ -78,6 +79,10 @@ class TestSTARResponseParsing(unittest.TestCase):
     parsed = parse_star_fw_string("C0QMid1113pqABC", "pq***")
     self.assertEqual(parsed, {"id": 1113, "pq": int("ABC", base=16)})
 
+    # like `re.search`, "." does not match newlines
+    parsed = parse_star_fw_string("C0QMid1114aa\nbcaaxyz", "aa&&&")
+    self.assertEqual(parsed, {"id": 1114, "aa": "xyz"})
+
     with self.assertRaises(ValueError):
       # should fail with auto-added id.
       parsed = parse_star_fw_string("C0QMaaabc", "")
@@ -89,6 +94,23 @@ class TestSTARResponseParsing(unittest.TestCase):
     with self.assertRaises(ValueError):
       parse_star_fw_string("C0RV", "")
 
+  def test_parse_response_multiple_params(self):
+    # parameters do not have to be in the same order as in the format
+    resp = "C0TRid0010er00/00kz381 356 365 000 000 000 000 000vz303 360 368 000 000 000 000 000"
+    parsed = parse_star_fw_string(resp, "vz### (n)kz### (n)")
+    self.assertEqual(
+      parsed,
+      {
+        "id": 10,
+        "kz": [381, 356, 365, 0, 0, 0, 0, 0],
+        "vz": [303, 360, 368, 0, 0, 0, 0, 0],
+      },
+    )
+
+    # the first missing parameter is reported
+    with self.assertRaisesRegex(ValueError, "parameter zz"):
+      parse_star_fw_string(resp, "kz### (n)zz##")
+
   def test_parse_response_no_errors(self):
     parsed = parse_star_fw_string("C0QMid1111", "")
     self.assertEqual(parsed, {"id": 1111})
@@ -176,6 +198,98 @@ class TestSTARUSBComms(unittest.IsolatedAsyncioTestCase):
     with self.assertRaises(TimeoutError):
       await star.send_command("C0", command="QM")
 
+  async def test_send_command_concurrently(self):
+    # The machine answers the second command first.
+    pending = []
+
+    def respond(data: bytes):
+      pending.append(data.decode("utf-8"))
+      if len(pending) == 2:
+        for cmd in reversed(pending):
+          dev.inject(cmd[:4].encode() + cmd[4:10].encode())
+      return None
+
+    dev = LoopbackDev(respond=respond)
+    star = STARUSBCommsMocker(read_timeout=2, packet_read_timeout=1)
+    star.dev = dev
+    star.read_endpoint = MockEndpoint()
+    star.write_endpoint = MockEndpoint()
+
+    responses = await asyncio.gather(
+      star.send_command("C0", command="QM", fmt="id####"),
+      star.send_command("C0", command="RQ", fmt="id####"),
+    )
+    self.assertEqual(responses, [{"id": 1}, {"id": 2}])
+    assert star._transport is not None
+    star._transport.stop()
+
+  def _make_pipelining_star(self, written, respond_to):
+    """A STAR that answers the commands for which `respond_to(cmd)` is true immediately."""
+
+    def respond(data: bytes):
+      cmd = data.decode("utf-8")
+      written.append(cmd)
+      if respond_to(cmd):
+        return cmd[:10].encode()
+      return None
+
+    dev = LoopbackDev(respond=respond)
+    star = STARUSBCommsMocker(read_timeout=2, packet_read_timeout=1)
+    star.dev = dev
+    star.read_endpoint = MockEndpoint()
+    star.write_endpoint = MockEndpoint()
+    return star, dev
+
+  async def test_max_in_flight(self):
+    written: list = []
+    star, dev = self._make_pipelining_star(written, respond_to=lambda cmd: False)
+    star.max_in_flight = {"C0": 1}
+
+    first = star.submit_command("C0", command="QM", fmt="id####")
+    second = star.submit_command("C0", command="RQ", fmt="id####")
+    await asyncio.sleep(0.05)
+    self.assertEqual([cmd[:4] for cmd in written], ["C0QM"])  # second command is held back
+
+    dev.inject(written[0][:10].encode())
+    self.assertEqual(await first, {"id": 1})
+    await asyncio.sleep(0.05)
+    self.assertEqual([cmd[:4] for cmd in written], ["C0QM", "C0RQ"])
+
+    dev.inject(written[1][:10].encode())
+    self.assertEqual(await second, {"id": 2})
+    assert star._transport is not None
+    star._transport.stop()
+
+  async def test_other_module_not_blocked(self):
+    # A long running C0 command does not hold up commands for the pip channels.
+    written: list = []
+    star, dev = self._make_pipelining_star(written, respond_to=lambda cmd: cmd.startswith("P1"))
+    star.max_in_flight = {"C0": 1}
+
+    move = star.submit_command("C0", command="JM")
+    await asyncio.sleep(0)
+    self.assertEqual(await star.send_command("P1", command="RV"), written[1][:10])
+    self.assertFalse(move.done())
+
+    dev.inject(written[0][:10].encode())
+    self.assertEqual(await move, written[0][:10])
+    assert star._transport is not None
+    star._transport.stop()
+
+  async def test_timeout_does_not_affect_other_commands(self):
+    written: list = []
+    star, _ = self._make_pipelining_star(written, respond_to=lambda cmd: cmd.startswith("P1"))
+
+    lost = star.submit_command("C0", command="QM", read_timeout=0.2)  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+    self.assertEqual(await star.send_command("P1", command="RV"), written[1][:10])
+    with self.assertRaises(TimeoutError):
+      await lost
+    self.assertEqual(star._waiting_tasks, {})
+    self.assertEqual(star._in_flight["C0"], 0)
+    assert star._transport is not None
+    star._transport.stop()
+
 
 class STARCommandCatcher(STAR):
   """Mock backend for star that catches commands and saves them instead of sending them to the
@@ -1,5 +1,10 @@
 import asyncio
+import collections
+import concurrent.futures
 import datetime
+import functools
+import heapq
+import itertools
 import logging
 import threading
 import time
@@ -7,6 +12,8 @@ from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 from typing import (
   Any,
+  Deque,
+  Dict,
   List,
   Optional,
   Sequence,
@@ -32,15 +39,35 @@ T = TypeVar("T")
 logger = logging.getLogger("pylabrobot")
 
 
-@dataclass
+@dataclass(eq=False)
 class HamiltonTask:
-  """A command that has been sent, awaiting a response."""
+  """A command that has been submitted, awaiting a response."""
 
   id_: Optional[int]
   loop: asyncio.AbstractEventLoop
   fut: asyncio.Future
   cmd: str
   timeout_time: float
+  module: str = ""
+  read_timeout: float = 0
+  write_timeout: float = 0
+  sent: bool = False
+
+
+def _set_result_if_pending(fut: asyncio.Future, result: Any) -> None:
+  if not fut.done():
+    fut.set_result(result)
+
+
+def _set_exception_if_pending(fut: asyncio.Future, exception: BaseException) -> None:
+  if not fut.done():
+    fut.set_exception(exception)
+
+
+def _fail_task_if_write_failed(task: HamiltonTask, write_fut: concurrent.futures.Future) -> None:
+  exception = write_fut.exception()
+  if exception is not None:
+    task.loop.call_soon_threadsafe(_set_exception_if_pending, task.fut, exception)
 
 
 class HamiltonLiquidHandler(LiquidHandlerBackend, USBBackend, metaclass=ABCMeta):
@@ -83,8 +110,27 @@ class HamiltonLiquidHandler(LiquidHandlerBackend, USBBackend, metaclass=ABCMeta)
 
     self.id_ = 0
 
-    self._reading_thread: Optional[threading.Thread] = None
-    self._waiting_tasks: List[HamiltonTask] = []
+    # Tasks waiting for a response, by id. Tasks for commands without an id are matched on the
+    # command instead. Responses are matched on the USB reader thread, so access is guarded by a
+    # lock.
+    self._waiting_tasks: Dict[int, HamiltonTask] = {}
+    self._waiting_tasks_without_id: List[HamiltonTask] = []
+    self._waiting_tasks_lock = threading.Lock()
+
+    # Heap of (timeout_time, sequence number, task) for sent tasks, and the timer that fails the
+    # first task to time out.
+    self._deadlines: List[Tuple[float, int, HamiltonTask]] = []
+    self._deadline_counter = itertools.count()
+    self._timeout_handle: Optional[asyncio.TimerHandle] = None
+
+    # Maximum number of commands in flight (sent, awaiting a response) per module, eg. `{"C0": 1}`.
+    # Commands for a module that has reached its limit are sent, in order, as soon as a command for
+    # that module completes. Modules that are not in this dict use `default_max_in_flight`, where
+    # `None` means no limit.
+    self.max_in_flight: Dict[str, int] = {}
+    self.default_max_in_flight: Optional[int] = None
+    self._in_flight: Dict[str, int] = collections.defaultdict(int)
+    self._backlog: Dict[str, Deque[HamiltonTask]] = collections.defaultdict(collections.deque)
     self._tth2tti: dict[int, int] = {}  # hash to tip type index
 
     # Whether to allow the firmware to plan liquid handling operations when the y positions are
@@ -98,9 +144,15 @@ class HamiltonLiquidHandler(LiquidHandlerBackend, USBBackend, metaclass=ABCMeta)
     await USBBackend.setup(self)
 
   async def stop(self):
-    for task in self._waiting_tasks:
-      task.fut.set_exception(RuntimeError("Stopping HamiltonLiquidHandler."))
-    self._waiting_tasks.clear()
+    with self._waiting_tasks_lock:
+      tasks = list(self._waiting_tasks.values()) + self._waiting_tasks_without_id
+      tasks += [task for backlog in self._backlog.values() for task in backlog]
+      self._waiting_tasks, self._waiting_tasks_without_id = {}, []
+    self._backlog.clear()
+    for task in tasks:
+      task.loop.call_soon_threadsafe(
+        _set_exception_if_pending, task.fut, RuntimeError("Stopping HamiltonLiquidHandler.")
+      )
     await super().stop()
 
   def serialize(self) -> dict:
@@ -116,8 +168,10 @@ class HamiltonLiquidHandler(LiquidHandlerBackend, USBBackend, metaclass=ABCMeta)
     """The length of the module identifier in firmware commands."""
 
   def _generate_id(self) -> int:
-    """continuously generate unique ids 0 <= x < 10000."""
+    """continuously generate unique ids 0 <= x < 10000, skipping ids of commands in flight."""
     self.id_ += 1
+    while self.id_ % 10000 in self._waiting_tasks:
+      self.id_ += 1
     return self.id_ % 10000
 
   def _to_list(self, val: List[T], tip_pattern: List[bool]) -> List[T]:
@@ -257,6 +311,48 @@ class HamiltonLiquidHandler(LiquidHandlerBackend, USBBackend, metaclass=ABCMeta)
       return self._parse_response(resp, fmt)
     return resp
 
+  def submit_command(
+    self,
+    module: str,
+    command: str,
+    auto_id=True,
+    tip_pattern: Optional[List[bool]] = None,
+    write_timeout: Optional[int] = None,
+    read_timeout: Optional[int] = None,
+    fmt: Optional[Any] = None,
+    **kwargs,
+  ) -> "asyncio.Task":
+    """Submit a firmware command without waiting for the response, so that multiple independent
+    commands can be in flight at once. Submitted commands are sent in the order they are
+    submitted, subject to :attr:`max_in_flight`.
+
+    Examples:
+      Poll the temperature of a heater shaker while the channels move:
+
+      >>> move = star.submit_command("C0", "JM", ...)
+      >>> while not move.done():
+      ...   await star.get_temperature_at_hhs(1)
+      >>> await move
+
+    Args: see :meth:`send_command`.
+
+    Returns:
+      A task that completes with the (parsed) response.
+    """
+
+    return asyncio.ensure_future(
+      self.send_command(
+        module=module,
+        command=command,
+        auto_id=auto_id,
+        tip_pattern=tip_pattern,
+        write_timeout=write_timeout,
+        read_timeout=read_timeout,
+        fmt=fmt,
+        **kwargs,
+      )
+    )
+
   async def _write_and_read_command(
     self,
     id_: Optional[int],
@@ -266,40 +362,108 @@ class HamiltonLiquidHandler(LiquidHandlerBackend, USBBackend, metaclass=ABCMeta)
     wait: bool = True,
   ) -> Optional[str]:
     """Write a command to the Hamilton machine and read the response."""
-    self.write(cmd, timeout=write_timeout)
 
     if not wait:
+      await self.write_async(cmd, timeout=write_timeout)
       return None
 
-    # Attempt to read packets until timeout, or when we identify the right id.
-    if read_timeout is None:
-      read_timeout = self.read_timeout
+    loop = asyncio.get_running_loop()
+    task = HamiltonTask(
+      id_=id_,
+      loop=loop,
+      fut=loop.create_future(),
+      cmd=cmd,
+      timeout_time=float("inf"),
+      module=cmd[: self.module_id_length],
+      read_timeout=read_timeout if read_timeout is not None else self.read_timeout,
+      write_timeout=write_timeout if write_timeout is not None else self.write_timeout,
+    )
+    task.fut.add_done_callback(functools.partial(self._task_done, task))
 
-    loop = asyncio.get_event_loop()
-    fut = loop.create_future()
-    self._start_reading(id_, loop, fut, cmd, read_timeout)
-    result = await fut
+    limit = self.max_in_flight.get(task.module, self.default_max_in_flight)
+    if limit is None or self._in_flight[task.module] < limit:
+      self._send_task(task)
+    else:
+      self._backlog[task.module].append(task)
+
+    result = await task.fut
     return cast(str, result)  # Futures are generic in Python 3.9, but not in 3.8, so we need cast.
 
-  def _start_reading(
-    self,
-    id_: Optional[int],
-    loop: asyncio.AbstractEventLoop,
-    fut: asyncio.Future,
-    cmd: str,
-    timeout: int,
-  ) -> None:
-    """Submit a task to the reading thread. Starts reading thread if it is not already running."""
+  def _send_task(self, task: HamiltonTask) -> None:
+    """Register a task, start its timeout and write its command. Called on the event loop."""
 
-    timeout_time = time.time() + timeout
-    self._waiting_tasks.append(
-      HamiltonTask(id_=id_, loop=loop, fut=fut, cmd=cmd, timeout_time=timeout_time)
-    )
+    task.sent = True
+    task.timeout_time = time.time() + task.read_timeout
+    self._in_flight[task.module] += 1
 
-    # Start reading thread if it is not already running.
-    if len(self._waiting_tasks) == 1:
-      self._reading_thread = threading.Thread(target=self._continuously_read)
-      self._reading_thread.start()
+    # Register the task before writing, so that a fast response can not be missed.
+    with self._waiting_tasks_lock:
+      if task.id_ is None:
+        self._waiting_tasks_without_id.append(task)
+      else:
+        self._waiting_tasks[task.id_] = task
+
+    heapq.heappush(self._deadlines, (task.timeout_time, next(self._deadline_counter), task))
+    if self._timeout_handle is None or self._deadlines[0][2] is task:
+      self._schedule_timeout_check(task.loop)
+
+    # Don't wait for the write to complete: the response can only arrive after it has, and if the
+    # write fails, the error is passed on to the task's future.
+    write_fut = self._get_transport().submit_write(task.cmd, timeout=task.write_timeout)
+    write_fut.add_done_callback(functools.partial(_fail_task_if_write_failed, task))
+
+  def _task_done(self, task: HamiltonTask, _: asyncio.Future) -> None:
+    """Clean up after a task completed, failed, timed out or was cancelled, and send the next
+    commands for its module. Called on the event loop."""
+
+    if not task.sent:  # cancelled while waiting in the backlog
+      if task in self._backlog[task.module]:
+        self._backlog[task.module].remove(task)
+      return
+
+    with self._waiting_tasks_lock:
+      if task.id_ is None:
+        if task in self._waiting_tasks_without_id:
+          self._waiting_tasks_without_id.remove(task)
+      elif self._waiting_tasks.get(task.id_) is task:
+        del self._waiting_tasks[task.id_]
+      num_waiting = len(self._waiting_tasks) + len(self._waiting_tasks_without_id)
+
+    # Deadlines of completed tasks are removed lazily. Compact the heap if most are stale.
+    if len(self._deadlines) > 64 and len(self._deadlines) > 2 * num_waiting:
+      self._deadlines = [d for d in self._deadlines if not d[2].fut.done()]
+      heapq.heapify(self._deadlines)
+
+    self._in_flight[task.module] -= 1
+    backlog = self._backlog[task.module]
+    limit = self.max_in_flight.get(task.module, self.default_max_in_flight)
+    while len(backlog) > 0 and (limit is None or self._in_flight[task.module] < limit):
+      next_task = backlog.popleft()
+      if not next_task.fut.done():
+        self._send_task(next_task)
+
+  def _schedule_timeout_check(self, loop: asyncio.AbstractEventLoop) -> None:
+    if self._timeout_handle is not None:
+      self._timeout_handle.cancel()
+    delay = max(0.0, self._deadlines[0][0] - time.time())
+    self._timeout_handle = loop.call_later(delay, self._check_timeouts, loop)
+
+  def _check_timeouts(self, loop: asyncio.AbstractEventLoop) -> None:
+    """Fail all tasks whose deadline has passed, and schedule the next check."""
+
+    self._timeout_handle = None
+    now = time.time()
+    while len(self._deadlines) > 0 and self._deadlines[0][0] <= now:
+      _, _, task = heapq.heappop(self._deadlines)
+      if not task.fut.done():
+        logger.warning("Timeout while waiting for response to command %s.", task.cmd)
+        task.fut.set_exception(
+          TimeoutError(f"Timeout while waiting for response to command {task.cmd}.")
+        )
+    while len(self._deadlines) > 0 and self._deadlines[0][2].fut.done():
+      heapq.heappop(self._deadlines)
+    if len(self._deadlines) > 0:
+      self._schedule_timeout_check(loop)
 
   @abstractmethod
   def get_id_from_fw_response(self, resp: str) -> Optional[int]:
@@ -313,67 +477,45 @@ class HamiltonLiquidHandler(LiquidHandlerBackend, USBBackend, metaclass=ABCMeta)
   def _parse_response(self, resp: str, fmt: Any) -> dict:
     """Parse a firmware response."""
 
-  def _continuously_read(self) -> None:
-    """Continuously read from the USB port until all tasks are completed.
-
-    Tasks are stored in the `self._waiting_tasks` list, and contain a future that will be
-    completed when the task is finished. Tasks are submitted to the list using the
-    `self._start_reading` method.
+  def _message_received(self, data: bytearray) -> None:
+    """Match a response from the machine to the task waiting for it, and complete its future.
 
-    On each iteration, read the USB port. If a response is received, parse it and check if it is
-    relevant to any of the tasks. If so, complete the future and remove the task from the
-    list. If a task has timed out, complete the future with a `TimeoutError`.
+    This is called on the USB reader thread as soon as a response arrives. Tasks are submitted to
+    `self._waiting_tasks` by :meth:`_write_and_read_command`. Responses that do not match any task
+    are dropped.
     """
 
-    logger.debug("Starting reading thread...")
+    resp = data.decode("utf-8")
+    if resp == "":
+      return
 
-    while len(self._waiting_tasks) > 0:
-      for idx in range(len(self._waiting_tasks) - 1, -1, -1):  # reverse order to allow deletion
-        task = self._waiting_tasks[idx]
-        if time.time() > task.timeout_time:
-          logger.warning("Timeout while waiting for response to command %s.", task.cmd)
-          task.loop.call_soon_threadsafe(
-            task.fut.set_exception,
-            TimeoutError(f"Timeout while waiting for response to command {task.cmd}."),
-          )
-          del self._waiting_tasks[idx]
-          break
-
-      try:
-        resp = self.read().decode("utf-8")
-      except TimeoutError:
-        continue
-
-      if resp == "":
-        continue
+    logger.debug("Received response: %s", resp)
 
-      logger.debug("Received response: %s", resp)
+    # Parse response.
+    try:
+      response_id = self.get_id_from_fw_response(resp)
+    except ValueError as e:
+      logger.warning("Could not parse response: %s (%s)", resp, e)
+      return
 
-      # Parse response.
-      try:
-        response_id = self.get_id_from_fw_response(resp)
-      except ValueError as e:
-        logger.warning("Could not parse response: %s (%s)", resp, e)
-        continue
-
-      module_and_command = resp[: self.module_id_length + 2]
-      for idx in range(len(self._waiting_tasks)):
-        task = self._waiting_tasks[idx]
+    module_and_command = resp[: self.module_id_length + 2]
+    with self._waiting_tasks_lock:
+      task = self._waiting_tasks.pop(response_id, None) if response_id is not None else None
+      if task is None:
         # if the command has no id, we have to check the command itself
-        if response_id == task.id_ or (
-          task.id_ is None and task.cmd.startswith(module_and_command)
-        ):
-          try:
-            self.check_fw_string_error(resp)
-          except Exception as e:
-            task.loop.call_soon_threadsafe(task.fut.set_exception, e)
-          else:
-            task.loop.call_soon_threadsafe(task.fut.set_result, resp)
-          del self._waiting_tasks[idx]
-          break
-
-    self._reading_thread = None
-    logger.debug("Reading thread stopped.")
+        for idx, task_without_id in enumerate(self._waiting_tasks_without_id):
+          if task_without_id.cmd.startswith(module_and_command):
+            task = self._waiting_tasks_without_id.pop(idx)
+            break
+        else:
+          return
+
+    try:
+      self.check_fw_string_error(resp)
+    except Exception as e:
+      task.loop.call_soon_threadsafe(_set_exception_if_pending, task.fut, e)
+    else:
+      task.loop.call_soon_threadsafe(_set_result_if_pending, task.fut, resp)
 
   def _ops_to_fw_positions(
     self, ops: Sequence[PipettingOp], use_channels: List[int]
@@ -1,8 +1,9 @@
 import asyncio
+import functools
 import random
 import re
 import sys
-from typing import Dict, List, Optional, Sequence, Union, cast
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple, Union, cast
 
 from pylabrobot.liquid_handling.backends.hamilton.base import (
   HamiltonLiquidHandler,
@@ -66,44 +67,55 @@ def parse_vantage_fw_string(s: str, fmt: Optional[Dict[str, str]] = None) -> dic
     {"es": "error string"}
   """
 
-  parsed: dict = {}
-
   if fmt is None:
     fmt = {}
 
   if not isinstance(fmt, dict):
     raise TypeError(f"invalid fmt for fmt: expected dict, got {type(fmt)}")
 
-  if "id" not in fmt:
-    fmt["id"] = "int"
-
-  for key, data_type in fmt.items():
+  parsed: dict = {}
+  for key, data_type, pattern in _compile_vantage_fw_fmt(tuple(fmt.items())):
+    matches = pattern.findall(s)
+    if len(matches) != 1:
+      raise ValueError(f"Expected exactly one match for {key} in {s}")
     if data_type == "int":
-      matches = re.findall(rf"{key}([-+]?\d+)", s)
-      if len(matches) != 1:
-        raise ValueError(f"Expected exactly one match for {key} in {s}")
       parsed[key] = int(matches[0])
     elif data_type == "str":
-      matches = re.findall(rf"{key}\"(.*)\"", s)
-      if len(matches) != 1:
-        raise ValueError(f"Expected exactly one match for {key} in {s}")
       parsed[key] = matches[0]
     elif data_type == "[int]":
-      matches = re.findall(rf"{key}((?:[-+]?[\d ]+)+)", s)
-      if len(matches) != 1:
-        raise ValueError(f"Expected exactly one match for {key} in {s}")
       parsed[key] = [int(x) for x in matches[0].split()]
     elif data_type == "hex":
-      matches = re.findall(rf"{key}([0-9a-fA-F]+)", s)
-      if len(matches) != 1:
-        raise ValueError(f"Expected exactly one match for {key} in {s}")
       parsed[key] = int(matches[0], 16)
-    else:
-      raise ValueError(f"Unknown data type {data_type}")
 
   return parsed
 
 
+_VANTAGE_FW_TYPE_REGEXES = {
+  "int": r"([-+]?\d+)",
+  "str": r"\"(.*)\"",
+  "[int]": r"((?:[-+]?[\d ]+)+)",
+  "hex": r"([0-9a-fA-F]+)",
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_vantage_fw_fmt(
+  fmt: Tuple[Tuple[str, str], ...],
+) -> Tuple[Tuple[str, str, Pattern[str]], ...]:
+  """Compile the items of a `fmt` for :func:`parse_vantage_fw_string` into one regex per key. The
+  identifier parameter is added if it is not in `fmt`."""
+
+  if "id" not in dict(fmt):
+    fmt = fmt + (("id", "int"),)
+
+  compiled = []
+  for key, data_type in fmt:
+    if data_type not in _VANTAGE_FW_TYPE_REGEXES:
+      raise ValueError(f"Unknown data type {data_type}")
+    compiled.append((key, data_type, re.compile(key + _VANTAGE_FW_TYPE_REGEXES[data_type])))
+  return tuple(compiled)
+
+
 core96_errors = {
   0: "No error",
   21: "No communication to digital potentiometer",
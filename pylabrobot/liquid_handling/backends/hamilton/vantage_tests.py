@@ -157,6 +157,14 @@ class TestVantageResponseParsing(unittest.TestCase):
     with self.assertRaises(ValueError):
       parse_vantage_fw_string("A1PMDA", {"id": "int"})
 
+  def test_parse_response_does_not_modify_fmt(self):
+    fmt = {"rw": "int"}
+    parse_vantage_fw_string("A1PMDAid1112rw-21", fmt)
+    self.assertEqual(fmt, {"rw": "int"})
+
+    with self.assertRaises(ValueError):
+      parse_vantage_fw_string("A1PMDAid1112rw-21", {"rw": "float"})
+
   def test_parse_error_response(self):
     resp = 'I1AMRQid0000er4et"Slave not available"'
     error = vantage_response_string_to_error(resp)
@@ -151,11 +151,11 @@ class TecanLiquidHandler(LiquidHandlerBackend, USBBackend, metaclass=ABCMeta):
 
     cmd = self._assemble_command(module, command, [] if params is None else params)
 
-    self.write(cmd, timeout=write_timeout)
+    await self.write_async(cmd, timeout=write_timeout)
     if not wait:
       return None
 
-    resp = self.read(timeout=read_timeout)
+    resp = await self.read_async(timeout=read_timeout)
     return self.parse_response(resp)
 
   async def setup(self):
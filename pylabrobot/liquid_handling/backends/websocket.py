@@ -1,9 +1,10 @@
 import asyncio
+import collections
 import json
 import logging
 import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, Tuple
 
 try:
   import websockets
@@ -21,6 +22,7 @@ from pylabrobot.liquid_handling.backends.serializing_backend import (
   SerializingBackend,
 )
 from pylabrobot.resources import Resource
+from pylabrobot.utils import json_codec
 
 if TYPE_CHECKING:
   import websockets.legacy
@@ -37,6 +39,9 @@ class WebSocketBackend(SerializingBackend):
     num_channels: int,
     ws_host: str = "127.0.0.1",
     ws_port: int = 2121,
+    replay_buffer_size: Optional[int] = 10_000,
+    max_pending_sends: int = 1000,
+    backpressure: Literal["block", "raise"] = "block",
   ):
     """Create a new web socket backend.
 
@@ -44,6 +49,15 @@ class WebSocketBackend(SerializingBackend):
       ws_host: The hostname of the websocket server.
       ws_port: The port of the websocket server. If this port is in use, the port will be
         incremented until a free port is found.
+      replay_buffer_size: The maximum number of sent events that are replayed when a browser
+        connects. When the buffer is full, the oldest events are dropped, except for the
+        assignments of resources that are still assigned, so the buffer can hold more events if
+        there are many of those. A resource that is assigned and unassigned again before any other
+        event is removed from the buffer. `None` means no limit.
+      max_pending_sends: The maximum number of events waiting to be sent to a browser that is slow
+        to receive them.
+      backpressure: What :meth:`send_command` does when `max_pending_sends` events are waiting:
+        `"block"` waits until there is room, `"raise"` raises an `asyncio.QueueFull` error.
     """
 
     if not HAS_WEBSOCKETS:
@@ -58,7 +72,32 @@ class WebSocketBackend(SerializingBackend):
     self.ws_host = ws_host
     self.ws_port = ws_port
 
-    self._sent_messages: List[str] = []
+    # Events to replay when a browser connects, by sequence number. Accessed from the thread that
+    # calls `send_command` and from the event loop thread, so guarded by a lock.
+    self.replay_buffer_size = replay_buffer_size
+    self._replay_buffer: "collections.OrderedDict[int, str]" = collections.OrderedDict()
+    self._replay_seq = 0
+    self._replay_lock = threading.Lock()
+    # Assignments in the replay buffer that can still be removed by unassigning the resource: name
+    # of the assigned resource -> (sequence number, names of all resources in its subtree).
+    self._removable_assignments: Dict[str, Tuple[int, Set[str]]] = {}
+    # Names of all resources in assignments recorded in the replay buffer.
+    self._assigned_names: Set[str] = set()
+    # Assignments in the replay buffer of resources that are still assigned, which are not dropped
+    # when the buffer is full: name of the assigned resource -> (sequence number, parent name, names
+    # of all resources in its subtree).
+    self._live_assignments: Dict[str, Tuple[int, Optional[str], Set[str]]] = {}
+    self._live_assignment_seqs: Set[int] = set()
+
+    # Events waiting to be sent by the sender task, and futures of commands waiting for a response,
+    # by id. Both are only accessed on the event loop.
+    self.max_pending_sends = max_pending_sends
+    self.backpressure = backpressure
+    self._outbox: Optional[asyncio.Queue] = None
+    self._outbox_has_room: Optional[asyncio.Event] = None
+    self._sender: Optional[asyncio.Task] = None
+    self._waiting_for_response: Dict[str, asyncio.Future] = {}
+
     self.received: List[dict] = []
 
     self._id = 0
@@ -123,20 +162,29 @@ class WebSocketBackend(SerializingBackend):
       try:
         message = await websocket.recv()
       except websockets.exceptions.ConnectionClosed:
+        self._connection_closed(websocket)
         return
       except asyncio.CancelledError:
         return
 
-      data = json.loads(message)
+      data = json_codec.loads(message)
+
+      # Responses are passed to the command waiting for them.
+      future = self._waiting_for_response.pop(data.get("id"), None)  # type: ignore[arg-type]
+      if future is not None:
+        if not future.done():
+          future.set_result(data)
+        continue
       self.received.append(data)
 
       # If the event is "ready", then we can save the connection and send the saved messages.
       if data.get("event") == "ready":
         self._websocket = websocket
+        self._start_sender(websocket)
         await self._replay()
 
         # Echo command
-        await websocket.send(json.dumps(data))
+        self.outbox.put_nowait(json_codec.dumps(data))
 
       if "event" in data:
         await self.handle_event(data.get("event"), data)
@@ -152,7 +200,7 @@ class WebSocketBackend(SerializingBackend):
       "version": STANDARD_FORM_JSON_VERSION,
       **data,
     }
-    return json.dumps(command_data), id_
+    return json_codec.dumps(command_data), id_
 
   def has_connection(self) -> bool:
     """Return `True` if a websocket connection has been established."""
@@ -170,6 +218,183 @@ class WebSocketBackend(SerializingBackend):
     while not self.has_connection():
       time.sleep(0.1)
 
+  @property
+  def outbox(self) -> asyncio.Queue:
+    """The queue of events waiting to be sent by the sender task."""
+    if self._outbox is None:
+      raise RuntimeError("Event loop has not been started.")
+    return self._outbox
+
+  def _start_sender(self, websocket: "websockets.legacy.server.WebSocketServerProtocol"):
+    """Start sending the events in the outbox to a newly connected browser. Events that were not
+    sent to a previous connection are dropped, because they are replayed."""
+
+    if self._sender is not None:
+      self._sender.cancel()
+    while not self.outbox.empty():
+      self.outbox.get_nowait()
+      self.outbox.task_done()
+    assert self._outbox_has_room is not None
+    self._outbox_has_room.set()
+    self._sender = self.loop.create_task(self._send_outbox(websocket))
+
+  def _connection_closed(self, websocket: "websockets.legacy.server.WebSocketServerProtocol"):
+    """Forget the connection to a browser that disconnected, so that events are only recorded until
+    a browser connects again and the protocol does not wait for it. Runs on the event loop."""
+
+    if self._websocket is not websocket:
+      return  # a browser has connected since
+    self._websocket = None
+    if self._sender is not None:
+      self._sender.cancel()
+      self._sender = None
+    # The events in the outbox are replayed when a browser connects.
+    while not self.outbox.empty():
+      self.outbox.get_nowait()
+      self.outbox.task_done()
+    assert self._outbox_has_room is not None
+    self._outbox_has_room.set()
+    for future in self._waiting_for_response.values():
+      if not future.done():
+        future.set_exception(RuntimeError("The browser disconnected."))
+    self._waiting_for_response.clear()
+
+  async def _send_outbox(self, websocket: "websockets.legacy.server.WebSocketServerProtocol"):
+    """Send events in the outbox one at a time. `websocket.send` waits while the browser is slow to
+    receive, so the outbox grows, and :meth:`send_command` applies backpressure."""
+
+    while True:
+      message = await self.outbox.get()
+      try:
+        await websocket.send(message)
+      except websockets.exceptions.ConnectionClosed:
+        self.outbox.task_done()
+        self._connection_closed(websocket)
+        return
+      self.outbox.task_done()
+      if self.outbox.qsize() < self.max_pending_sends:
+        assert self._outbox_has_room is not None
+        self._outbox_has_room.set()
+
+  async def _enqueue(
+    self,
+    command: str,
+    data: Dict[str, Any],
+    message: str,
+    id_: Optional[str],
+  ) -> Optional[dict]:
+    """Put an event in the outbox, applying backpressure, record it for replay, and wait for the
+    response if `id_` is given. If the browser has disconnected, the event is only recorded. Runs on
+    the event loop."""
+
+    assert self._outbox_has_room is not None
+    while self._websocket is not None and self.outbox.qsize() >= self.max_pending_sends:
+      if self.backpressure == "raise":
+        raise asyncio.QueueFull(
+          f"{self.outbox.qsize()} events are waiting to be sent to the browser."
+        )
+      self._outbox_has_room.clear()
+      await self._outbox_has_room.wait()
+
+    if self._websocket is None:
+      if id_ is not None:
+        raise RuntimeError(f"Cannot wait for response to {command}, the browser disconnected.")
+      self._record(command, data, message)
+      return None
+
+    self.outbox.put_nowait(message)
+    self._record(command, data, message)
+    if id_ is None:
+      return None
+
+    future = self.loop.create_future()
+    self._waiting_for_response[id_] = future
+    try:
+      return await future  # type: ignore[no-any-return]
+    finally:
+      self._waiting_for_response.pop(id_, None)
+
+  def _record(self, command: str, data: Dict[str, Any], message: str):
+    """Add a sent event to the replay buffer, removing redundant resource events."""
+
+    with self._replay_lock:
+      if command == "resource_unassigned":
+        name = data["resource_name"]
+        if name in self._removable_assignments:
+          # The resource was never used: forget both the assignment and the unassignment.
+          seq, _ = self._removable_assignments.pop(name)
+          self._replay_buffer.pop(seq, None)
+          self._end_live_assignments(name)
+          return
+        self._pin_assignments_containing(name)
+        self._end_live_assignments(name)
+      elif command == "resource_assigned":
+        if data["parent_name"] is not None:
+          self._pin_assignments_containing(data["parent_name"])
+        # Earlier assignments of resources in the new subtree are drawn again by the browser when it
+        # replays this one, so their unassignments must be replayed too.
+        names = _resource_names(data["resource"])
+        for root in names & self._removable_assignments.keys():
+          del self._removable_assignments[root]
+      else:
+        # Other events may refer to any resource, so the current assignments are final.
+        self._removable_assignments.clear()
+
+      self._replay_seq += 1
+      self._replay_buffer[self._replay_seq] = message
+      if command == "resource_assigned":
+        # Resources that are part of an earlier recorded subtree are drawn by replaying that
+        # assignment, so removing only this assignment would not remove them.
+        if self._assigned_names.isdisjoint(names):
+          self._removable_assignments[data["resource"]["name"]] = (self._replay_seq, names)
+        self._assigned_names.update(names)
+        self._end_live_assignments(data["resource"]["name"])
+        self._live_assignments[data["resource"]["name"]] = (
+          self._replay_seq,
+          data["parent_name"],
+          names,
+        )
+        self._live_assignment_seqs.add(self._replay_seq)
+
+      if self.replay_buffer_size is not None:
+        while len(self._replay_buffer) > self.replay_buffer_size:
+          # Drop the oldest event that is not the assignment of a resource that is still assigned,
+          # because later events refer to those resources.
+          oldest = next(
+            (seq for seq in self._replay_buffer if seq not in self._live_assignment_seqs), None
+          )
+          if oldest is None:
+            break
+          del self._replay_buffer[oldest]
+          logger.warning("Replay buffer is full, dropping the oldest event.")
+
+  def _end_live_assignments(self, name: str):
+    """Forget the assignments of the resource `name` and of resources assigned into its subtree,
+    because the resource is unassigned."""
+
+    if name not in self._live_assignments:
+      return
+    seq, _, subtree = self._live_assignments.pop(name)
+    self._live_assignment_seqs.discard(seq)
+    subtree = set(subtree)
+    ended = True
+    while ended:
+      ended = False
+      for root, (seq, parent_name, names) in list(self._live_assignments.items()):
+        if parent_name in subtree:
+          del self._live_assignments[root]
+          self._live_assignment_seqs.discard(seq)
+          subtree.update(names)
+          ended = True
+
+  def _pin_assignments_containing(self, name: str):
+    """Make assignments of subtrees containing the resource `name` final, because a later event
+    refers to the resource."""
+
+    for root, (_, names) in list(self._removable_assignments.items()):
+      if name in names:
+        del self._removable_assignments[root]
+
   async def assigned_resource_callback(self, resource: Resource):
     # override SerializingBackend so we don't wait for a response
     await self.send_command(
@@ -185,7 +410,8 @@ class WebSocketBackend(SerializingBackend):
     # override SerializingBackend so we don't wait for a response
     await self.send_command(
       command="resource_unassigned",
-      data={"resource_name": name, "wait_for_response": False},
+      data={"resource_name": name},
+      wait_for_response=False,
     )
 
   async def send_command(
@@ -215,23 +441,24 @@ class WebSocketBackend(SerializingBackend):
       data = {}
 
     serialized_data, id_ = self._assemble_command(command, data)
-    self._sent_messages.append(serialized_data)
 
     # Run and save if the websocket connection has been established, otherwise just save.
     if wait_for_response and not self.has_connection():
       raise ValueError("Cannot wait for response when no websocket connection is established.")
 
-    if self.has_connection():
-      asyncio.run_coroutine_threadsafe(self.websocket.send(serialized_data), self.loop)
+    if not self.has_connection():
+      self._record(command, data, serialized_data)
+    else:
+      # The event loop of the server runs in another thread. The response is awaited without
+      # blocking the event loop of the caller.
+      future = asyncio.run_coroutine_threadsafe(
+        self._enqueue(command, data, serialized_data, id_ if wait_for_response else None),
+        self.loop,
+      )
+      message = await asyncio.wrap_future(future)
 
       if wait_for_response:
-        while True:
-          if len(self.received) > 0:
-            message = self.received.pop()
-            if "id" in message and message["id"] == id_:
-              break
-          time.sleep(0.1)
-
+        assert message is not None
         if not message["success"]:
           error = message.get("error", "unknown error")
           raise RuntimeError(f"Error during event {command}: " + error)
@@ -241,13 +468,15 @@ class WebSocketBackend(SerializingBackend):
     return None
 
   async def _replay(self):
-    """Send all sent messages.
+    """Send all events in the replay buffer.
 
     This is called when the websocket connection is established.
     """
 
-    for message in self._sent_messages:
-      asyncio.run_coroutine_threadsafe(self.websocket.send(message), self.loop)
+    with self._replay_lock:
+      messages = list(self._replay_buffer.values())
+    for message in messages:
+      self.outbox.put_nowait(message)
 
   async def setup(self):
     """Start the websocket server. This will run in a separate thread."""
@@ -257,6 +486,8 @@ class WebSocketBackend(SerializingBackend):
 
     async def run_server():
       self._stop_ = self.loop.create_future()
+      self._outbox = asyncio.Queue()
+      self._outbox_has_room = asyncio.Event()
       while True:
         try:
           async with websockets.server.serve(self._socket_handler, self.ws_host, self.ws_port):
@@ -292,13 +523,55 @@ class WebSocketBackend(SerializingBackend):
       # send stop event to the browser
       await self.send_command("stop", wait_for_response=False)
 
+      # Give the browser a moment to receive the events that have not been sent yet.
+      try:
+        await asyncio.wait_for(
+          asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.outbox.join(), self.loop)),
+          timeout=1,
+        )
+      except asyncio.TimeoutError:
+        logger.warning("Stopping with events that were not sent to the browser.")
+
+    if self._loop is not None:
       # must be thread safe, because event loop is running in a separate thread
-      self.loop.call_soon_threadsafe(self.stop_.set_result, "done")
+      self.loop.call_soon_threadsafe(self._stop_loop)
 
     # Clear all relevant attributes.
-    self._sent_messages.clear()
+    with self._replay_lock:
+      self._replay_buffer.clear()
+      self._removable_assignments.clear()
+      self._assigned_names.clear()
+      self._live_assignments.clear()
+      self._live_assignment_seqs.clear()
     self.received.clear()
     self._websocket = None
     self._loop = None
     self._t = None
     self._stop_ = None
+    self._outbox = None
+    self._outbox_has_room = None
+    self._sender = None
+
+  def _stop_loop(self):
+    """Stop the server and fail commands that are waiting for a response. Runs on the event loop."""
+
+    if self._sender is not None:
+      self._sender.cancel()
+    for future in self._waiting_for_response.values():
+      if not future.done():
+        future.set_exception(RuntimeError("The websocket backend was stopped."))
+    self._waiting_for_response.clear()
+    if not self.stop_.done():
+      self.stop_.set_result("done")
+
+
+def _resource_names(serialized_resource: dict) -> Set[str]:
+  """The names of a serialized resource and all its children."""
+
+  names = set()
+  stack = [serialized_resource]
+  while len(stack) > 0:
+    resource = stack.pop()
+    names.add(resource["name"])
+    stack.extend(resource.get("children", []))
+  return names
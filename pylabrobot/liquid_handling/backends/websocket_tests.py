@@ -1,11 +1,15 @@
+import asyncio
 import json
+import time
 import unittest
+from typing import List
 
 import pytest
 import websockets
 import websockets.client
 
 from pylabrobot.liquid_handling.backends import WebSocketBackend
+from pylabrobot.resources import Coordinate, Resource
 
 
 class WebSocketBackendSetupStopTests(unittest.IsolatedAsyncioTestCase):
@@ -49,14 +53,221 @@ class WebSocketBackendServerTests(unittest.IsolatedAsyncioTestCase):
   async def test_connect(self):
     await self.client.send('{"event": "ready"}')
     response = await self.client.recv()
-    self.assertEqual(response, '{"event": "ready"}')
+    self.assertEqual(json.loads(response), {"event": "ready"})
 
   async def test_event_sent(self):
     await self.client.send('{"event": "ready"}')
     response = await self.client.recv()
-    self.assertEqual(response, '{"event": "ready"}')
+    self.assertEqual(json.loads(response), {"event": "ready"})
 
     await self.backend.send_command("test", wait_for_response=False)
     recv = await self.client.recv()
     data = json.loads(recv)
     self.assertEqual(data["event"], "test")
+
+  async def _respond(self, num_commands: int):
+    """Answer the next `num_commands` commands like the browser does."""
+    for _ in range(num_commands):
+      data = json.loads(await self.client.recv())
+      await self.client.send(json.dumps({"id": data["id"], "success": True}))
+
+  async def test_round_trip_latency(self):
+    await self.client.send('{"event": "ready"}')
+    await self.client.recv()
+
+    num_commands = 20
+    responder = asyncio.create_task(self._respond(num_commands))
+    start = time.monotonic()
+    for _ in range(num_commands):
+      response = await self.backend.send_command("test", wait_for_response=True)
+      assert response is not None
+      self.assertTrue(response["success"])
+    mean_latency = (time.monotonic() - start) / num_commands
+    await responder
+
+    # Responses used to be polled every 100 ms.
+    self.assertLess(mean_latency, 0.05)
+    self.assertEqual(self.backend.received, [{"event": "ready"}])
+
+  async def test_concurrent_commands(self):
+    await self.client.send('{"event": "ready"}')
+    await self.client.recv()
+
+    responder = asyncio.create_task(self._respond(5))
+    responses = await asyncio.gather(
+      *(self.backend.send_command("test", data={"i": i}) for i in range(5))
+    )
+    await responder
+    self.assertEqual(len({response["id"] for response in responses}), 5)  # type: ignore[index]
+
+  async def test_failed_command(self):
+    await self.client.send('{"event": "ready"}')
+    await self.client.recv()
+
+    async def respond():
+      data = json.loads(await self.client.recv())
+      await self.client.send(json.dumps({"id": data["id"], "success": False, "error": "oops"}))
+
+    responder = asyncio.create_task(respond())
+    with self.assertRaises(RuntimeError):
+      await self.backend.send_command("test")
+    await responder
+
+
+class WebSocketBackendReplayTests(unittest.IsolatedAsyncioTestCase):
+  """Tests for replaying events to a browser that connects late."""
+
+  async def asyncSetUp(self):
+    await super().asyncSetUp()
+    self.backend = WebSocketBackend(num_channels=8, replay_buffer_size=5)
+    await self.backend.setup()
+
+  async def asyncTearDown(self):
+    await super().asyncTearDown()
+    await self.backend.stop()
+
+  async def _replayed_events(self) -> List[dict]:
+    async with websockets.client.connect(f"ws://localhost:{self.backend.ws_port}") as client:
+      await client.send('{"event": "ready"}')
+      events = []
+      while True:
+        data = json.loads(await client.recv())
+        if data.get("event") == "ready":
+          return events
+        events.append(data)
+
+  async def test_replay(self):
+    for i in range(3):
+      await self.backend.send_command("test", data={"i": i}, wait_for_response=False)
+    events = await self._replayed_events()
+    self.assertEqual([event["i"] for event in events], [0, 1, 2])
+
+  async def test_bounded(self):
+    for i in range(8):
+      await self.backend.send_command("test", data={"i": i}, wait_for_response=False)
+    events = await self._replayed_events()
+    self.assertEqual([event["i"] for event in events], [3, 4, 5, 6, 7])
+
+  async def test_compact_assign_unassign(self):
+    deck = Resource("deck", size_x=100, size_y=100, size_z=10)
+    plate = Resource("plate", size_x=10, size_y=10, size_z=10)
+    plate.assign_child_resource(
+      Resource("well", size_x=1, size_y=1, size_z=1), location=Coordinate.zero()
+    )
+    tips = Resource("tips", size_x=10, size_y=10, size_z=10)
+    deck.assign_child_resource(plate, location=Coordinate.zero())
+    deck.assign_child_resource(tips, location=Coordinate.zero())
+
+    await self.backend.assigned_resource_callback(deck)
+    await self.backend.assigned_resource_callback(plate)
+    await self.backend.assigned_resource_callback(tips)
+    await self.backend.unassigned_resource_callback("well")  # inside plate: plate is kept
+    await self.backend.unassigned_resource_callback("tips")  # inside the deck snapshot: kept
+
+    events = await self._replayed_events()
+    self.assertEqual(
+      [(event["event"], event.get("resource", {}).get("name")) for event in events],
+      [
+        ("resource_assigned", "deck"),
+        ("resource_assigned", "plate"),
+        ("resource_assigned", "tips"),
+        ("resource_unassigned", None),
+        ("resource_unassigned", None),
+      ],
+    )
+
+  async def test_compact_unused_assignment(self):
+    await self.backend.assigned_resource_callback(Resource("r", size_x=1, size_y=1, size_z=1))
+    await self.backend.unassigned_resource_callback("r")  # never used: removed from replay
+    self.assertEqual(await self._replayed_events(), [])
+
+  async def test_no_compaction_of_reassigned_subtree(self):
+    parent = Resource("parent", size_x=10, size_y=10, size_z=10)
+    child = Resource("child", size_x=1, size_y=1, size_z=1)
+    await self.backend.assigned_resource_callback(child)
+    await self.backend.unassigned_resource_callback("parent")
+    parent.assign_child_resource(child, location=Coordinate.zero())
+    await self.backend.assigned_resource_callback(parent)
+    await self.backend.unassigned_resource_callback("child")
+
+    events = await self._replayed_events()
+    self.assertEqual(
+      [(event["event"], event.get("resource_name")) for event in events],
+      [
+        ("resource_assigned", None),
+        ("resource_unassigned", "parent"),
+        ("resource_assigned", None),
+        ("resource_unassigned", "child"),
+      ],
+    )
+
+  async def test_bounded_keeps_assignments(self):
+    await self.backend.assigned_resource_callback(Resource("deck", size_x=1, size_y=1, size_z=1))
+    await self.backend.assigned_resource_callback(Resource("r", size_x=1, size_y=1, size_z=1))
+    await self.backend.send_command("test", data={"i": -1}, wait_for_response=False)
+    await self.backend.unassigned_resource_callback("r")  # "r" can be dropped from now on
+    for i in range(4):
+      await self.backend.send_command("test", data={"i": i}, wait_for_response=False)
+    events = await self._replayed_events()
+    self.assertEqual(
+      [(event["event"], event.get("resource", {}).get("name", event.get("i"))) for event in events],
+      [("resource_assigned", "deck"), ("test", 0), ("test", 1), ("test", 2), ("test", 3)],
+    )
+
+  async def test_no_compaction_after_other_events(self):
+    await self.backend.assigned_resource_callback(Resource("r", size_x=1, size_y=1, size_z=1))
+    await self.backend.send_command("test", wait_for_response=False)
+    await self.backend.unassigned_resource_callback("r")
+    events = await self._replayed_events()
+    self.assertEqual(
+      [event["event"] for event in events], ["resource_assigned", "test", "resource_unassigned"]
+    )
+
+
+class WebSocketBackendBackpressureTests(unittest.IsolatedAsyncioTestCase):
+  async def test_raise(self):
+    backend = WebSocketBackend(num_channels=8, max_pending_sends=2, backpressure="raise")
+    await backend.setup()
+    async with websockets.client.connect(f"ws://localhost:{backend.ws_port}") as client:
+      await client.send('{"event": "ready"}')
+      await client.recv()
+
+      # Stop the sender, like a browser that does not receive, so that the events pile up.
+      assert backend._sender is not None
+      backend.loop.call_soon_threadsafe(backend._sender.cancel)
+      await backend.send_command("test", data={"i": 0}, wait_for_response=False)
+      await backend.send_command("test", data={"i": 1}, wait_for_response=False)
+      with self.assertRaises(asyncio.QueueFull):
+        await backend.send_command("test", data={"i": 2}, wait_for_response=False)
+      self.assertEqual(backend.outbox.qsize(), 2)
+
+      # reconnecting sends the events again, but not the one that failed
+      await client.send('{"event": "ready"}')
+      events = [json.loads(await client.recv()) for _ in range(3)]
+      self.assertEqual([event.get("i") for event in events], [0, 1, None])
+      self.assertEqual(events[-1]["event"], "ready")
+    await backend.stop()
+
+  async def test_disconnect(self):
+    backend = WebSocketBackend(num_channels=8, max_pending_sends=5)
+    await backend.setup()
+    async with websockets.client.connect(f"ws://localhost:{backend.ws_port}") as client:
+      await client.send('{"event": "ready"}')
+      await client.recv()
+    for _ in range(100):
+      if not backend.has_connection():
+        break
+      await asyncio.sleep(0.01)
+    self.assertFalse(backend.has_connection())
+
+    # events are recorded, without waiting for the browser that disconnected
+    for i in range(8):
+      await asyncio.wait_for(
+        backend.send_command("test", data={"i": i}, wait_for_response=False), timeout=1
+      )
+
+    async with websockets.client.connect(f"ws://localhost:{backend.ws_port}") as client:
+      await client.send('{"event": "ready"}')
+      events = [json.loads(await client.recv()) for _ in range(9)]
+      self.assertEqual([event.get("i") for event in events], [*range(8), None])
+    await backend.stop()
@@ -1,4 +1,12 @@
-from typing import Any, Dict
+import bisect
+import json
+from typing import Any, Dict, List, Sequence, Tuple
+
+from pylabrobot.resources.liquid import Liquid
+from pylabrobot.utils.versioned_dict import VersionedDict
+
+# (tip_volume, is_core, is_tip, has_filter, liquid, jet, blow_out)
+HamiltonLiquidClassKey = Tuple[int, bool, bool, bool, Liquid, bool, bool]
 
 
 class HamiltonLiquidClass:
@@ -46,6 +54,28 @@ class HamiltonLiquidClass:
     self.dispense_stop_flow_rate = dispense_stop_flow_rate
     self.dispense_stop_back_volume = dispense_stop_back_volume
 
+  @property
+  def curve(self) -> Dict[float, float]:
+    """The correction curve, mapping target volumes to the volumes that should be pipetted.
+
+    The curve is sorted when it is first used after it was set or changed, and kept sorted for
+    :meth:`compute_corrected_volume`.
+    """
+    return self._curve
+
+  @curve.setter
+  def curve(self, curve: Dict[float, float]) -> None:
+    self._curve: VersionedDict[float, float] = VersionedDict(curve)
+    self._curve_version = -1
+
+  def _get_sorted_curve(self) -> Tuple[List[float], List[float]]:
+    """The target volumes of the curve in ascending order, and their corrected volumes."""
+    if self._curve_version != self._curve.version:
+      self._targets = sorted(self._curve.keys())
+      self._corrected = [self._curve[t] for t in self._targets]
+      self._curve_version = self._curve.version
+    return self._targets, self._corrected
+
   def compute_corrected_volume(self, target_volume: float) -> float:
     """Compute corrected volume using the correction curve.
 
@@ -62,29 +92,39 @@ class HamiltonLiquidClass:
       Volume that should actually be pipetted to reach target volume.
     """
 
-    targets = sorted(self.curve.keys())
+    targets, corrected = self._get_sorted_curve()
 
     if len(targets) == 0:
       return target_volume
 
-    if target_volume in self.curve:
-      return self.curve[target_volume]
+    i = bisect.bisect_left(targets, target_volume)
+    if i < len(targets) and targets[i] == target_volume:
+      return corrected[i]
 
     # use min non-zero value, so second index (if len(targets)>0,
     # then 0 was automatically added at initialization).
     if target_volume < targets[1]:  # smaller than min
-      return self.curve[targets[1]] / targets[1] * target_volume
+      return corrected[1] / targets[1] * target_volume
     if target_volume > targets[-1]:  # larger than max
-      return self.curve[targets[-1]] / targets[-1] * target_volume
+      return corrected[-1] / targets[-1] * target_volume
 
-    # interpolate between two nearest points.
-    for pt, t in zip(targets[:-1], targets[1:]):
-      if pt < target_volume < t:
-        return (self.curve[t] - self.curve[pt]) / (t - pt) * (target_volume - t) + self.curve[
-          t
-        ]  # (y = slope * (x-x1) + y1)
+    # interpolate between two nearest points, targets[i - 1] < target_volume < targets[i].
+    pt, t = targets[i - 1], targets[i]
+    slope = (corrected[i] - corrected[i - 1]) / (t - pt)
+    return slope * (target_volume - t) + corrected[i]  # (y = slope * (x-x1) + y1)
 
-    assert False, "Should never reach this point. Please file an issue."
+  def compute_corrected_volumes(self, target_volumes: Sequence[float]) -> List[float]:
+    """Compute corrected volumes for multiple target volumes, for example for all channels of an
+    operation. See :meth:`compute_corrected_volume`.
+
+    Args:
+      target_volumes: Volumes that need to be pipetted.
+
+    Returns:
+      Volumes that should actually be pipetted to reach the target volumes.
+    """
+
+    return [self.compute_corrected_volume(volume) for volume in target_volumes]
 
   def serialize(self) -> Dict[str, Any]:
     """Serialize the liquid class to a dictionary."""
@@ -108,3 +148,52 @@ class HamiltonLiquidClass:
       "dispense_stop_flow_rate": self.dispense_stop_flow_rate,
       "dispense_stop_back_volume": self.dispense_stop_back_volume,
     }
+
+  @classmethod
+  def deserialize(cls, data: Dict[str, Any]) -> "HamiltonLiquidClass":
+    """Deserialize a liquid class from a dictionary created by :meth:`serialize`. The curve keys
+    may be strings, as they are when the dictionary was read from JSON."""
+
+    return cls(**{**data, "curve": {float(k): v for k, v in data["curve"].items()}})
+
+
+def load_liquid_classes(path: str) -> Dict[HamiltonLiquidClassKey, HamiltonLiquidClass]:
+  """Load a table of liquid classes from a JSON file, like the ones that ship with PyLabRobot.
+
+  The file contains a list of serialized liquid classes. Each also has the fields of its key
+  (`tip_volume`, `is_core`, `is_tip`, `has_filter`, `liquid`, `jet` and `blow_out`, where `liquid`
+  is the name of a :class:`~pylabrobot.resources.liquid.Liquid`), and optionally a `name`. If
+  multiple liquid classes have the same key, the last one is used.
+  """
+
+  liquid_classes, _ = load_named_liquid_classes(path)
+  return liquid_classes
+
+
+def load_named_liquid_classes(
+  path: str,
+) -> Tuple[Dict[HamiltonLiquidClassKey, HamiltonLiquidClass], Dict[str, HamiltonLiquidClass]]:
+  """Like :func:`load_liquid_classes`, but also return the liquid classes by `name`, including
+  those whose key is used again by a later liquid class."""
+
+  with open(path, "r", encoding="utf-8") as f:
+    records = json.load(f)
+
+  liquid_classes: Dict[HamiltonLiquidClassKey, HamiltonLiquidClass] = {}
+  names: Dict[str, HamiltonLiquidClass] = {}
+  for record in records:
+    name = record.pop("name", None)
+    key = (
+      record.pop("tip_volume"),
+      record.pop("is_core"),
+      record.pop("is_tip"),
+      record.pop("has_filter"),
+      Liquid[record.pop("liquid")],
+      record.pop("jet"),
+      record.pop("blow_out"),
+    )
+    liquid_class = HamiltonLiquidClass.deserialize(record)
+    liquid_classes[key] = liquid_class
+    if name is not None:
+      names[name] = liquid_class
+  return liquid_classes, names
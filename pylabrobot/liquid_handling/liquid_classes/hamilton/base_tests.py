@@ -0,0 +1,150 @@
+import enum
+import hashlib
+import json
+import unittest
+
+from pylabrobot.liquid_handling.liquid_classes.hamilton import (
+  HamiltonLiquidClass,
+  get_star_liquid_class,
+  get_vantage_liquid_class,
+)
+from pylabrobot.liquid_handling.liquid_classes.hamilton import star, vantage
+from pylabrobot.resources.liquid import Liquid
+
+
+def _fingerprint(mapping) -> str:
+  items = sorted(
+    [[k.name if isinstance(k, enum.Enum) else k for k in key], hlc.serialize()]
+    for key, hlc in mapping.items()
+  )
+  return hashlib.sha256(json.dumps(items, sort_keys=True).encode()).hexdigest()
+
+
+class TestHamiltonLiquidClassTables(unittest.TestCase):
+  """The liquid class tables were converted from Python to JSON. Make sure no parameter changed."""
+
+  def test_star_table(self):
+    self.assertEqual(len(star.star_mapping), 261)
+    self.assertEqual(
+      _fingerprint(star.star_mapping),
+      "9bd2edf461cdf230f16916a6b233e310d3f8765e9ea44159b61d9c4444cef057",
+    )
+    for key, hlc in star.star_mapping.items():
+      self.assertIs(get_star_liquid_class(*key), hlc)
+
+  def test_vantage_table(self):
+    self.assertEqual(len(vantage.vantage_mapping), 252)
+    self.assertEqual(
+      _fingerprint(vantage.vantage_mapping),
+      "82810724b5e2ccf1c2904ccbb6a0ad0dd01d65994d0cb2d8a39e7ba32bcceecb",
+    )
+    for key, hlc in vantage.vantage_mapping.items():
+      self.assertIs(get_vantage_liquid_class(*key), hlc)
+
+  def test_named_liquid_classes(self):
+    from pylabrobot.liquid_handling.liquid_classes.hamilton.star import (
+      HighVolumeFilter_Water_DispenseJet_Empty,
+      StandardVolume_Water_DispenseJet_Empty,
+      _1000ulNeedleCRWater_DispenseJet_Empty,
+    )
+    from pylabrobot.liquid_handling.liquid_classes.hamilton.vantage import (
+      StandardVolume_Water_DispenseJet_Empty as Vantage_StandardVolume_Water_DispenseJet_Empty,
+    )
+
+    self.assertIs(
+      StandardVolume_Water_DispenseJet_Empty,
+      get_star_liquid_class(300, False, True, False, Liquid.WATER, True, True),
+    )
+    self.assertIs(
+      HighVolumeFilter_Water_DispenseJet_Empty,
+      get_star_liquid_class(1000, False, True, True, Liquid.WATER, True, True),
+    )
+    self.assertIsInstance(_1000ulNeedleCRWater_DispenseJet_Empty, HamiltonLiquidClass)
+    self.assertIs(
+      Vantage_StandardVolume_Water_DispenseJet_Empty,
+      get_vantage_liquid_class(300, False, True, False, Liquid.WATER, True, True),
+    )
+
+    # all 454 and 428 liquid classes that used to be module level constants, including those whose
+    # key is used again by a later definition
+    star_names = [n for n in dir(star) if isinstance(getattr(star, n), HamiltonLiquidClass)]
+    vantage_names = [
+      n for n in dir(vantage) if isinstance(getattr(vantage, n), HamiltonLiquidClass)
+    ]
+    self.assertEqual((len(star_names), len(vantage_names)), (454, 428))
+    with self.assertRaises(ImportError):
+      from pylabrobot.liquid_handling.liquid_classes.hamilton.star import (  # noqa: F401
+        does_not_exist,
+      )
+
+  def test_get_star_liquid_class(self):
+    hlc = get_star_liquid_class(
+      tip_volume=1000,
+      is_core=False,
+      is_tip=False,
+      has_filter=False,
+      liquid=Liquid.WATER,
+      jet=True,
+      blow_out=True,
+    )
+    assert hlc is not None
+    self.assertEqual(hlc.curve[500.0], 527.3)
+    self.assertEqual(hlc.aspiration_flow_rate, 250.0)
+    self.assertEqual(hlc.dispense_mode, 3.0)
+
+  def test_serialize_deserialize(self):
+    hlc = next(iter(star.star_mapping.values()))
+    data = json.loads(json.dumps(hlc.serialize()))
+    self.assertEqual(HamiltonLiquidClass.deserialize(data).serialize(), hlc.serialize())
+
+
+def _reference_compute_corrected_volume(curve, target_volume: float) -> float:
+  """The original implementation, which sorted the curve on every call."""
+  targets = sorted(curve.keys())
+  if len(targets) == 0:
+    return target_volume
+  if target_volume in curve:
+    return curve[target_volume]
+  if target_volume < targets[1]:
+    return curve[targets[1]] / targets[1] * target_volume
+  if target_volume > targets[-1]:
+    return curve[targets[-1]] / targets[-1] * target_volume
+  for pt, t in zip(targets[:-1], targets[1:]):
+    if pt < target_volume < t:
+      return (curve[t] - curve[pt]) / (t - pt) * (target_volume - t) + curve[t]
+  raise AssertionError
+
+
+class TestComputeCorrectedVolume(unittest.TestCase):
+  def test_identical_to_reference(self):
+    for hlc in list(star.star_mapping.values()) + list(vantage.vantage_mapping.values()):
+      targets = sorted(hlc.curve)
+      volumes = [0.1, 0.5, 1.0, 2.5, 7.3, 33.3, 123.4, 999.9, 1234.5, 5678.9]
+      volumes += targets + [t * 2 for t in targets]
+      volumes += [(a + b) / 2 for a, b in zip(targets, targets[1:])]
+      expected = [_reference_compute_corrected_volume(hlc.curve, v) for v in volumes]
+      self.assertEqual([hlc.compute_corrected_volume(v) for v in volumes], expected)
+      self.assertEqual(hlc.compute_corrected_volumes(volumes), expected)
+
+  def test_empty_curve(self):
+    data = next(iter(star.star_mapping.values())).serialize()
+    hlc = HamiltonLiquidClass.deserialize({**data, "curve": {}})
+    self.assertEqual(hlc.compute_corrected_volume(12.3), 12.3)
+
+  def test_set_curve(self):
+    hlc = HamiltonLiquidClass.deserialize(next(iter(star.star_mapping.values())).serialize())
+    hlc.curve = {0.0: 0.0, 10.0: 20.0, 100.0: 110.0}
+    self.assertEqual(hlc.compute_corrected_volume(10), 20.0)
+    self.assertEqual(hlc.compute_corrected_volume(5), 10.0)
+    self.assertEqual(hlc.compute_corrected_volume(55), 65.0)
+    self.assertAlmostEqual(hlc.compute_corrected_volume(200), 220.0)
+
+  def test_change_curve_in_place(self):
+    hlc = HamiltonLiquidClass.deserialize(next(iter(star.star_mapping.values())).serialize())
+    hlc.curve = {0.0: 0.0, 10.0: 20.0, 100.0: 110.0}
+    self.assertEqual(hlc.compute_corrected_volume(55), 65.0)
+    hlc.curve[50.0] = 80.0
+    self.assertEqual(hlc.compute_corrected_volume(50), 80.0)
+    self.assertEqual(hlc.compute_corrected_volume(75), 95.0)
+    del hlc.curve[50.0]
+    self.assertEqual(hlc.compute_corrected_volume(55), 65.0)
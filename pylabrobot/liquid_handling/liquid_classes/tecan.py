@@ -1,8 +1,12 @@
+import bisect
+import json
+import os
 import re
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pylabrobot.resources.liquid import Liquid
 from pylabrobot.resources.tecan import TipType
+from pylabrobot.utils.versioned_dict import VersionedDict
 
 
 def from_str(s: str) -> Optional[Liquid]:
@@ -130,2665 +134,73 @@ class TecanLiquidClass:
     return self.calibration_factor * target_volume + self.calibration_offset
 
 
-mapping: Dict[Tuple[float, float, Liquid, TipType], TecanLiquidClass] = {}
+TecanLiquidClassKey = Tuple[float, float, Liquid, TipType]  # (min volume, max volume, liquid, tip)
 
+_mapping: Optional[VersionedDict[TecanLiquidClassKey, TecanLiquidClass]] = None
 
-def get_liquid_class(
-  target_volume: float,
-  liquid_class: Liquid,
-  tip_type: TipType,
-) -> Optional[TecanLiquidClass]:
-  for (mnv, mxv, lc, tt), tlc in mapping.items():
-    if mnv <= target_volume < mxv and lc == liquid_class and tt == tip_type:
-      return tlc
-  return None
-
-
-mapping[(3, 15.01, Liquid.DMSO, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.063,
-  calibration_offset=0.1,
-  aspirate_speed=20,
-  aspirate_delay=200,
-  aspirate_stag_volume=10,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 200.01, Liquid.DMSO, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.1,
-  calibration_offset=-0.3,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(200.01, 1000.01, Liquid.DMSO, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.002,
-  calibration_offset=19.3,
-  aspirate_speed=150,
-  aspirate_delay=300,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 15.01, Liquid.DMSO, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.026,
-  calibration_offset=0.1,
-  aspirate_speed=20,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=5,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 200.01, Liquid.DMSO, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.007,
-  calibration_offset=0.8,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(200.01, 1000.01, Liquid.DMSO, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.004,
-  calibration_offset=3.9,
-  aspirate_speed=150,
-  aspirate_delay=400,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(0.5, 3.01, Liquid.DMSO, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.311,
-  calibration_offset=0,
-  aspirate_speed=10,
-  aspirate_delay=200,
-  aspirate_stag_volume=5,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=0.25,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=10,
-  dispense_breakoff=10,
-  dispense_delay=400,
-  dispense_tag=False,
-  dispense_pinch_valve=True,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3.01, 15.01, Liquid.DMSO, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.215,
-  calibration_offset=1.5,
-  aspirate_speed=10,
-  aspirate_delay=400,
-  aspirate_stag_volume=2,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=7,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=110,
-  dispense_breakoff=110,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 300.01, Liquid.DMSO, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.122,
-  calibration_offset=2.4,
-  aspirate_speed=45,
-  aspirate_delay=500,
-  aspirate_stag_volume=10,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=110,
-  dispense_breakoff=110,
-  dispense_delay=100,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(1, 7.51, Liquid.DMSO, TipType.MCADITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.35,
-  calibration_offset=0,
-  aspirate_speed=5,
-  aspirate_delay=200,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=7,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=2,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=False,
-  aspirate_lld_position=0,
-  aspirate_lld_offset=0,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=2,
-  aspirate_retract_speed=5,
-  aspirate_retract_offset=0,
-  dispense_speed=500,
-  dispense_breakoff=150,
-  dispense_delay=200,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=3,
-  dispense_retract_speed=42,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(7.51, 20.01, Liquid.DMSO, TipType.MCADITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.04,
-  calibration_offset=0,
-  aspirate_speed=10,
-  aspirate_delay=200,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=7,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=3,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=False,
-  aspirate_lld_position=0,
-  aspirate_lld_offset=0,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=2,
-  aspirate_retract_speed=5,
-  aspirate_retract_offset=0,
-  dispense_speed=500,
-  dispense_breakoff=150,
-  dispense_delay=200,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=3,
-  dispense_retract_speed=42,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(20.01, 200.01, Liquid.DMSO, TipType.MCADITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.04,
-  calibration_offset=0,
-  aspirate_speed=10,
-  aspirate_delay=200,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=3,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=False,
-  aspirate_lld_position=0,
-  aspirate_lld_offset=0,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=2,
-  aspirate_retract_speed=5,
-  aspirate_retract_offset=0,
-  dispense_speed=400,
-  dispense_breakoff=300,
-  dispense_delay=200,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=3,
-  dispense_retract_speed=42,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 15.01, Liquid.DMSO, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.08,
-  calibration_offset=-0.086,
-  aspirate_speed=20,
-  aspirate_delay=200,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=50,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=50,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 200.01, Liquid.DMSO, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.024,
-  calibration_offset=0.866,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(200.01, 1000.01, Liquid.DMSO, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1.1,
-  calibration_factor=1.028,
-  calibration_offset=-0.258,
-  aspirate_speed=150,
-  aspirate_delay=400,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=True,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 1000.01, Liquid.ETHANOL, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1.063,
-  calibration_offset=3.4,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 1000.01, Liquid.ETHANOL, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1.09,
-  calibration_offset=4.3,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(0.5, 3.01, Liquid.ETHANOL, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1.279,
-  calibration_offset=0.2,
-  aspirate_speed=10,
-  aspirate_delay=200,
-  aspirate_stag_volume=5,
-  aspirate_stag_speed=10,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=10,
-  aspirate_tag_volume=0.25,
-  aspirate_tag_speed=10,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=10,
-  aspirate_retract_offset=-5,
-  dispense_speed=10,
-  dispense_breakoff=10,
-  dispense_delay=400,
-  dispense_tag=False,
-  dispense_pinch_valve=True,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3.01, 15.01, Liquid.ETHANOL, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1.199,
-  calibration_offset=1.3,
-  aspirate_speed=10,
-  aspirate_delay=400,
-  aspirate_stag_volume=2,
-  aspirate_stag_speed=10,
-  aspirate_lag_volume=7,
-  aspirate_lag_speed=10,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=10,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=110,
-  dispense_breakoff=110,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 300.01, Liquid.ETHANOL, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1.079,
-  calibration_offset=2.8,
-  aspirate_speed=45,
-  aspirate_delay=500,
-  aspirate_stag_volume=10,
-  aspirate_stag_speed=10,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=10,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=10,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=110,
-  dispense_breakoff=110,
-  dispense_delay=100,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 5, Liquid.ETHANOL, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1.072,
-  calibration_offset=0.22,
-  aspirate_speed=20,
-  aspirate_delay=400,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=50,
-  aspirate_lag_volume=5,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=50,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=True,
-  aspirate_mix_volume=200,
-  aspirate_mix_cycles=2,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=400,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(5, 15.01, Liquid.ETHANOL, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1.072,
-  calibration_offset=0.42,
-  aspirate_speed=20,
-  aspirate_delay=400,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=50,
-  aspirate_lag_volume=5,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=50,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=True,
-  aspirate_mix_volume=200,
-  aspirate_mix_cycles=2,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=400,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 200.01, Liquid.ETHANOL, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1.011,
-  calibration_offset=1.802,
-  aspirate_speed=150,
-  aspirate_delay=400,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=5,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=True,
-  aspirate_mix_volume=200,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=400,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
+# For each (liquid, tip type), the volume ranges sorted by their minimum volume, and the version of
+# the mapping the index was built from.
+_index: Dict[Tuple[Liquid, TipType], Tuple[List[float], List[TecanLiquidClassKey]]] = {}
+_index_version = -1
 
 
-mapping[(200.01, 1000.01, Liquid.ETHANOL, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=2,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=0.8,
-  calibration_factor=1,
-  calibration_offset=0,
-  aspirate_speed=150,
-  aspirate_delay=400,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=True,
-  aspirate_mix_volume=1000,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=400,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
+def _get_mapping() -> VersionedDict[TecanLiquidClassKey, TecanLiquidClass]:
+  """The liquid classes are stored in `tecan.json`, which is only loaded when they are first used.
+  This keeps importing the backends fast."""
 
+  global _mapping
+  if _mapping is None:
+    with open(os.path.join(os.path.dirname(__file__), "tecan.json"), "r", encoding="utf-8") as f:
+      records = json.load(f)
+    _mapping = VersionedDict()
+    for record in records:
+      key = (
+        record.pop("min_volume"),
+        record.pop("max_volume"),
+        Liquid[record.pop("liquid")],
+        TipType[record.pop("tip_type")],
+      )
+      _mapping[key] = TecanLiquidClass(**record)
+  return _mapping
 
-mapping[(3, 15.01, Liquid.SERUM, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.074,
-  calibration_offset=0.3,
-  aspirate_speed=20,
-  aspirate_delay=200,
-  aspirate_stag_volume=10,
-  aspirate_stag_speed=20,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=20,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=20,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
 
+def __getattr__(name: str):
+  # `mapping` used to be a module level dict, keep it available (and mutable).
+  if name == "mapping":
+    return _get_mapping()
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-mapping[(15.01, 300.01, Liquid.SERUM, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.06,
-  calibration_offset=0.43,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
 
+def _build_index(mapping: VersionedDict[TecanLiquidClassKey, TecanLiquidClass]) -> None:
+  global _index_version
+  _index.clear()
+  for key in sorted(mapping, key=lambda k: k[0]):
+    min_volumes, keys = _index.setdefault((key[2], key[3]), ([], []))
+    min_volumes.append(key[0])
+    keys.append(key)
+  _index_version = mapping.version
 
-mapping[(300.01, 1000.01, Liquid.SERUM, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.007,
-  calibration_offset=16.63,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
 
-
-mapping[(3, 15.01, Liquid.SERUM, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.138,
-  calibration_offset=1,
-  aspirate_speed=20,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=20,
-  aspirate_lag_volume=5,
-  aspirate_lag_speed=20,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=20,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 200.01, Liquid.SERUM, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.059,
-  calibration_offset=2.09,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(200.01, 1000.01, Liquid.SERUM, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.046,
-  calibration_offset=8.55,
-  aspirate_speed=100,
-  aspirate_delay=400,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 15.01, Liquid.SERUM, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.115,
-  calibration_offset=1.146,
-  aspirate_speed=50,
-  aspirate_delay=600,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=50,
-  aspirate_lag_volume=15,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=50,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-10,
-  dispense_speed=400,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=True,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 200.01, Liquid.SERUM, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.043,
-  calibration_offset=2.671,
-  aspirate_speed=100,
-  aspirate_delay=600,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=6,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-10,
-  dispense_speed=400,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=True,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(200.01, 1000.01, Liquid.SERUM, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=2.1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.021,
-  calibration_offset=10.966,
-  aspirate_speed=100,
-  aspirate_delay=600,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=400,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=True,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 15.01, Liquid.WATER, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.045,
-  calibration_offset=0.2,
-  aspirate_speed=20,
-  aspirate_delay=200,
-  aspirate_stag_volume=10,
-  aspirate_stag_speed=20,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=20,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=20,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 500.01, Liquid.WATER, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.042,
-  calibration_offset=-0.04,
-  aspirate_speed=150,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(500.01, 1000.01, Liquid.WATER, TipType.STANDARD)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1,
-  calibration_offset=20.26,
-  aspirate_speed=150,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=150,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 15.01, Liquid.WATER, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.042,
-  calibration_offset=1.1,
-  aspirate_speed=20,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=20,
-  aspirate_lag_volume=5,
-  aspirate_lag_speed=20,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=20,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 200.01, Liquid.WATER, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.034,
-  calibration_offset=0.9,
-  aspirate_speed=100,
-  aspirate_delay=200,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=5,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(200.01, 1000.01, Liquid.WATER, TipType.DITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.031,
-  calibration_offset=6.12,
-  aspirate_speed=150,
-  aspirate_delay=300,
-  aspirate_stag_volume=20,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(0.5, 3.01, Liquid.WATER, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.1,
-  calibration_offset=0.15,
-  aspirate_speed=10,
-  aspirate_delay=200,
-  aspirate_stag_volume=5,
-  aspirate_stag_speed=10,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=10,
-  aspirate_tag_volume=0.25,
-  aspirate_tag_speed=10,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=10,
-  dispense_breakoff=10,
-  dispense_delay=400,
-  dispense_tag=False,
-  dispense_pinch_valve=True,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3.01, 15.01, Liquid.WATER, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.045,
-  calibration_offset=0.2,
-  aspirate_speed=10,
-  aspirate_delay=400,
-  aspirate_stag_volume=2,
-  aspirate_stag_speed=10,
-  aspirate_lag_volume=7,
-  aspirate_lag_speed=10,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=10,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=110,
-  dispense_breakoff=110,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 300.01, Liquid.WATER, TipType.STDLOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.06,
-  calibration_offset=0.5,
-  aspirate_speed=45,
-  aspirate_delay=500,
-  aspirate_stag_volume=10,
-  aspirate_stag_speed=10,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=10,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=10,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=110,
-  dispense_breakoff=110,
-  dispense_delay=100,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(1, 3.01, Liquid.WATER, TipType.DITILOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1,
-  calibration_offset=0.25,
-  aspirate_speed=10,
-  aspirate_delay=500,
-  aspirate_stag_volume=5,
-  aspirate_stag_speed=10,
-  aspirate_lag_volume=0,
-  aspirate_lag_speed=10,
-  aspirate_tag_volume=0.25,
-  aspirate_tag_speed=10,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=10,
-  dispense_breakoff=10,
-  dispense_delay=100,
-  dispense_tag=False,
-  dispense_pinch_valve=True,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3.01, 15.01, Liquid.WATER, TipType.DITILOWVOL)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.03,
-  calibration_offset=0.25,
-  aspirate_speed=10,
-  aspirate_delay=500,
-  aspirate_stag_volume=10,
-  aspirate_stag_speed=10,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=10,
-  aspirate_tag_volume=3,
-  aspirate_tag_speed=10,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=1,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=240,
-  dispense_breakoff=110,
-  dispense_delay=200,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(1, 7.51, Liquid.WATER, TipType.MCADITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1,
-  calibration_offset=0.45,
-  aspirate_speed=5,
-  aspirate_delay=200,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=3,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=False,
-  aspirate_lld_position=0,
-  aspirate_lld_offset=0,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=2,
-  aspirate_retract_speed=5,
-  aspirate_retract_offset=0,
-  dispense_speed=500,
-  dispense_breakoff=150,
-  dispense_delay=200,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=3,
-  dispense_retract_speed=42,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(7.51, 20.01, Liquid.WATER, TipType.MCADITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1,
-  calibration_offset=0.45,
-  aspirate_speed=10,
-  aspirate_delay=200,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=False,
-  aspirate_lld_position=0,
-  aspirate_lld_offset=0,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=2,
-  aspirate_retract_speed=5,
-  aspirate_retract_offset=0,
-  dispense_speed=500,
-  dispense_breakoff=150,
-  dispense_delay=200,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=3,
-  dispense_retract_speed=42,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(20.01, 200.01, Liquid.WATER, TipType.MCADITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.05,
-  calibration_offset=0.4,
-  aspirate_speed=50,
-  aspirate_delay=500,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=5,
-  aspirate_lag_volume=20,
-  aspirate_lag_speed=50,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=5,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=False,
-  aspirate_lld_position=0,
-  aspirate_lld_offset=0,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=2,
-  aspirate_retract_speed=5,
-  aspirate_retract_offset=0,
-  dispense_speed=400,
-  dispense_breakoff=300,
-  dispense_delay=200,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=3,
-  dispense_retract_speed=42,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(3, 15.01, Liquid.WATER, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.05,
-  calibration_offset=1.5,
-  aspirate_speed=20,
-  aspirate_delay=400,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=20,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=5,
-  aspirate_tag_speed=20,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(15.01, 200.01, Liquid.WATER, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.03,
-  calibration_offset=1.5,
-  aspirate_speed=100,
-  aspirate_delay=400,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=5,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
-
-
-mapping[(200.01, 1000.01, Liquid.WATER, TipType.AIRDITI)] = TecanLiquidClass(
-  lld_mode=7,
-  lld_conductivity=1,
-  lld_speed=60,
-  lld_distance=4,
-  clot_speed=50,
-  clot_limit=4,
-  pmp_sensitivity=1,
-  pmp_viscosity=1,
-  pmp_character=0,
-  density=1,
-  calibration_factor=1.025,
-  calibration_offset=4,
-  aspirate_speed=150,
-  aspirate_delay=400,
-  aspirate_stag_volume=0,
-  aspirate_stag_speed=70,
-  aspirate_lag_volume=10,
-  aspirate_lag_speed=70,
-  aspirate_tag_volume=10,
-  aspirate_tag_speed=70,
-  aspirate_excess=0,
-  aspirate_conditioning=0,
-  aspirate_pinch_valve=False,
-  aspirate_lld=True,
-  aspirate_lld_position=3,
-  aspirate_lld_offset=2,
-  aspirate_mix=False,
-  aspirate_mix_volume=100,
-  aspirate_mix_cycles=1,
-  aspirate_retract_position=4,
-  aspirate_retract_speed=20,
-  aspirate_retract_offset=-5,
-  dispense_speed=600,
-  dispense_breakoff=400,
-  dispense_delay=0,
-  dispense_tag=False,
-  dispense_pinch_valve=False,
-  dispense_lld=False,
-  dispense_lld_position=0,
-  dispense_lld_offset=0,
-  dispense_touching_direction=0,
-  dispense_touching_speed=10,
-  dispense_touching_delay=100,
-  dispense_mix=False,
-  dispense_mix_volume=100,
-  dispense_mix_cycles=1,
-  dispense_retract_position=1,
-  dispense_retract_speed=50,
-  dispense_retract_offset=0,
-)
+def get_liquid_class(
+  target_volume: float,
+  liquid_class: Liquid,
+  tip_type: TipType,
+) -> Optional[TecanLiquidClass]:
+  """Get the liquid class for a volume, liquid and tip type. The volume ranges of the liquid classes
+  for a liquid and tip type must not overlap.
+
+  Args:
+    target_volume: The volume to pipette, in uL. Liquid classes cover `min <= volume < max`.
+    liquid_class: The liquid.
+    tip_type: The tip type.
+  """
+
+  mapping = _get_mapping()
+  if mapping.version != _index_version:  # liquid classes were changed
+    _build_index(mapping)
+
+  min_volumes, keys = _index.get((liquid_class, tip_type), ([], []))
+  i = bisect.bisect_right(min_volumes, target_volume) - 1
+  if i < 0 or target_volume >= keys[i][1] or keys[i] not in mapping:
+    return None
+  return mapping[keys[i]]
@@ -0,0 +1,61 @@
+import hashlib
+import json
+import unittest
+
+from pylabrobot.liquid_handling.liquid_classes import tecan
+from pylabrobot.liquid_handling.liquid_classes.tecan import get_liquid_class
+from pylabrobot.resources.liquid import Liquid
+from pylabrobot.resources.tecan import TipType
+
+
+class TestTecanLiquidClasses(unittest.TestCase):
+  def test_table(self):
+    """The liquid class table was converted from Python to JSON. Make sure no parameter changed."""
+
+    items = sorted(
+      [[mnv, mxv, lc.name, tt.name], vars(tlc)] for (mnv, mxv, lc, tt), tlc in tecan.mapping.items()
+    )
+    self.assertEqual(len(items), 50)
+    self.assertEqual(
+      hashlib.sha256(json.dumps(items, sort_keys=True).encode()).hexdigest(),
+      "2d30220dd738588b193c87777e1da3c0d0836d382222cfe10112d8d6664dfa1d",
+    )
+
+  def test_get_liquid_class(self):
+    def linear_search(volume, liquid, tip_type):
+      for (mnv, mxv, lc, tt), tlc in tecan.mapping.items():
+        if mnv <= volume < mxv and lc == liquid and tt == tip_type:
+          return tlc
+      return None
+
+    for mnv, mxv, liquid, tip_type in list(tecan.mapping):
+      for volume in (mnv - 0.01, mnv, (mnv + mxv) / 2, mxv - 0.01, mxv):
+        self.assertIs(
+          get_liquid_class(volume, liquid, tip_type),
+          linear_search(volume, liquid, tip_type),
+        )
+
+    self.assertIsNone(get_liquid_class(10, Liquid.DMSO, TipType.DITILOWVOL))
+
+  def test_added_liquid_class(self):
+    key = (0.1, 3, Liquid.DMSO, TipType.STANDARD)
+    self.assertNotIn(key, tecan.mapping)
+    tlc = tecan.mapping[(3, 15.01, Liquid.DMSO, TipType.STANDARD)]
+    tecan.mapping[key] = tlc
+    try:
+      self.assertIs(get_liquid_class(1, Liquid.DMSO, TipType.STANDARD), tlc)
+    finally:
+      del tecan.mapping[key]
+    self.assertIsNone(get_liquid_class(1, Liquid.DMSO, TipType.STANDARD))
+
+  def test_replaced_liquid_class(self):
+    old_key = (3, 15.01, Liquid.DMSO, TipType.STANDARD)
+    new_key = (1, 15.01, Liquid.DMSO, TipType.STANDARD)
+    tlc = tecan.mapping.pop(old_key)
+    tecan.mapping[new_key] = tlc  # same number of liquid classes, different volume range
+    try:
+      self.assertIs(get_liquid_class(2, Liquid.DMSO, TipType.STANDARD), tlc)
+    finally:
+      del tecan.mapping[new_key]
+      tecan.mapping[old_key] = tlc
+    self.assertIsNone(get_liquid_class(2, Liquid.DMSO, TipType.STANDARD))
@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import inspect
-import json
 import logging
 import threading
 import warnings
 from typing import (
   Any,
   Callable,
+  Coroutine,
   Dict,
+  FrozenSet,
   List,
   Optional,
   Protocol,
@@ -56,6 +58,7 @@ from pylabrobot.resources.errors import CrossContaminationError, HasTipError
 from pylabrobot.resources.liquid import Liquid
 from pylabrobot.resources.rotation import Rotation
 from pylabrobot.tilting.tilter import Tilter
+from pylabrobot.utils import json_codec
 
 from .backends import LiquidHandlerBackend
 from .standard import (
@@ -74,6 +77,7 @@ from .standard import (
   ResourceMove,
   ResourcePickup,
 )
+from .transfer_planner import Transfer, plan_transfers
 
 logger = logging.getLogger("pylabrobot")
 
@@ -107,6 +111,75 @@ class BlowOutVolumeError(Exception):
   pass
 
 
+@functools.lru_cache(maxsize=256)
+def _analyze_signature(
+  func: Callable, default: FrozenSet[str]
+) -> Tuple[FrozenSet[str], FrozenSet[str], bool]:
+  """Analyze the signature of a backend method for :meth:`LiquidHandler._check_args`.
+
+  Args:
+    func: The function, not bound to an instance.
+    default: Default arguments to `func`. (Of the abstract backend)
+
+  Returns:
+    The names of the arguments that are not in `default`, excluding `*args` and `**kwargs`, the
+    subset of those that have no default value, and whether `func` accepts `**kwargs`.
+  """
+
+  default_args = default.union({"self"})
+
+  sig = inspect.signature(func)
+  args = {arg: param for arg, param in sig.parameters.items() if arg not in default_args}
+  accepts_var_keyword = any(
+    param.kind == inspect.Parameter.VAR_KEYWORD  # **kwargs
+    for param in sig.parameters.values()
+  )
+  args = {
+    arg: param
+    for arg, param in args.items()  # keep only *args and **kwargs
+    if param.kind
+    not in {
+      inspect.Parameter.VAR_POSITIONAL,
+      inspect.Parameter.VAR_KEYWORD,
+    }
+  }
+  non_default = {arg for arg, param in args.items() if param.default == inspect.Parameter.empty}
+  return frozenset(args), frozenset(non_default), accepts_var_keyword
+
+
+class _BackendCallbackLoop:
+  """An event loop running in a long-lived daemon thread.
+
+  Resource (un)assignment callbacks are synchronous, but the backend callbacks are coroutines, and
+  the caller may or may not be running an event loop itself. Coroutines submitted here run one at a
+  time and in submission order, on a single loop that is shared by all liquid handlers. This avoids
+  creating a thread and an event loop for every callback.
+  """
+
+  def __init__(self):
+    self._loop: Optional[asyncio.AbstractEventLoop] = None
+    self._thread: Optional[threading.Thread] = None
+    self._lock = threading.Lock()
+
+  def in_loop_thread(self) -> bool:
+    return self._thread is not None and threading.current_thread() is self._thread
+
+  def run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run `coro` on the background loop and block until it finishes."""
+    with self._lock:
+      if self._loop is None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+          target=self._loop.run_forever, name="lh-backend-callbacks", daemon=True
+        )
+        self._thread.start()
+      loop = self._loop
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+_backend_callback_loop = _BackendCallbackLoop()
+
+
 class LiquidHandler(Resource, Machine):
   """
   Front end for liquid handlers.
@@ -177,10 +250,12 @@ class LiquidHandler(Resource, Machine):
 
     self.head = {c: TipTracker(thing=f"Channel {c}") for c in range(self.backend.num_channels)}
     self.head96 = {c: TipTracker(thing=f"Channel {c}") for c in range(96)}
+    for tracker in self.head.values():
+      tracker.register_change_callback(self._mark_state_changed)
+    self._mark_state_changed()
 
-    self._send_assigned_resource_to_backend(self.deck)
-    for resource in self.deck.children:
-      self._send_assigned_resource_to_backend(resource)
+    # send the deck and all resources on it in a single round trip to the callback loop
+    self._run_async_in_thread(self._send_all_assigned_resources_to_backend)
 
     self._resource_pickup = None
 
@@ -227,15 +302,31 @@ class LiquidHandler(Resource, Machine):
     self.update_head_state({c: None for c in self.head.keys()})
 
   def _run_async_in_thread(self, func, *args, **kwargs):
-    def callback(*args, **kwargs):
-      loop = asyncio.new_event_loop()
-      asyncio.set_event_loop(loop)
-      loop.run_until_complete(func(*args, **kwargs))
-      loop.close()
+    if _backend_callback_loop.in_loop_thread():
+      # Called from within a backend callback (eg. a backend that assigns resources). Blocking the
+      # shared loop would deadlock, so fall back to a temporary thread with its own loop.
+      def callback(*args, **kwargs):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(func(*args, **kwargs))
+        loop.close()
+
+      t = threading.Thread(target=callback, args=args, kwargs=kwargs)
+      t.start()
+      t.join()
+      return
+
+    try:
+      _backend_callback_loop.run(func(*args, **kwargs))
+    except Exception:  # same as an exception in a thread: report it, but don't raise
+      logger.exception("Exception in backend callback '%s'", func.__name__)
 
-    t = threading.Thread(target=callback, args=args, kwargs=kwargs)
-    t.start()
-    t.join()
+  async def _send_all_assigned_resources_to_backend(self):
+    for resource in [self.deck] + self.deck.children:
+      try:
+        await self.backend.assigned_resource_callback(resource)
+      except Exception:
+        logger.exception("Exception in backend callback for resource '%s'", resource.name)
 
   def _send_assigned_resource_to_backend(self, resource: Resource):
     """This method is called when a resource is assigned to the deck, and passes this information
@@ -305,25 +396,14 @@ class LiquidHandler(Resource, Machine):
       The set of arguments that need to be removed from `backend_kwargs` before passing to `method`.
     """
 
-    default_args = default.union({"self"})
-
-    sig = inspect.signature(method)
-    args = {arg: param for arg, param in sig.parameters.items() if arg not in default_args}
-    vars_keyword = {
-      arg
-      for arg, param in sig.parameters.items()  # **kwargs
-      if param.kind == inspect.Parameter.VAR_KEYWORD
-    }
-    args = {
-      arg: param
-      for arg, param in args.items()  # keep only *args and **kwargs
-      if param.kind
-      not in {
-        inspect.Parameter.VAR_POSITIONAL,
-        inspect.Parameter.VAR_KEYWORD,
-      }
-    }
-    non_default = {arg for arg, param in args.items() if param.default == inspect.Parameter.empty}
+    # The signature analysis only depends on the backend method, so it is cached per function.
+    func = getattr(method, "__func__", method)
+    try:
+      args, non_default, accepts_var_keyword = _analyze_signature(func, frozenset(default))
+    except TypeError:  # not hashable
+      args, non_default, accepts_var_keyword = _analyze_signature.__wrapped__(
+        func, frozenset(default)
+      )
 
     backend_kws = set(backend_kwargs.keys())
 
@@ -331,11 +411,11 @@ class LiquidHandler(Resource, Machine):
     if len(missing) > 0:
       raise TypeError(f"Missing arguments to backend.{method.__name__}: {missing}")
 
-    if len(vars_keyword) > 0:
+    if accepts_var_keyword:
       return set()  # no extra arguments if the method accepts **kwargs
 
-    extra = backend_kws - set(args.keys())
-    if len(extra) > 0 and len(vars_keyword) == 0:
+    extra = backend_kws - args
+    if len(extra) > 0:
       if strictness == Strictness.STRICT:
         raise TypeError(f"Extra arguments to backend.{method.__name__}: {extra}")
       elif strictness == Strictness.WARN:
@@ -1219,6 +1299,89 @@ class LiquidHandler(Resource, Machine):
         **backend_kwargs,
       )
 
+  async def transfer_many(
+    self,
+    sources: Sequence[Container],
+    targets: Sequence[Container],
+    vols: Sequence[float],
+    use_channels: Optional[List[int]] = None,
+    max_volume: Optional[float] = None,
+    multi_dispense: bool = True,
+    aspiration_flow_rate: Optional[float] = None,
+    dispense_flow_rate: Optional[float] = None,
+    **backend_kwargs,
+  ):
+    """Transfer liquid for many independent source/target pairs, using as few multi-channel
+    aspirations and dispenses as possible. See
+    :func:`~pylabrobot.liquid_handling.transfer_planner.plan_transfers` for how transfers are
+    grouped.
+
+    Tips must already be mounted on the channels in `use_channels`.
+
+    Examples:
+
+      Cherry pick from a source plate into the first column of a target plate:
+
+      >>> await lh.transfer_many(
+      ...   sources=source_plate["A1", "C4", "B7", "H2"],
+      ...   targets=target_plate["A1:D1"],
+      ...   vols=[10, 20, 30, 40])
+
+    Args:
+      sources: The source containers, one for each transfer.
+      targets: The target containers, one for each transfer.
+      vols: The volumes to transfer, one for each transfer.
+      use_channels: The channels to use, sorted. If `None`, all channels are used.
+      max_volume: The maximum volume a channel can hold. If `None`, the smallest maximal volume of
+        the tips mounted on `use_channels` is used.
+      multi_dispense: Whether to dispense a single aspiration into multiple targets.
+      aspiration_flow_rate: The flow rate to use when aspirating, in ul/s. If `None`, the backend
+        default will be used.
+      dispense_flow_rate: The flow rate to use when dispensing, in ul/s. If `None`, the backend
+        default will be used.
+      backend_kwargs: Additional keyword arguments for the backend, passed to each aspirate and
+        dispense.
+
+    Raises:
+      RuntimeError: If the setup has not been run. See :meth:`~LiquidHandler.setup`.
+    """
+
+    if not len(sources) == len(targets) == len(vols):
+      raise ValueError("sources, targets and vols must have the same length.")
+
+    use_channels = use_channels or self._default_use_channels or list(range(len(self.head)))
+    if use_channels != sorted(use_channels):
+      raise ValueError("use_channels must be sorted.")
+    self._make_sure_channels_exist(use_channels)
+    if max_volume is None:
+      max_volume = min(self.head[channel].get_tip().maximal_volume for channel in use_channels)
+
+    batches = plan_transfers(
+      [Transfer(source, target, vol) for source, target, vol in zip(sources, targets, vols)],
+      num_channels=len(use_channels),
+      max_volume=max_volume,
+      multi_dispense=multi_dispense,
+    )
+
+    for batch in batches:
+      channels = [use_channels[i] for i in batch.channels]
+      await self.aspirate(
+        resources=[ct.source for ct in batch.channel_transfers],
+        vols=[ct.volume for ct in batch.channel_transfers],
+        use_channels=channels,
+        flow_rates=[aspiration_flow_rate] * len(channels),
+        **backend_kwargs,
+      )
+      for i in range(batch.num_dispense_rounds):
+        dispense_round = batch.dispense_round(i)
+        await self.dispense(
+          resources=[target for _, target, _ in dispense_round],
+          vols=[vol for _, _, vol in dispense_round],
+          use_channels=[use_channels[channel] for channel, _, _ in dispense_round],
+          flow_rates=[dispense_flow_rate] * len(dispense_round),
+          **backend_kwargs,
+        )
+
   @contextlib.contextmanager
   def use_channels(self, channels: List[int]):
     """Temporarily use the specified channels as a default argument to `use_channels`.
@@ -1465,6 +1628,28 @@ class LiquidHandler(Resource, Machine):
       **backend_kwargs,
     )
 
+  def _commit_or_rollback_wells(self, wells: List[Well], success: bool) -> None:
+    """Commit or rollback the volume trackers of `wells` after a 96 head operation. If the wells
+    are all wells of a plate that uses a :class:`~pylabrobot.resources.VolumeStore`, this is done
+    for the whole plate at once."""
+
+    if not does_volume_tracking():
+      return
+
+    plate = wells[0].parent if len(wells) > 0 else None
+    store = plate.volume_store if isinstance(plate, Plate) else None
+    if (
+      store is not None
+      and len(wells) == len(store)
+      and not any(well.tracker.is_disabled for well in wells)
+    ):
+      (store.commit if success else store.rollback)()
+      return
+
+    for well in wells:
+      if not well.tracker.is_disabled:
+        (well.tracker.commit if success else well.tracker.rollback)()
+
   async def aspirate96(
     self,
     resource: Union[Plate, Container, List[Well]],
@@ -1589,9 +1774,8 @@ class LiquidHandler(Resource, Machine):
     try:
       await self.backend.aspirate96(aspiration=aspiration, **backend_kwargs)
     except Exception as error:
-      for channel, well in zip(self.head96.values(), wells):
-        if does_volume_tracking() and not well.tracker.is_disabled:
-          well.tracker.rollback()
+      self._commit_or_rollback_wells(wells, success=False)
+      for channel in self.head96.values():
         channel.get_tip().tracker.rollback()
       self._trigger_callback(
         "aspirate96",
@@ -1601,9 +1785,8 @@ class LiquidHandler(Resource, Machine):
         **backend_kwargs,
       )
     else:
-      for channel, well in zip(self.head96.values(), wells):
-        if does_volume_tracking() and not well.tracker.is_disabled:
-          well.tracker.commit()
+      self._commit_or_rollback_wells(wells, success=True)
+      for channel in self.head96.values():
         channel.get_tip().tracker.commit()
       self._trigger_callback(
         "aspirate96",
@@ -1733,9 +1916,8 @@ class LiquidHandler(Resource, Machine):
     try:
       await self.backend.dispense96(dispense=dispense, **backend_kwargs)
     except Exception as error:
-      for channel, well in zip(self.head96.values(), wells):
-        if does_volume_tracking() and not well.tracker.is_disabled:
-          well.tracker.rollback()
+      self._commit_or_rollback_wells(wells, success=False)
+      for channel in self.head96.values():
         channel.get_tip().tracker.rollback()
 
       self._trigger_callback(
@@ -1746,9 +1928,8 @@ class LiquidHandler(Resource, Machine):
         **backend_kwargs,
       )
     else:
-      for channel, well in zip(self.head96.values(), wells):
-        if does_volume_tracking() and not well.tracker.is_disabled:
-          well.tracker.commit()
+      self._commit_or_rollback_wells(wells, success=True)
+      for channel in self.head96.values():
         channel.get_tip().tracker.commit()
 
       self._trigger_callback(
@@ -1898,32 +2079,24 @@ class LiquidHandler(Resource, Machine):
       # if we are moving a plate, we may need to adjust based on the pedestal size
       # and plate geometry
       if isinstance(resource, Plate):
-        # Sanity check for equal well clearances / dz
-        well_dz_set = {
-          round(well.location.z, 2)
-          for well in resource.get_all_children()
-          if well.category == "well" and well.location is not None
-        }
-        assert len(well_dz_set) == 1, "All wells must have the same dz"
-        well_dz = well_dz_set.pop()
         # Plate "sinking" logic based on well dz to pedestal relationship
         # 1. no pedestal
         # 2. pedestal taller than plate.well.dz
         # 3. pedestal shorter than plate.well.dz
         pedestal_size_z = abs(destination.pedestal_size_z)
-        z_sinking_depth = min(pedestal_size_z, well_dz)
+        z_sinking_depth = min(pedestal_size_z, resource.get_well_dz())
         correction_anchor = Coordinate(0, 0, -z_sinking_depth)
         to_location += correction_anchor
     elif isinstance(destination, PlateAdapter):
       if not isinstance(resource, Plate):
         raise ValueError("Only plates can be moved to a PlateAdapter")
       # Calculate location adjustment of Plate based on PlateAdapter geometry
-      adjusted_plate_anchor = destination.compute_plate_location(
-        resource.rotated(z=relative_rotation)
-      )
+      with resource.temporarily_rotated(z=relative_rotation) as rotated_resource:
+        adjusted_plate_anchor = destination.compute_plate_location(rotated_resource)
       to_location = destination.get_absolute_location() + adjusted_plate_anchor
     elif isinstance(destination, ResourceHolder):
-      x = destination.get_default_child_location(resource.rotated(z=relative_rotation))
+      with resource.temporarily_rotated(z=relative_rotation) as rotated_resource:
+        x = destination.get_default_child_location(rotated_resource)
       to_location = destination.get_absolute_location() + x
     elif isinstance(destination, Plate) and isinstance(resource, Lid):
       lid = resource
@@ -2242,8 +2415,7 @@ class LiquidHandler(Resource, Machine):
       path: The path to the file to load from.
     """
 
-    with open(path, "r", encoding="utf-8") as f:
-      return cls.deserialize(json.load(f))
+    return cls.deserialize(json_codec.load_file(path))
 
   async def prepare_for_manual_channel_operation(self, channel: int):
     assert 0 <= channel < self.backend.num_channels, f"Invalid channel: {channel}"
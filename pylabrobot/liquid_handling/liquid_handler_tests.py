@@ -22,6 +22,7 @@ from pylabrobot.resources import (
   Lid,
   Liquid,
   Plate,
+  Resource,
   ResourceNotFoundError,
   ResourceStack,
   TipRack,
@@ -239,6 +240,16 @@ class TestLiquidHandlerLayout(unittest.IsolatedAsyncioTestCase):
       Coordinate(x=568.3, y=337.7, z=186.15),
     )
 
+  async def test_move_plate_does_not_copy(self):
+    plt_car = PLT_CAR_L5AC_A00(name="plate carrier")
+    plt_car[0] = plate = Cor_96_wellplate_360ul_Fb(name="plate")
+    self.deck.assign_child_resource(plt_car, rails=21)
+
+    with unittest.mock.patch.object(Resource, "copy", side_effect=AssertionError("copied")):
+      await self.lh.move_plate(plate, plt_car[2], drop_direction=GripDirection.LEFT)
+    self.assertIs(plt_car[2].resource, plate)
+    self.assertEqual(plate.rotation.z, 270)
+
   async def test_move_plate_free(self):
     plt_car = PLT_CAR_L5AC_A00(name="plate carrier")
     plt_car[0] = plate = Cor_96_wellplate_360ul_Fb(name="plate")
@@ -429,6 +440,29 @@ class TestLiquidHandlerLayout(unittest.IsolatedAsyncioTestCase):
         plate.rotation.z = 0
         lid.rotation.z = 0
 
+  async def test_backend_resource_callbacks(self):
+    tip_car = TIP_CAR_480_A00(name="tip_carrier")
+    self.deck.assign_child_resource(tip_car, rails=1)
+    await self.lh.setup()
+    setup_commands = [c["args"][0].name for c in self.backend.commands_received]
+    self.assertEqual(setup_commands, ["deck"] + [c.name for c in self.deck.children])
+    self.backend.commands_received = []
+
+    # callbacks are delivered in order, without starting a thread per callback
+    with unittest.mock.patch("threading.Thread", side_effect=AssertionError("new thread")):
+      plt_car = PLT_CAR_L5AC_A00(name="plate carrier")
+      self.deck.assign_child_resource(plt_car, rails=21)
+      plt_car[0] = Cor_96_wellplate_360ul_Fb(name="plate")
+      plt_car.unassign()
+    self.assertEqual(
+      [(c["command"], c["args"][0]) for c in self.backend.commands_received],
+      [
+        ("assigned_resource_callback", plt_car),
+        ("assigned_resource_callback", plt_car[0].resource),
+        ("unassigned_resource_callback", "plate carrier"),
+      ],
+    )
+
   def test_serialize(self):
     serialized = self.lh.serialize()
     deserialized = LiquidHandler.deserialize(serialized)
@@ -984,6 +1018,16 @@ class TestLiquidHandlerCommands(unittest.IsolatedAsyncioTestCase):
 
       set_strictness(Strictness.WARN)
 
+  async def test_check_args_signature_is_cached(self):
+    kwargs = {"does_not_exist": True}
+    self.lh._check_args(self.backend.aspirate, kwargs, {"ops", "use_channels"}, Strictness.STRICT)
+    with unittest.mock.patch("inspect.signature", side_effect=AssertionError("not cached")):
+      for _ in range(10):
+        extras = self.lh._check_args(
+          self.backend.aspirate, kwargs, {"ops", "use_channels"}, Strictness.STRICT
+        )
+        self.assertEqual(extras, set())  # SaverBackend.aspirate accepts **kwargs
+
   async def test_save_state(self):
     set_volume_tracking(enabled=True)
 
@@ -1009,6 +1053,16 @@ class TestLiquidHandlerCommands(unittest.IsolatedAsyncioTestCase):
 
     set_volume_tracking(enabled=False)
 
+  async def test_save_state_compressed(self):
+    state_filename = tempfile.mktemp()
+    self.lh.deck.save_state_to_file(fn=state_filename, compress=True)
+    with open(state_filename, "rb") as f:
+      self.assertEqual(f.read(2), b"\x1f\x8b")  # gzip
+
+    self.tip_rack.get_item("A1").tracker.remove_tip()
+    self.lh.deck.load_state_from_file(fn=state_filename)
+    self.assertTrue(self.tip_rack.get_item("A1").tracker.has_tip)
+
 
 class TestLiquidHandlerVolumeTracking(unittest.IsolatedAsyncioTestCase):
   async def asyncSetUp(self):
@@ -1045,6 +1099,19 @@ class TestLiquidHandlerVolumeTracking(unittest.IsolatedAsyncioTestCase):
     liquids_now = [self.plate.get_item(i).tracker.liquids for i in range(8)]
     self.assertEqual(liquids_now, initial_liquids)
 
+  async def test_aspirate_dispense96_volume_store(self):
+    store = self.plate.use_volume_store()
+    self.plate.set_well_liquids((Liquid.WATER, 50))
+    await self.lh.pick_up_tips96(self.tip_rack)
+
+    await self.lh.aspirate96(self.plate, volume=20)
+    self.assertEqual(store.get_used_volumes(), [30] * 96)
+    self.assertEqual(self.plate.get_well("H12").tracker.liquids, [(Liquid.WATER, 30)])
+
+    await self.lh.dispense96(self.plate, volume=20)
+    self.assertEqual(store.get_used_volumes(), [50] * 96)
+    self.assertEqual(self.plate.get_well("A1").tracker.liquids, [(Liquid.WATER, 50)])
+
   async def test_channel_1_liquid_tracking(self):
     self.plate.get_item("A1").tracker.set_liquids([(Liquid.WATER, 10)])
     with self.lh.use_channels([1]):
@@ -0,0 +1,174 @@
+"""Plan many independent liquid transfers as a small number of multi-channel operations."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+  from pylabrobot.resources import Container
+
+
+# Minimum distance between two channels in the y direction, in 0.1mm. Same as the check in
+# `HamiltonLiquidHandler._ops_to_fw_positions`.
+MIN_CHANNEL_SPACING = 90
+
+
+@dataclass(frozen=True)
+class Transfer:
+  """A single transfer of `volume` uL from `source` to `target`."""
+
+  source: Container
+  target: Container
+  volume: float
+
+
+@dataclass
+class ChannelTransfers:
+  """The work of a single channel in a :class:`TransferBatch`: one aspiration from `source`,
+  followed by one dispense for each item in `dispenses`."""
+
+  source: Container
+  dispenses: List[Tuple[Container, float]] = field(default_factory=list)
+
+  @property
+  def volume(self) -> float:
+    """The total volume aspirated by this channel."""
+    return sum(vol for _, vol in self.dispenses)
+
+
+@dataclass
+class TransferBatch:
+  """A multi-channel aspiration, followed by one or more multi-channel dispenses.
+
+  `channels[i]` is the index, in the list of channels available to the planner, of the channel that
+  performs `channel_transfers[i]`. Channels are sorted from back to front.
+  """
+
+  channel_transfers: List[ChannelTransfers]
+  channels: List[int] = field(default_factory=list)
+
+  @property
+  def num_dispense_rounds(self) -> int:
+    return max(len(ct.dispenses) for ct in self.channel_transfers)
+
+  def dispense_round(self, i: int) -> List[Tuple[int, Container, float]]:
+    """The (channel, target, volume) triples dispensed in the `i`-th dispense round."""
+    return [
+      (channel, *ct.dispenses[i])
+      for channel, ct in zip(self.channels, self.channel_transfers)
+      if len(ct.dispenses) > i
+    ]
+
+
+def _position(container: Container) -> Tuple[int, int]:
+  """The position of the center of `container`, in 0.1mm, like the firmware positions."""
+  location = container.get_absolute_location(x="c", y="c", z="b")
+  return round(location.x * 10), round(location.y * 10)
+
+
+def _can_run_in_parallel(positions: Sequence[Tuple[int, int]]) -> bool:
+  """Whether channels (sorted from back to front) can visit `positions` in a single operation: on
+  the same column, channels must be at least `MIN_CHANNEL_SPACING` apart, back to front."""
+
+  for i, (x1, y1) in enumerate(positions):
+    for x2, y2 in positions[i + 1 :]:
+      if x1 == x2 and y1 - y2 < MIN_CHANNEL_SPACING:
+        return False
+  return True
+
+
+def _fits(
+  batch: List[ChannelTransfers],
+  positions: Dict[int, Tuple[int, int]],
+) -> bool:
+  """Check whether all operations (the aspiration and all dispense rounds) of a candidate batch
+  can be executed in parallel."""
+
+  if not _can_run_in_parallel([positions[id(ct.source)] for ct in batch]):
+    return False
+  num_rounds = max(len(ct.dispenses) for ct in batch)
+  for i in range(num_rounds):
+    targets = [positions[id(ct.dispenses[i][0])] for ct in batch if len(ct.dispenses) > i]
+    if not _can_run_in_parallel(targets):
+      return False
+  return True
+
+
+def plan_transfers(
+  transfers: Sequence[Transfer],
+  num_channels: int,
+  max_volume: Optional[float] = None,
+  multi_dispense: bool = True,
+) -> List[TransferBatch]:
+  """Plan transfers as a (small) number of multi-channel aspirations and dispenses.
+
+  Transfers that exceed `max_volume` are split. When `multi_dispense` is `True`, transfers from the
+  same source share a single aspiration as long as the total volume fits in the tip. The resulting
+  per-channel work is then greedily packed into batches of at most `num_channels` channels, such
+  that every aspiration and every dispense round respects the minimum channel spacing on shared
+  columns.
+
+  Transfers are assumed to be independent: they are not necessarily executed in the order they are
+  given. Do not use this for eg. serial dilutions, where a target is the source of a later transfer.
+
+  Args:
+    transfers: The transfers to plan. All sources and targets must have an absolute location.
+    num_channels: The number of channels available.
+    max_volume: The maximum volume a single channel can hold, eg. the tip volume. If `None`, there
+      is no limit.
+    multi_dispense: Whether a single aspiration may be dispensed into multiple targets.
+
+  Returns:
+    The batches, in execution order.
+  """
+
+  if num_channels < 1:
+    raise ValueError("Need at least one channel.")
+  if max_volume is not None and max_volume <= 0:
+    raise ValueError("max_volume must be positive.")
+
+  # Split transfers that do not fit in a single channel.
+  chunks: List[Transfer] = []
+  for transfer in transfers:
+    if transfer.volume < 0:
+      raise ValueError(f"Volume must be non-negative, got {transfer.volume}.")
+    n = 1 if max_volume is None else max(1, math.ceil(transfer.volume / max_volume))
+    chunks.extend([Transfer(transfer.source, transfer.target, transfer.volume / n)] * n)
+
+  # Group chunks into per-channel work, combining chunks from the same source when allowed.
+  channel_transfers: List[ChannelTransfers] = []
+  open_by_source: Dict[int, ChannelTransfers] = {}
+  for chunk in chunks:
+    ct = open_by_source.get(id(chunk.source)) if multi_dispense else None
+    if ct is None or (max_volume is not None and ct.volume + chunk.volume > max_volume):
+      ct = ChannelTransfers(source=chunk.source)
+      channel_transfers.append(ct)
+      open_by_source[id(chunk.source)] = ct
+    ct.dispenses.append((chunk.target, chunk.volume))
+
+  positions: Dict[int, Tuple[int, int]] = {}
+  for ct in channel_transfers:
+    for container in [ct.source] + [target for target, _ in ct.dispenses]:
+      if id(container) not in positions:
+        positions[id(container)] = _position(container)
+
+  # Greedily pack channel work into batches (first fit). Channels are sorted back to front within a
+  # batch, so process back to front, column by column.
+  channel_transfers.sort(key=lambda ct: (positions[id(ct.source)][0], -positions[id(ct.source)][1]))
+  batches: List[List[ChannelTransfers]] = []
+  for ct in channel_transfers:
+    for batch in batches:
+      if len(batch) == num_channels:
+        continue
+      candidate = sorted(batch + [ct], key=lambda c: -positions[id(c.source)][1])
+      if _fits(candidate, positions):
+        batch[:] = candidate
+        break
+    else:
+      batches.append([ct])
+
+  return [
+    TransferBatch(channel_transfers=batch, channels=list(range(len(batch)))) for batch in batches
+  ]
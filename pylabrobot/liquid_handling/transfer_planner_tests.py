@@ -0,0 +1,145 @@
+import unittest
+
+from pylabrobot.liquid_handling import LiquidHandler
+from pylabrobot.liquid_handling.backends import SaverBackend
+from pylabrobot.liquid_handling.transfer_planner import Transfer, plan_transfers
+from pylabrobot.resources import Coordinate, Cor_96_wellplate_360ul_Fb, Deck
+from pylabrobot.resources.hamilton import STF, STARLetDeck
+
+
+class TestPlanTransfers(unittest.TestCase):
+  def setUp(self):
+    self.deck = Deck()
+    self.source = Cor_96_wellplate_360ul_Fb(name="source")
+    self.target = Cor_96_wellplate_360ul_Fb(name="target")
+    self.deck.assign_child_resource(self.source, location=Coordinate(100, 100, 0))
+    self.deck.assign_child_resource(self.target, location=Coordinate(300, 100, 0))
+
+  def test_column_to_column(self):
+    transfers = [
+      Transfer(s, t, 10) for s, t in zip(self.source["A1:H1"], self.target["A1:H1"])
+    ]
+    batches = plan_transfers(transfers, num_channels=8)
+    self.assertEqual(len(batches), 1)
+    batch = batches[0]
+    self.assertEqual(batch.channels, list(range(8)))
+    self.assertEqual([ct.source for ct in batch.channel_transfers], self.source["A1:H1"])
+    self.assertEqual(batch.num_dispense_rounds, 1)
+    self.assertEqual(
+      [target for _, target, _ in batch.dispense_round(0)],
+      self.target["A1:H1"],
+    )
+
+  def test_more_transfers_than_channels(self):
+    transfers = [Transfer(s, t, 10) for s, t in zip(self.source["A1:H2"], self.target["A1:H2"])]
+    batches = plan_transfers(transfers, num_channels=8)
+    self.assertEqual(len(batches), 2)
+    self.assertTrue(all(len(batch.channel_transfers) == 8 for batch in batches))
+
+  def test_split_large_volume(self):
+    batches = plan_transfers(
+      [Transfer(self.source.get_well("A1"), self.target.get_well("A1"), 250)],
+      num_channels=8,
+      max_volume=100,
+    )
+    chunks = [vol for batch in batches for ct in batch.channel_transfers for _, vol in ct.dispenses]
+    self.assertEqual(len(chunks), 3)
+    self.assertAlmostEqual(sum(chunks), 250)
+    self.assertTrue(all(vol <= 100 for vol in chunks))
+
+  def test_multi_dispense(self):
+    source = self.source.get_well("A1")
+    transfers = [Transfer(source, t, 10) for t in self.target["A1:A4"]]
+    batches = plan_transfers(transfers, num_channels=8)
+    self.assertEqual(len(batches), 1)
+    self.assertEqual(len(batches[0].channel_transfers), 1)
+    self.assertEqual(batches[0].channel_transfers[0].volume, 40)
+    self.assertEqual(batches[0].num_dispense_rounds, 4)
+
+    batches = plan_transfers(transfers, num_channels=8, multi_dispense=False)
+    self.assertEqual(sum(len(batch.channel_transfers) for batch in batches), 4)
+    self.assertTrue(all(batch.num_dispense_rounds == 1 for batch in batches))
+
+  def test_channel_spacing(self):
+    # Two channels can not visit the same well at the same time, so two batches.
+    transfers = [
+      Transfer(self.source.get_well("A1"), self.target.get_well("A1"), 10),
+      Transfer(self.source.get_well("A1"), self.target.get_well("A2"), 10),
+    ]
+    self.assertEqual(len(plan_transfers(transfers, num_channels=8, multi_dispense=False)), 2)
+
+    # Same for the targets.
+    transfers = [
+      Transfer(self.source.get_well("A1"), self.target.get_well("A1"), 10),
+      Transfer(self.source.get_well("B1"), self.target.get_well("A1"), 10),
+    ]
+    self.assertEqual(len(plan_transfers(transfers, num_channels=8)), 2)
+
+    # Different rows in the same column fit in a single batch, ordered back to front.
+    transfers = [
+      Transfer(self.source.get_well("H1"), self.target.get_well("H1"), 10),
+      Transfer(self.source.get_well("A1"), self.target.get_well("A1"), 10),
+    ]
+    batches = plan_transfers(transfers, num_channels=8)
+    self.assertEqual(len(batches), 1)
+    self.assertEqual(
+      [ct.source for ct in batches[0].channel_transfers],
+      [self.source.get_well("A1"), self.source.get_well("H1")],
+    )
+
+  def test_invalid_arguments(self):
+    with self.assertRaises(ValueError):
+      plan_transfers([], num_channels=0)
+    with self.assertRaises(ValueError):
+      plan_transfers(
+        [Transfer(self.source.get_well("A1"), self.target.get_well("A1"), -1)], num_channels=8
+      )
+
+
+class TestTransferMany(unittest.IsolatedAsyncioTestCase):
+  async def asyncSetUp(self):
+    self.backend = SaverBackend(num_channels=8)
+    self.deck = STARLetDeck()
+    self.lh = LiquidHandler(backend=self.backend, deck=self.deck)
+    self.tip_rack = STF(name="tip_rack")
+    self.source = Cor_96_wellplate_360ul_Fb(name="source")
+    self.target = Cor_96_wellplate_360ul_Fb(name="target")
+    self.deck.assign_child_resource(self.tip_rack, location=Coordinate(0, 0, 0))
+    self.deck.assign_child_resource(self.source, location=Coordinate(200, 100, 0))
+    self.deck.assign_child_resource(self.target, location=Coordinate(400, 100, 0))
+    await self.lh.setup()
+    await self.lh.pick_up_tips(self.tip_rack["A1:H1"])
+    self.backend.clear()
+
+  async def test_transfer_many(self):
+    await self.lh.transfer_many(
+      sources=self.source["A1:H1"],
+      targets=self.target["A1:H1"],
+      vols=[10] * 8,
+    )
+    aspirations = self.backend.get_commands_for_event("aspirate")
+    dispenses = self.backend.get_commands_for_event("dispense")
+    self.assertEqual(len(aspirations), 1)
+    self.assertEqual(len(dispenses), 1)
+    self.assertEqual(aspirations[0]["kwargs"]["use_channels"], list(range(8)))
+    self.assertEqual([op.resource for op in aspirations[0]["kwargs"]["ops"]], self.source["A1:H1"])
+    self.assertEqual([op.resource for op in dispenses[0]["kwargs"]["ops"]], self.target["A1:H1"])
+
+  async def test_transfer_many_splits_by_tip_volume(self):
+    await self.lh.transfer_many(
+      sources=[self.source.get_well("A1")],
+      targets=[self.target.get_well("A1")],
+      vols=[800],
+      use_channels=[0],
+    )
+    aspirations = self.backend.get_commands_for_event("aspirate")
+    self.assertEqual(len(aspirations), 3)  # 360 uL tips
+    self.assertAlmostEqual(sum(cmd["kwargs"]["ops"][0].volume for cmd in aspirations), 800)
+
+  async def test_transfer_many_length_mismatch(self):
+    with self.assertRaises(ValueError):
+      await self.lh.transfer_many(
+        sources=self.source["A1:B1"],
+        targets=self.target["A1"],
+        vols=[10, 10],
+      )
@@ -1,11 +1,15 @@
 from abc import ABC, ABCMeta, abstractmethod
 
-from pylabrobot.utils.object_parsing import find_subclass
+from pylabrobot.utils.object_parsing import find_subclass, register_subclass
 
 
 class MachineBackend(ABC):
   """Abstract class for machine backends."""
 
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    register_subclass(MachineBackend, cls)  # so that `deserialize` can find the class by name
+
   @abstractmethod
   async def setup(self):
     pass
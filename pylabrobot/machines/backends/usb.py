@@ -1,9 +1,13 @@
+import asyncio
+import collections
 import logging
-import time
+import queue
+import threading
 from abc import ABCMeta, abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Deque, List, Optional, Tuple
 
 from pylabrobot.machines.backends.machine import MachineBackend
+from pylabrobot.machines.backends.usb_transport import USBTransport
 
 try:
   import libusb_package
@@ -24,7 +28,13 @@ logger = logging.getLogger("pylabrobot")
 
 class USBBackend(MachineBackend, metaclass=ABCMeta):
   """An abstract class for liquid handler backends that talk over a USB cable. Provides read/write
-  functionality, including timeout handling."""
+  functionality, including timeout handling.
+
+  All USB I/O runs on the threads of a :class:`~pylabrobot.machines.backends.usb_transport.
+  USBTransport`: reads are posted continuously and every received message is passed to
+  :meth:`_message_received` as soon as it arrives. By default, messages are queued for
+  :meth:`read` and :meth:`read_async`.
+  """
 
   @abstractmethod
   def __init__(
@@ -69,8 +79,55 @@ class USBBackend(MachineBackend, metaclass=ABCMeta):
     self.read_endpoint: Optional[usb.core.Endpoint] = None
     self.write_endpoint: Optional[usb.core.Endpoint] = None
 
+    self._transport: Optional[USBTransport] = None
+    self._received: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+    self._read_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = (
+      collections.deque()
+    )
+    self._read_waiters_lock = threading.Lock()
+
+  def _get_transport(self) -> USBTransport:
+    """Get the transport for the connected device, starting it if needed."""
+
+    assert (
+      self.dev is not None and self.read_endpoint is not None and self.write_endpoint is not None
+    ), "Device not connected."
+
+    if self._transport is None or self._transport.dev is not self.dev:
+      if self._transport is not None:
+        self._transport.stop()
+      self._transport = USBTransport(
+        dev=self.dev,
+        read_endpoint=self.read_endpoint,
+        write_endpoint=self.write_endpoint,
+        on_message=self._message_received,
+        packet_read_timeout=self.packet_read_timeout,
+      )
+      self._transport.start()
+    return self._transport
+
+  def _message_received(self, data: bytearray) -> None:
+    """Called on the USB reader thread for every message received from the device. The default
+    implementation hands the message to the oldest pending :meth:`read_async`, or queues it for
+    :meth:`read`."""
+
+    with self._read_waiters_lock:
+      while len(self._read_waiters) > 0:
+        loop, fut = self._read_waiters.popleft()
+        if not fut.done():
+          loop.call_soon_threadsafe(self._deliver, fut, data)
+          return
+      self._received.put(data)
+
+  def _deliver(self, fut: asyncio.Future, data: bytearray) -> None:
+    if fut.done():  # the reader timed out in the meantime, give the message to the next one.
+      self._message_received(data)
+    else:
+      fut.set_result(data)
+
   def write(self, data: str, timeout: Optional[int] = None):
-    """Write data to the device.
+    """Write data to the device, blocking until it is written. Prefer :meth:`write_async` from
+    coroutines.
 
     Args:
       data: The data to write.
@@ -78,73 +135,65 @@ class USBBackend(MachineBackend, metaclass=ABCMeta):
         (specified by the `write_timeout` attribute).
     """
 
-    assert self.dev is not None and self.read_endpoint is not None, "Device not connected."
-
     if timeout is None:
       timeout = self.write_timeout
+    self._get_transport().submit_write(data, timeout).result()
 
-    # write command to endpoint
-    self.dev.write(self.write_endpoint, data, timeout=timeout)
-    logger.info("Sent command: %s", data)
-
-  def _read_packet(self) -> Optional[bytearray]:
-    """Read a packet from the machine.
+  async def write_async(self, data: str, timeout: Optional[int] = None):
+    """Write data to the device without blocking the event loop.
 
-    Returns:
-      A string containing the decoded packet, or None if no packet was received.
+    Args:
+      data: The data to write.
+      timeout: The timeout for writing to the device in seconds. If `None`, use the default timeout
+        (specified by the `write_timeout` attribute).
     """
 
-    assert self.dev is not None and self.read_endpoint is not None, "Device not connected."
-
-    try:
-      res = self.dev.read(
-        self.read_endpoint,
-        self.read_endpoint.wMaxPacketSize,
-        timeout=int(self.packet_read_timeout * 1000),  # timeout in ms
-      )
-
-      if res is not None:
-        return bytearray(res)  # convert res into text
-      return None
-    except usb.core.USBError:
-      # No data available (yet), this will give a timeout error. Don't reraise.
-      return None
+    if timeout is None:
+      timeout = self.write_timeout
+    await self._get_transport().write(data, timeout)
 
   def read(self, timeout: Optional[int] = None) -> bytearray:
-    """Read a response from the device.
+    """Read a message from the device, blocking until one is received. Prefer :meth:`read_async`
+    from coroutines.
 
     Args:
       timeout: The timeout for reading from the device in seconds. If `None`, use the default
         timeout (specified by the `read_timeout` attribute).
     """
 
-    assert self.read_endpoint is not None, "Device not connected."
-
+    self._get_transport()
     if timeout is None:
       timeout = self.read_timeout
 
-    # Attempt to read packets until timeout, or when we identify the right id.
-    timeout_time = time.time() + timeout
+    try:
+      return self._received.get(timeout=timeout)
+    except queue.Empty:
+      raise TimeoutError("Timeout while reading.")
+
+  async def read_async(self, timeout: Optional[int] = None) -> bytearray:
+    """Read a message from the device without blocking the event loop.
 
-    while time.time() < timeout_time:
-      # read response from endpoint, and keep reading until the packet is smaller than the max
-      # packet size: if the packet is that size, it means that there may be more data to read.
-      resp = bytearray()
-      last_packet: Optional[bytearray] = None
-      while True:  # read while we have data, and while the last packet is the max size.
-        last_packet = self._read_packet()
-        if last_packet is not None:
-          resp += last_packet
-        if last_packet is None or len(last_packet) != self.read_endpoint.wMaxPacketSize:
-          break
+    Args:
+      timeout: The timeout for reading from the device in seconds. If `None`, use the default
+        timeout (specified by the `read_timeout` attribute).
+    """
 
-      if resp == "":
-        continue
+    self._get_transport()
+    if timeout is None:
+      timeout = self.read_timeout
 
-      logger.debug("Received data: %s", resp)
-      return resp
+    loop = asyncio.get_running_loop()
+    with self._read_waiters_lock:
+      try:
+        return self._received.get_nowait()
+      except queue.Empty:
+        fut = loop.create_future()
+        self._read_waiters.append((loop, fut))
 
-    raise TimeoutError("Timeout while reading.")
+    try:
+      return await asyncio.wait_for(fut, timeout=timeout)
+    except asyncio.TimeoutError:
+      raise TimeoutError("Timeout while reading.")
 
   def get_available_devices(self) -> List["usb.core.Device"]:
     """Get a list of available devices that match the specified vendor and product IDs, and serial
@@ -238,15 +287,24 @@ class USBBackend(MachineBackend, metaclass=ABCMeta):
     )
 
     # Empty the read buffer.
-    while self._read_packet() is not None:
+    assert self.read_endpoint is not None
+    try:
+      while True:
+        self.dev.read(self.read_endpoint, self.read_endpoint.wMaxPacketSize, timeout=100)
+    except usb.core.USBError:
       pass
 
+    self._get_transport()
+
   async def stop(self):
     """Close the USB connection to the machine."""
 
     if self.dev is None:
       raise ValueError("USB device was not connected.")
     logging.warning("Closing connection to USB device.")
+    if self._transport is not None:
+      self._transport.stop()
+      self._transport = None
     usb.util.dispose_resources(self.dev)
     self.dev = None
 
@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+
+from pylabrobot.machines.backends.usb import USBBackend
+from tests.usb import LoopbackDev, MockEndpoint
+
+
+class LoopbackUSBBackend(USBBackend):
+  def __init__(self, dev: LoopbackDev, read_timeout: int = 2):
+    super().__init__(id_vendor=0, id_product=0, packet_read_timeout=1, read_timeout=read_timeout)
+    self.dev = dev
+    self.read_endpoint = MockEndpoint()
+    self.write_endpoint = MockEndpoint()
+
+  async def stop(self):
+    if self._transport is not None:
+      self._transport.stop()
+      self._transport = None
+
+
+class TestUSBBackend(unittest.IsolatedAsyncioTestCase):
+  async def asyncSetUp(self):
+    self.dev = LoopbackDev()
+    self.backend = LoopbackUSBBackend(self.dev)
+
+  async def asyncTearDown(self):
+    await self.backend.stop()
+
+  async def test_write_read_async(self):
+    await self.backend.write_async("hello")
+    self.assertEqual(await self.backend.read_async(), bytearray(b"hello"))
+    self.assertEqual(self.dev.written, [b"hello"])
+
+  async def test_read_sync(self):
+    self.backend.write("hello")
+    self.assertEqual(self.backend.read(), bytearray(b"hello"))
+
+  async def test_multi_packet_message(self):
+    message = "x" * 64 + "y" * 10
+    await self.backend.write_async(message)
+    self.assertEqual(await self.backend.read_async(), bytearray(message.encode()))
+
+    message = "z" * 128  # terminated by a zero length packet
+    await self.backend.write_async(message)
+    self.assertEqual(await self.backend.read_async(), bytearray(message.encode()))
+
+  async def test_read_timeout(self):
+    with self.assertRaises(TimeoutError):
+      await self.backend.read_async(timeout=0.1)  # type: ignore[arg-type]
+
+    # a message that arrives after a read timed out is not lost
+    self.dev.inject(b"late")
+    self.assertEqual(await self.backend.read_async(), bytearray(b"late"))
+
+  async def test_write_does_not_block_event_loop(self):
+    ticks = 0
+
+    async def tick():
+      nonlocal ticks
+      while True:
+        ticks += 1
+        await asyncio.sleep(0)
+
+    ticker = asyncio.create_task(tick())
+    for _ in range(20):
+      await self.backend.write_async("ping")
+      await self.backend.read_async()
+    ticker.cancel()
+    self.assertGreater(ticks, 20)
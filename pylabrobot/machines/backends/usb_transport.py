@@ -0,0 +1,195 @@
+import asyncio
+import concurrent.futures
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
+
+try:
+  import usb.core
+
+  USE_USB = True
+except ImportError:
+  USE_USB = False
+
+if TYPE_CHECKING:
+  import usb.core
+
+
+logger = logging.getLogger("pylabrobot")
+
+
+# How long a read waits for the first packet of a message, in seconds. Reads are posted back to
+# back, so this only determines how quickly the reader thread notices that the transport was
+# stopped.
+IDLE_READ_TIMEOUT = 0.1
+
+MessageCallback = Callable[[bytearray], None]
+
+
+class USBTransport:
+  """Runs the blocking PyUSB calls for a single device on dedicated I/O threads.
+
+  Writes are submitted to a queue and executed by a writer thread, so that submitting a write never
+  blocks the caller. Each write has a future that is completed when the data was written.
+
+  A reader thread keeps a read posted on the read endpoint at all times. Every message that is
+  received is passed to `on_message` immediately, on the reader thread. A message is a sequence of
+  packets that ends with a packet smaller than the maximum packet size.
+  """
+
+  def __init__(
+    self,
+    dev: "usb.core.Device",
+    read_endpoint: "usb.core.Endpoint",
+    write_endpoint: "usb.core.Endpoint",
+    on_message: MessageCallback,
+    packet_read_timeout: float,
+  ):
+    """Create a transport. The I/O threads are started by :meth:`start`.
+
+    Args:
+      dev: The (connected) device.
+      read_endpoint: The endpoint to read from.
+      write_endpoint: The endpoint to write to.
+      on_message: Called on the reader thread for every message that is received.
+      packet_read_timeout: The timeout for reading the next packet of a message that spans more than
+        one packet, in seconds.
+    """
+
+    self.dev = dev
+    self.read_endpoint = read_endpoint
+    self.write_endpoint = write_endpoint
+    self.on_message = on_message
+    self.packet_read_timeout = packet_read_timeout
+
+    self._write_queue: "queue.SimpleQueue[Optional[Tuple[Any, int, concurrent.futures.Future]]]" = (
+      queue.SimpleQueue()
+    )
+    self._stopped = threading.Event()
+    self._reader: Optional[threading.Thread] = None
+    self._writer: Optional[threading.Thread] = None
+
+  @property
+  def running(self) -> bool:
+    return self._reader is not None
+
+  def start(self) -> None:
+    """Start the reader and writer threads."""
+
+    if self.running:
+      return
+    self._stopped.clear()
+    self._reader = threading.Thread(target=self._read_forever, name="usb-reader", daemon=True)
+    self._writer = threading.Thread(target=self._write_forever, name="usb-writer", daemon=True)
+    self._reader.start()
+    self._writer.start()
+
+  def stop(self) -> None:
+    """Stop the I/O threads. Pending writes fail with a `RuntimeError`."""
+
+    if not self.running:
+      return
+    self._stopped.set()
+    self._write_queue.put(None)
+    for thread in (self._reader, self._writer):
+      if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout=max(self.packet_read_timeout, IDLE_READ_TIMEOUT) + 1)
+    self._reader = self._writer = None
+
+    while True:
+      try:
+        item = self._write_queue.get_nowait()
+      except queue.Empty:
+        break
+      if item is not None:
+        item[2].set_exception(RuntimeError("USB transport stopped."))
+
+  def submit_write(self, data: Any, timeout: float) -> concurrent.futures.Future:
+    """Submit data to be written. Safe to call from any thread.
+
+    Args:
+      data: The data to write.
+      timeout: The timeout for writing, in seconds.
+
+    Returns:
+      A future that completes with the number of bytes written.
+    """
+
+    fut: concurrent.futures.Future = concurrent.futures.Future()
+    if self._stopped.is_set() or not self.running:
+      fut.set_exception(RuntimeError("USB transport is not running."))
+      return fut
+    self._write_queue.put((data, int(timeout * 1000), fut))
+    return fut
+
+  async def write(self, data: Any, timeout: float) -> int:
+    """Write data without blocking the event loop."""
+    return await asyncio.wrap_future(self.submit_write(data, timeout))
+
+  def _write_forever(self) -> None:
+    while True:
+      item = self._write_queue.get()
+      if item is None:
+        return
+      data, timeout_ms, fut = item
+      if not fut.set_running_or_notify_cancel():
+        continue
+      try:
+        written = self.dev.write(self.write_endpoint, data, timeout=timeout_ms)
+      except Exception as e:
+        fut.set_exception(e)
+      else:
+        logger.info("Sent command: %s", data)
+        fut.set_result(written)
+
+  def _read_packet(self, timeout: float) -> Optional[bytearray]:
+    try:
+      res = self.dev.read(
+        self.read_endpoint,
+        self.read_endpoint.wMaxPacketSize,
+        timeout=int(timeout * 1000),
+      )
+    except Exception as e:
+      if USE_USB and isinstance(e, usb.core.USBError):
+        # No data available (yet), this will give a timeout error. Don't reraise.
+        return None
+      raise
+    if res is None or len(res) == 0:
+      return None
+    return bytearray(res)
+
+  def _read_forever(self) -> None:
+    logger.debug("Starting USB reader thread...")
+    max_packet_size = self.read_endpoint.wMaxPacketSize
+
+    while not self._stopped.is_set():
+      try:
+        packet = self._read_packet(timeout=IDLE_READ_TIMEOUT)
+        if packet is None:
+          # Real devices block until the timeout expires, but some devices return immediately.
+          self._stopped.wait(0.001)
+          continue
+
+        # Keep reading while the last packet has the maximum size: there may be more data.
+        message = packet
+        while len(packet) == max_packet_size:
+          next_packet = self._read_packet(timeout=self.packet_read_timeout)
+          if next_packet is None:
+            break
+          packet = next_packet
+          message += packet
+      except Exception as e:
+        if self._stopped.is_set():
+          break
+        logger.warning("Error while reading from USB device: %s", e)
+        self._stopped.wait(IDLE_READ_TIMEOUT)
+        continue
+
+      logger.debug("Received data: %s", message)
+      try:
+        self.on_message(message)
+      except Exception:
+        logger.exception("Error while handling USB message.")
+
+    logger.debug("USB reader thread stopped.")
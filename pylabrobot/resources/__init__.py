@@ -1,68 +1,167 @@
-# labware manufacturers and suppliers
-from .agenbio import *
-from .alpaqua import *
-from .azenta import *
-from .biorad import *
-from .boekel import *
-from .carrier import (
-  Carrier,
-  MFXCarrier,
-  PlateCarrier,
-  PlateHolder,
-  TipCarrier,
-  create_homogeneous_resources,
-  create_resources,
+from typing import TYPE_CHECKING
+
+from pylabrobot.utils.lazy_import import lazy_import
+
+# Submodules, including the labware catalogues of manufacturers and suppliers, are imported when
+# they are first used, see `lazy_import`. Keep this in sync with the imports below, which are for
+# type checkers.
+__getattr__, __dir__ = lazy_import(
+  __name__,
+  {
+    "Carrier": ".carrier",
+    "MFXCarrier": ".carrier",
+    "PlateCarrier": ".carrier",
+    "PlateHolder": ".carrier",
+    "TipCarrier": ".carrier",
+    "TroughCarrier": ".carrier",
+    "TubeCarrier": ".carrier",
+    "create_homogeneous_resources": ".carrier",
+    "create_resources": ".carrier",
+    "Container": ".container",
+    "Coordinate": ".coordinate",
+    "Deck": ".deck",
+    "ResourceNotFoundError": ".errors",
+    "ItemizedResource": ".itemized_resource",
+    "Liquid": ".liquid",
+    "PetriDish": ".petri_dish",
+    "PetriDishHolder": ".petri_dish",
+    "Lid": ".plate",
+    "Plate": ".plate",
+    "PlateAdapter": ".plate_adapter",
+    "Powder": ".powder",
+    "Resource": ".resource",
+    "ResourceHolder": ".resource_holder",
+    "ResourceStack": ".resource_stack",
+    "Rotation": ".rotation",
+    "BoundingBox": ".spatial_index",
+    "Tip": ".tip",
+    "TipInventory": ".tip_inventory",
+    "NestedTipRack": ".tip_rack",
+    "TipRack": ".tip_rack",
+    "TipSpot": ".tip_rack",
+    "TipTracker": ".tip_tracker",
+    "does_tip_tracking": ".tip_tracker",
+    "no_tip_tracking": ".tip_tracker",
+    "set_tip_tracking": ".tip_tracker",
+    "Trash": ".trash",
+    "Trough": ".trough",
+    "TroughBottomType": ".trough",
+    "Tube": ".tube",
+    "TubeRack": ".tube_rack",
+    "create_equally_spaced_2d": ".utils",
+    "create_equally_spaced_x": ".utils",
+    "create_equally_spaced_y": ".utils",
+    "create_ordered_items_2d": ".utils",
+    "VolumeStore": ".volume_tracker",
+    "VolumeStoreTracker": ".volume_tracker",
+    "VolumeTracker": ".volume_tracker",
+    "does_cross_contamination_tracking": ".volume_tracker",
+    "does_volume_tracking": ".volume_tracker",
+    "no_cross_contamination_tracking": ".volume_tracker",
+    "no_volume_tracking": ".volume_tracker",
+    "set_cross_contamination_tracking": ".volume_tracker",
+    "set_volume_tracking": ".volume_tracker",
+    "CrossSectionType": ".well",
+    "Well": ".well",
+    "WellBottomType": ".well",
+  },
+  star_modules=[
+    # labware manufacturers and suppliers
+    ".agenbio",
+    ".alpaqua",
+    ".azenta",
+    ".biorad",
+    ".boekel",
+    ".cellvis",
+    ".corning_axygen",
+    ".corning_costar",
+    ".eppendorf",
+    ".falcon",
+    ".hamilton",
+    ".nest",
+    ".opentrons",
+    ".porvair",
+    ".revvity",
+    ".tecan",
+    ".thermo_fisher",
+    ".vwr",
+  ],
 )
-from .cellvis import *
-from .container import Container
-from .coordinate import Coordinate
-from .corning_axygen import *
-from .corning_costar import *
-from .deck import Deck
-from .eppendorf import *
-from .errors import ResourceNotFoundError
-from .falcon import *
-from .hamilton import *
-from .itemized_resource import ItemizedResource
-from .liquid import Liquid
-from .nest import *
-from .opentrons import *
-from .petri_dish import PetriDish, PetriDishHolder
-from .plate import Lid, Plate
-from .plate_adapter import PlateAdapter
-from .porvair import *
-from .powder import Powder
-from .resource import Resource
-from .resource_stack import ResourceStack
-from .revvity import *
-from .rotation import Rotation
-from .tecan import *
-from .thermo_fisher import *
-from .tip_rack import TipRack, TipSpot
-from .tip_tracker import (
-  TipTracker,
-  does_tip_tracking,
-  no_tip_tracking,
-  set_tip_tracking,
-)
-from .trash import Trash
-from .trough import Trough
-from .tube import Tube
-from .tube_rack import TubeRack
-from .utils import (
-  create_equally_spaced_2d,
-  create_equally_spaced_x,
-  create_equally_spaced_y,
-  create_ordered_items_2d,
-)
-from .volume_tracker import (
-  VolumeTracker,
-  does_cross_contamination_tracking,
-  does_volume_tracking,
-  no_cross_contamination_tracking,
-  no_volume_tracking,
-  set_cross_contamination_tracking,
-  set_volume_tracking,
-)
-from .vwr import *
-from .well import CrossSectionType, Well, WellBottomType
+
+if TYPE_CHECKING:
+  # labware manufacturers and suppliers
+  from .agenbio import *
+  from .alpaqua import *
+  from .azenta import *
+  from .biorad import *
+  from .boekel import *
+  from .carrier import (
+    Carrier,
+    MFXCarrier,
+    PlateCarrier,
+    PlateHolder,
+    TipCarrier,
+    TroughCarrier,
+    TubeCarrier,
+    create_homogeneous_resources,
+    create_resources,
+  )
+  from .cellvis import *
+  from .container import Container
+  from .coordinate import Coordinate
+  from .corning_axygen import *
+  from .corning_costar import *
+  from .deck import Deck
+  from .eppendorf import *
+  from .errors import ResourceNotFoundError
+  from .falcon import *
+  from .hamilton import *
+  from .itemized_resource import ItemizedResource
+  from .liquid import Liquid
+  from .nest import *
+  from .opentrons import *
+  from .petri_dish import PetriDish, PetriDishHolder
+  from .plate import Lid, Plate
+  from .plate_adapter import PlateAdapter
+  from .porvair import *
+  from .powder import Powder
+  from .resource import Resource
+  from .resource_holder import ResourceHolder
+  from .resource_stack import ResourceStack
+  from .revvity import *
+  from .rotation import Rotation
+  from .spatial_index import BoundingBox
+  from .tecan import *
+  from .thermo_fisher import *
+  from .tip import Tip
+  from .tip_inventory import TipInventory
+  from .tip_rack import NestedTipRack, TipRack, TipSpot
+  from .tip_tracker import (
+    TipTracker,
+    does_tip_tracking,
+    no_tip_tracking,
+    set_tip_tracking,
+  )
+  from .trash import Trash
+  from .trough import Trough, TroughBottomType
+  from .tube import Tube
+  from .tube_rack import TubeRack
+  from .utils import (
+    create_equally_spaced_2d,
+    create_equally_spaced_x,
+    create_equally_spaced_y,
+    create_ordered_items_2d,
+  )
+  from .volume_tracker import (
+    VolumeStore,
+    VolumeStoreTracker,
+    VolumeTracker,
+    does_cross_contamination_tracking,
+    does_volume_tracking,
+    no_cross_contamination_tracking,
+    no_volume_tracking,
+    set_cross_contamination_tracking,
+    set_volume_tracking,
+  )
+  from .vwr import *
+  from .well import CrossSectionType, Well, WellBottomType
@@ -197,17 +197,9 @@ class PlateHolder(ResourceHolder):
 
   def _get_sinking_depth(self, resource: Resource) -> Coordinate:
     def get_plate_sinking_depth(plate: Plate):
-      # Sanity check for equal well clearances / dz
-      well_dz_set = {
-        round(well.location.z, 2)
-        for well in plate.get_all_children()
-        if well.category == "well" and well.location is not None
-      }
-      assert len(well_dz_set) == 1, "All wells must have the same z location"
-      well_dz = well_dz_set.pop()
       # Plate "sinking" logic based on well dz to pedestal relationship
       pedestal_size_z = abs(self.pedestal_size_z)
-      z_sinking_depth = min(pedestal_size_z, well_dz)
+      z_sinking_depth = min(pedestal_size_z, plate.get_well_dz())
       return z_sinking_depth
 
     z_sinking_depth = 0.0
@@ -219,8 +211,10 @@ class PlateHolder(ResourceHolder):
         z_sinking_depth = get_plate_sinking_depth(first_child)
 
       # TODO #246 - _get_sinking_depth should not handle callbacks
-      resource.register_did_assign_resource_callback(self._update_resource_stack_location)
-      self.register_did_unassign_resource_callback(self._deregister_resource_stack_callback)
+      if self._update_resource_stack_location not in resource._did_assign_resource_callbacks:
+        resource.register_did_assign_resource_callback(self._update_resource_stack_location)
+      if self._deregister_resource_stack_callback not in self._did_unassign_resource_callbacks:
+        self.register_did_unassign_resource_callback(self._deregister_resource_stack_callback)
     return -Coordinate(z=z_sinking_depth)
 
   def get_default_child_location(self, resource: Resource) -> Coordinate:
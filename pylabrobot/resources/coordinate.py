@@ -19,6 +19,10 @@ class Coordinate:
     self.y = round(self.y, 4)
     self.z = round(self.z, 4)
 
+  @staticmethod
+  def deserialize(data: dict) -> Coordinate:
+    return Coordinate(data["x"], data["y"], data["z"])
+
   @staticmethod
   def zero() -> Coordinate:
     return Coordinate(0, 0, 0)
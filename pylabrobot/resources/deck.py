@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, List, cast
+from typing import Dict, List, Optional, Set, cast
 
 from pylabrobot.resources.errors import ResourceNotFoundError
 
 from .coordinate import Coordinate
 from .resource import Resource
+from .spatial_index import BoundingBox, SpatialIndex
 from .trash import Trash
 
 
@@ -14,8 +15,11 @@ class Deck(Resource):
 
   This class maintains a dictionary of all resources on the deck. The dictionary is keyed by the
   resource name and is updated when resources are assigned and unassigned from the deck. The point
-  of this dictionary is to allow O(1) naming collision checks as well as the quick lookup of
-  resources by name.
+  of this dictionary is to allow the quick lookup of resources on the deck by name. Naming collision
+  checks use the name index that every resource tree maintains, see :class:`Resource`.
+
+  The bounding boxes of the resources directly on the deck, including their children, are kept in a
+  spatial index, see :meth:`get_resources_in_region`.
   """
 
   def __init__(
@@ -39,8 +43,15 @@ class Deck(Resource):
     self.location = origin
     self.resources: Dict[str, Resource] = {}
 
+    # Bounding boxes of the children of the deck. Boxes of children whose subtree changed are
+    # recomputed when they are next needed.
+    self._spatial_index = SpatialIndex()
+    self._stale_bounding_boxes: Set[str] = set()
+
     self.register_did_assign_resource_callback(self._register_resource)
     self.register_did_unassign_resource_callback(self._deregister_resource)
+    self.register_did_assign_resource_callback(self._mark_bounding_box_stale)
+    self.register_will_unassign_resource_callback(self._remove_from_spatial_index)
 
   def serialize(self) -> dict:
     """Serialize this deck."""
@@ -48,11 +59,6 @@ class Deck(Resource):
     del super_serialized["model"]  # deck's don't typically have a model
     return super_serialized
 
-  def _check_naming_conflicts(self, resource: Resource):
-    """overwrite for speed"""
-    if self.has_resource(resource.name):
-      raise ValueError(f"Resource '{resource.name}' already assigned to deck")
-
   def _register_resource(self, resource: Resource):
     """Recursively assign the given resource and all child resources to the `self.resources`
     dictionary. This method is called after a resource is assigned to the deck
@@ -76,6 +82,75 @@ class Deck(Resource):
     for child in resource.children:
       self._deregister_resource(child)
 
+  def _get_deck_child(self, resource: Resource) -> Resource:
+    """The child of the deck that `resource` is, or is a descendant of."""
+    while resource.parent is not self:
+      assert resource.parent is not None
+      resource = resource.parent
+    return resource
+
+  def _mark_bounding_box_stale(self, resource: Resource):
+    """Mark the bounding box of the deck child containing `resource` as changed. This method is
+    called after a resource is assigned (did_assign_resource_callback)."""
+    self._stale_bounding_boxes.add(self._get_deck_child(resource).name)
+
+  def _descendant_location_changed(self, resource: Resource):
+    self._mark_bounding_box_stale(resource)
+
+  def _remove_from_spatial_index(self, resource: Resource):
+    """Remove `resource` from the spatial index if it is a deck child, or mark the bounding box of
+    the deck child containing it as changed. This method is called before a resource is unassigned
+    (will_unassign_resource_callback)."""
+
+    deck_child = self._get_deck_child(resource)
+    if deck_child is resource:
+      self._stale_bounding_boxes.discard(resource.name)
+      if resource.name in self._spatial_index:
+        self._spatial_index.remove(resource.name)
+    else:
+      self._stale_bounding_boxes.add(deck_child.name)
+
+  def _refresh_spatial_index(self):
+    for name in self._stale_bounding_boxes:
+      resource = self.resources[name]
+      box = BoundingBox.of_subtree(resource)
+      if box is not None:
+        self._spatial_index.insert(resource, box)
+      elif name in self._spatial_index:
+        self._spatial_index.remove(name)
+    self._stale_bounding_boxes.clear()
+
+  def get_resources_in_region(self, region: BoundingBox) -> List[Resource]:
+    """Returns the resources directly on the deck whose bounding box, including all their children,
+    overlaps the region.
+
+    Resources that only touch the region, and resources without a location, are not included.
+
+    Examples:
+      Finding the highest point a channel passes when moving along the x axis at a given y:
+
+      >>> region = BoundingBox(0, y - 1, -float("inf"), deck.get_size_x(), y + 1, float("inf"))
+      >>> max(deck.get_bounding_box(r).z_max for r in deck.get_resources_in_region(region))
+    """
+
+    self._refresh_spatial_index()
+    return self._spatial_index.query(region)
+
+  def get_bounding_box(self, resource: Resource) -> Optional[BoundingBox]:
+    """Returns the absolute bounding box of a resource directly on the deck, including all its
+    children, or `None` if the resource has no location.
+
+    Raises:
+      ValueError: If the resource is not a child of the deck.
+    """
+
+    if resource.parent is not self:
+      raise ValueError(f"Resource '{resource.name}' is not a child of the deck.")
+    self._refresh_spatial_index()
+    if resource.name not in self._spatial_index:
+      return None
+    return self._spatial_index.get_bounding_box(resource.name)
+
   def get_resource(self, name: str) -> Resource:
     """Returns the resource with the given name.
 
@@ -3,6 +3,7 @@ import tempfile
 import unittest
 
 from pylabrobot.resources import (
+  BoundingBox,
   Coordinate,
   Deck,
   Plate,
@@ -11,6 +12,7 @@ from pylabrobot.resources import (
   Resource,
   ResourceHolder,
   ResourceNotFoundError,
+  Rotation,
   TipCarrier,
   TipRack,
   TipSpot,
@@ -49,6 +51,49 @@ class DeckTests(unittest.TestCase):
     with self.assertRaises(ResourceNotFoundError):
       deck.get_resource("resource")
 
+  def test_get_resources_in_region(self):
+    deck = Deck()
+    r1 = Resource(name="r1", size_x=10, size_y=10, size_z=10)
+    r2 = Resource(name="r2", size_x=10, size_y=10, size_z=10)
+    deck.assign_child_resource(r1, location=Coordinate(0, 0, 0))
+    deck.assign_child_resource(r2, location=Coordinate(20, 0, 0))
+    inf = float("inf")
+
+    self.assertEqual(deck.get_resources_in_region(BoundingBox(5, 5, -inf, 25, 6, inf)), [r1, r2])
+    self.assertEqual(deck.get_resources_in_region(BoundingBox(10, 0, -inf, 20, 10, inf)), [])
+    self.assertEqual(deck.get_resources_in_region(BoundingBox(0, 0, 11, inf, inf, inf)), [])
+
+    # children are included in the bounding box
+    r2.assign_child_resource(
+      Resource(name="tall", size_x=1, size_y=1, size_z=50), location=Coordinate(0, 0, 10)
+    )
+    self.assertEqual(deck.get_resources_in_region(BoundingBox(0, 0, 11, inf, inf, inf)), [r2])
+    self.assertEqual(deck.get_bounding_box(r2), BoundingBox(20, 0, 0, 30, 10, 60))
+    r2.get_resource("tall").unassign()
+    self.assertEqual(deck.get_bounding_box(r2), BoundingBox(20, 0, 0, 30, 10, 10))
+
+    # setting a location directly
+    r2.location = Coordinate(40, 0, 0)
+    self.assertEqual(deck.get_bounding_box(r2), BoundingBox(40, 0, 0, 50, 10, 10))
+    self.assertEqual(deck.get_resources_in_region(BoundingBox(25, 0, -inf, 35, 10, inf)), [])
+    r2.assign_child_resource(
+      Resource(name="side", size_x=10, size_y=10, size_z=10), location=Coordinate(10, 0, 0)
+    )
+    r2.get_resource("side").location = Coordinate(20, 0, 0)
+    self.assertEqual(deck.get_bounding_box(r2), BoundingBox(40, 0, 0, 70, 10, 10))
+    r2.get_resource("side").unassign()
+
+    # rotating
+    r2.rotation = Rotation(z=90)
+    self.assertEqual(deck.get_bounding_box(r2), BoundingBox(30, 0, 0, 40, 10, 10))
+    r2.rotation.z = 180
+    self.assertEqual(deck.get_bounding_box(r2), BoundingBox(30, -10, 0, 40, 0, 10))
+    r2.rotation = Rotation()
+
+    r1.unassign()
+    everywhere = BoundingBox(-inf, -inf, -inf, inf, inf, inf)
+    self.assertEqual(deck.get_resources_in_region(everywhere), [r2])
+
   def test_json_serialization_standard(self):
     self.maxDiff = None
     tmp_dir = tempfile.gettempdir()
@@ -4,6 +4,7 @@ import unittest
 from pylabrobot.resources.corning_costar import (
   Cor_96_wellplate_360ul_Fb,
 )
+from pylabrobot.resources import Coordinate, Resource, Rotation
 from pylabrobot.resources.hamilton import (
   HTF,
   PLT_CAR_L5AC_A00,
@@ -84,3 +85,17 @@ class HamiltonDeckTests(unittest.TestCase):
         "careful when grabbing this resource.",
       ],
     )
+
+  def test_collision_with_rotated_resource(self):
+    deck = STARLetDeck()
+    rotated = Resource("rotated", size_x=100, size_y=50, size_z=10, rotation=Rotation(z=90))
+    deck.assign_child_resource(rotated, location=Coordinate(300, 100, 0))
+
+    # the area at the location of the rotated resource, with its rotated size, is occupied
+    with self.assertRaises(ValueError):
+      deck.assign_child_resource(
+        Resource("r", size_x=20, size_y=20, size_z=10), location=Coordinate(310, 120, 0)
+      )
+    deck.assign_child_resource(
+      Resource("r", size_x=20, size_y=20, size_z=10), location=Coordinate(360, 120, 0)
+    )
@@ -10,6 +10,7 @@ from pylabrobot.resources.deck import Deck
 from pylabrobot.resources.errors import NoLocationError
 from pylabrobot.resources.hamilton.tip_creators import standard_volume_tip_with_filter
 from pylabrobot.resources.resource import Resource
+from pylabrobot.resources.spatial_index import BoundingBox
 from pylabrobot.resources.tip_rack import TipRack, TipSpot
 from pylabrobot.resources.trash import Trash
 
@@ -78,6 +79,12 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
     Z_MOVEMENT_LIMIT = 245
     Z_GRAB_LIMIT = 285
 
+    # The bounding box of the deck child containing the resource is usually enough to tell that
+    # nothing is too high, without checking every resource in the subtree.
+    box = self.get_bounding_box(self._get_deck_child(resource))
+    if box is not None and box.z_max <= Z_MOVEMENT_LIMIT:
+      return
+
     def check_z_height(resource: Resource):
       try:
         z_top = resource.get_absolute_location(z="top").z
@@ -169,17 +176,35 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
 
     if not ignore_collision:
       if resource_location is not None:  # collision detection
+        size_x = resource.get_absolute_size_x()
+        size_y = resource.get_absolute_size_y()
         if (
-          resource_location.x + resource.get_absolute_size_x()
-          > self.rails_to_location(self.num_rails + 1).x
+          resource_location.x + size_x > self.rails_to_location(self.num_rails + 1).x
           and rails is not None
         ):
-          raise ValueError(
-            f"Resource with width {resource.get_absolute_size_x()} does not fit at rails {rails}."
-          )
-
-        # Check if there is space for this new resource.
-        for og_resource in self.children:
+          raise ValueError(f"Resource with width {size_x} does not fit at rails {rails}.")
+
+        # Check if there is space for this new resource. Only the resources whose bounding box
+        # overlaps the footprint of the new resource are checked. The area checked below is the
+        # unrotated size at the location of a resource, which is not inside the bounding box of a
+        # rotated resource, so rotated resources are always checked.
+        deck_origin = self.get_absolute_location()
+        footprint = BoundingBox(
+          x_min=deck_origin.x + resource_location.x,
+          y_min=deck_origin.y + resource_location.y,
+          z_min=-float("inf"),
+          x_max=deck_origin.x + resource_location.x + size_x,
+          y_max=deck_origin.y + resource_location.y + size_y,
+          z_max=float("inf"),
+        )
+        candidates = self.get_resources_in_region(footprint)
+        candidate_ids = {id(r) for r in candidates}
+        candidates += [
+          r
+          for r in self.children
+          if id(r) not in candidate_ids and (r.rotation.x, r.rotation.y, r.rotation.z) != (0, 0, 0)
+        ]
+        for og_resource in candidates:
           og_x = cast(Coordinate, og_resource.location).x
           og_y = cast(Coordinate, og_resource.location).y
 
@@ -188,16 +213,12 @@ class HamiltonDeck(Deck, metaclass=ABCMeta):
           if any(
             [
               og_x <= resource_location.x < og_x + og_resource.get_absolute_size_x(),
-              og_x
-              < resource_location.x + resource.get_absolute_size_x()
-              < og_x + og_resource.get_absolute_size_x(),
+              og_x < resource_location.x + size_x < og_x + og_resource.get_absolute_size_x(),
             ]
           ) and any(
             [
               og_y <= resource_location.y < og_y + og_resource.get_absolute_size_y(),
-              og_y
-              < resource_location.y + resource.get_absolute_size_y()
-              < og_y + og_resource.get_absolute_size_y(),
+              og_y < resource_location.y + size_y < og_y + og_resource.get_absolute_size_y(),
             ]
           ):
             raise ValueError(
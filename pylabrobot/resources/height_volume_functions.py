@@ -7,8 +7,9 @@ def _height_of_volume_in_spherical_cap(r: float, liquid_volume: float) -> float:
   """Calculate the height of liquid in a spherical cap given the radius of the sphere and the
   volume of the liquid.
 
-  This function uses binary search to determine the height of the liquid within a spherical cap
-  (a portion of a sphere).
+  The volume of a cap of height h is V = pi * h^2 * (3r - h) / 3, a cubic in h. It has exactly one
+  root between 0 and r, which is computed in closed form with the trigonometric solution of the
+  cubic: h = r * (1 - 2 * cos((arccos(1 - k/2) + pi) / 3)) with k = 3V / (pi * r^3).
 
   Parameters:
     r: The radius of the sphere in millimeters.
@@ -23,34 +24,26 @@ def _height_of_volume_in_spherical_cap(r: float, liquid_volume: float) -> float:
   Example:
     >>> _height_of_volume_in_spherical_cap(6.9, 100)
     2.28 # units: mm
-
-  Notes:
-    - The height is calculated with a precision defined by the tolerance value (1e-6).
   """
 
-  def volume_of_spherical_cap(h: float):
-    return (1 / 3) * math.pi * h**2 * (3 * r - h)
-
   # Maximum volume of the spherical cap with height equal to the radius
-  max_volume = volume_of_spherical_cap(r)
+  max_volume = (2 / 3) * math.pi * r**3
   if liquid_volume > max_volume:
     raise ValueError(
       """WARNING: Liquid volume exceeds the volume of a
                          hemisphere of the given radius."""
     )
+  if liquid_volume <= 0:
+    return 0.0
 
-  # Binary search to solve for h
-  low, high = 0.0, r
-  tolerance = 1e-6
-  while high - low > tolerance:
-    mid = (low + high) / 2
-    if volume_of_spherical_cap(mid) < liquid_volume:
-      low = mid
-    else:
-      high = mid
-  liquid_height = (low + high) / 2
+  k = 3 * liquid_volume / (math.pi * r**3)  # between 0 and 2
+  cos_phi = max(-1.0, 1 - k / 2)  # clamp rounding errors at a full hemisphere
+  h = r * (1 - 2 * math.cos((math.acos(cos_phi) + math.pi) / 3))
+  # arccos loses precision close to 1, so for tiny volumes, refine with one Newton step.
+  if h > 0:
+    h -= (math.pi * h**2 * (3 * r - h) / 3 - liquid_volume) / (math.pi * h * (2 * r - h))
 
-  return liquid_height
+  return min(max(h, 0.0), r)
 
 
 def calculate_liquid_height_in_container_2segments_square_vbottom(
@@ -16,6 +16,7 @@ from typing import (
 
 import pylabrobot.utils
 
+from .coordinate import Coordinate
 from .resource import Resource
 
 if sys.version_info >= (3, 8):
@@ -87,6 +88,9 @@ class ItemizedResource(Resource, Generic[T], metaclass=ABCMeta):
 
     super().__init__(name, size_x, size_y, size_z, category=category, model=model)
 
+    # id(child) -> index in `self.children`, built on first use and reset when children change.
+    self._child_indices: Optional[Dict[int, int]] = None
+
     if ordered_items is not None:
       if ordering is not None:
         raise ValueError("Cannot specify both `ordered_items` and `ordering`.")
@@ -106,6 +110,12 @@ class ItemizedResource(Resource, Generic[T], metaclass=ABCMeta):
       if identifier[0] not in LETTERS or not identifier[1:].isdigit():
         raise ValueError("Ordering must be in the transposed Excel style notation, e.g. 'A1'.")
 
+    # identifier -> index map for O(1) lookups, and the grid shape, computed on first use.
+    self._identifier_index: Dict[str, int] = {
+      identifier: index for index, identifier in enumerate(self._ordering)
+    }
+    self._grid_size: Optional[Tuple[int, int]] = None
+
   def __getitem__(
     self,
     identifier: Union[str, int, Sequence[int], Sequence[str], slice, range],
@@ -155,9 +165,9 @@ class ItemizedResource(Resource, Generic[T], metaclass=ABCMeta):
     if isinstance(identifier, (slice, range)):
       start, stop = identifier.start, identifier.stop
       if isinstance(identifier.start, str):
-        start = self._ordering.index(identifier.start)
+        start = self._identifier_index[identifier.start]
       if isinstance(identifier.stop, str):
-        stop = self._ordering.index(identifier.stop)
+        stop = self._identifier_index[identifier.stop]
       identifier = list(range(start, stop))
       return self.get_items(identifier)
 
@@ -184,8 +194,8 @@ class ItemizedResource(Resource, Generic[T], metaclass=ABCMeta):
       identifier = LETTERS[row] + str(column + 1)  # standard transposed-Excel style notation
     if isinstance(identifier, str):
       try:
-        identifier = self._ordering.index(identifier)
-      except ValueError as e:
+        identifier = self._identifier_index[identifier]
+      except KeyError as e:
         raise IndexError(
           f"Item with identifier '{identifier}' does not exist on " f"resource '{self.name}'."
         ) from e
@@ -224,6 +234,18 @@ class ItemizedResource(Resource, Generic[T], metaclass=ABCMeta):
 
     if isinstance(identifiers, str):
       identifiers = pylabrobot.utils.expand_string_range(identifiers)
+
+    # Fast path: resolve all string identifiers through the index in a single pass.
+    if all(isinstance(i, str) for i in identifiers):
+      num_items = self.num_items
+      indices = [self._identifier_index.get(cast(str, i), -1) for i in identifiers]
+      for identifier, index in zip(identifiers, indices):
+        if not 0 <= index < num_items:
+          raise IndexError(
+            f"Item with identifier '{identifier}' does not exist on " f"resource '{self.name}'."
+          )
+      return [cast(T, self.children[index]) for index in indices]
+
     return [self.get_item(i) for i in identifiers]
 
   @property
@@ -427,8 +449,35 @@ class ItemizedResource(Resource, Generic[T], metaclass=ABCMeta):
       "ordering": self._ordering,
     }
 
+  def assign_child_resource(
+    self,
+    resource: Resource,
+    location: Optional[Coordinate],
+    reassign: bool = True,
+  ):
+    self._child_indices = None
+    super().assign_child_resource(resource, location=location, reassign=reassign)
+
+  def unassign_child_resource(self, resource: Resource):
+    self._child_indices = None
+    super().unassign_child_resource(resource)
+
+  def __deepcopy__(self, memo):
+    resource_copy = super().__deepcopy__(memo)
+    resource_copy._child_indices = None  # keyed by id, so not valid for the copy
+    return resource_copy
+
   def index_of_item(self, item: T) -> Optional[int]:
     """Return the index of the given item in the resource, or `None` if not found."""
+
+    # Fast path: look up the item by identity.
+    if self._child_indices is None:
+      self._child_indices = {id(child): i for i, child in enumerate(self.children)}
+    index = self._child_indices.get(id(item))
+    if index is not None:
+      return index
+
+    # Fall back to structural equality, eg. for items that were recreated after a module reload.
     for i, i_item in enumerate(self.children):
       if i_item == item:
         return i
@@ -468,14 +517,18 @@ class ItemizedResource(Resource, Generic[T], metaclass=ABCMeta):
   def num_items_x(self) -> int:
     """The number of items in the x direction, if the resource is a full grid. If the resource is
     not a full grid, an error will be raised."""
-    _, num_items_x = self._get_grid_size(self._ordering)
+    if self._grid_size is None:
+      self._grid_size = self._get_grid_size(self._ordering)
+    _, num_items_x = self._grid_size
     return num_items_x
 
   @property
   def num_items_y(self) -> int:
     """The number of items in the y direction, if the resource is a full grid. If the resource is
     not a full grid, an error will be raised."""
-    num_items_y, _ = self._get_grid_size(self._ordering)
+    if self._grid_size is None:
+      self._grid_size = self._get_grid_size(self._ordering)
+    num_items_y, _ = self._grid_size
     return num_items_y
 
   @property
@@ -134,6 +134,29 @@ class TestItemizedResource(unittest.TestCase):
     with self.assertRaises(IndexError):
       _ = self.plate["T1"]
 
+  def test_get_items_str_range_error(self):
+    with self.assertRaises(IndexError):
+      self.plate.get_items("A11:A13")
+    with self.assertRaises(IndexError):
+      self.plate.get_items(["A1", "T1"])
+
+  def test_index_of_item(self):
+    self.assertEqual(self.plate.index_of_item(self.plate.get_item("B2")), 9)
+    self.assertEqual(self.plate.get_child_identifier(self.plate.get_item("B2")), "B2")
+    self.assertIsNone(self.plate.index_of_item(Well("w", size_x=1, size_y=1, size_z=1)))
+
+    well = self.plate.get_item("H12")
+    self.plate.unassign_child_resource(well)
+    self.assertIsNone(self.plate.index_of_item(well))
+    self.plate.assign_child_resource(well, location=Coordinate.zero())
+    self.assertEqual(self.plate.index_of_item(well), 95)
+
+  def test_grid_size_is_cached(self):
+    self.assertEqual((self.plate.num_items_y, self.plate.num_items_x), (8, 12))
+    self.plate._get_grid_size = None  # type: ignore[method-assign]
+    self.assertEqual((self.plate.num_items_y, self.plate.num_items_x), (8, 12))
+    self.assertEqual(len(self.plate.get_quadrant(1)), 24)
+
   def test_getitem_tuple_int(self):
     self.assertEqual(
       [w.name for w in self.plate[0, 4, 1]],
@@ -17,6 +17,7 @@ from pylabrobot.resources.resource_holder import get_child_location
 from .itemized_resource import ItemizedResource
 from .liquid import Liquid
 from .resource import Coordinate, Resource
+from .volume_tracker import VolumeStore
 
 if TYPE_CHECKING:
   from .well import Well
@@ -89,6 +90,9 @@ class Plate(ItemizedResource["Well"]):
         WIP: https://github.com/PyLabRobot/pylabrobot/pull/152#discussion_r1625831517
     """
 
+    # The z location of the wells, see `get_well_dz`. Set before the wells are assigned.
+    self._well_dz: Optional[float] = None
+
     super().__init__(
       name,
       size_x,
@@ -101,6 +105,7 @@ class Plate(ItemizedResource["Well"]):
     )
     self._lid: Optional[Lid] = None
     self.plate_type = plate_type
+    self.volume_store: Optional[VolumeStore] = None
 
     if lid is not None:
       self.assign_child_resource(lid)
@@ -134,13 +139,36 @@ class Plate(ItemizedResource["Well"]):
       location = location or default_location
     else:
       assert location is not None, "Location must be specified for if resource is not a lid."
+      self._well_dz = None
     return super().assign_child_resource(resource, location=location, reassign=reassign)
 
   def unassign_child_resource(self, resource):
     if isinstance(resource, Lid) and resource == self.lid:
       self._lid = None
+    else:
+      self._well_dz = None
     return super().unassign_child_resource(resource)
 
+  def get_well_dz(self) -> float:
+    """Get the z location of the wells relative to the plate, rounded to 0.01 mm. This is used to
+    compute how deep a plate sinks onto a pedestal.
+
+    The result is cached until a well is assigned or unassigned. Moving a well does not update it.
+
+    Raises:
+      AssertionError: If not all wells have the same z location.
+    """
+
+    if self._well_dz is None:
+      well_dz_set = {
+        round(well.location.z, 2)
+        for well in self.children
+        if well.category == "well" and well.location is not None
+      }
+      assert len(well_dz_set) == 1, "All wells must have the same dz"
+      self._well_dz = well_dz_set.pop()
+    return self._well_dz
+
   def __repr__(self) -> str:
     return (
       f"{self.__class__.__name__}(name={self.name}, size_x={self._size_x}, "
@@ -209,6 +237,25 @@ class Plate(ItemizedResource["Well"]):
       well = self.get_well(i)
       well.tracker.set_liquids([(liquid, volume)])  # type: ignore
 
+  def use_volume_store(self) -> VolumeStore:
+    """Track the volumes of all wells in a single :class:`~pylabrobot.resources.VolumeStore`.
+
+    The current state of each well's tracker is moved to the store, and `well.tracker` is replaced
+    by a view onto it, so the regular tracker API keeps working. This makes commits and rollbacks of
+    the whole plate (eg. in :meth:`~pylabrobot.liquid_handling.LiquidHandler.aspirate96`) cheaper.
+
+    Example:
+      >>> store = plate.use_volume_store()
+      >>> store.get_used_volumes()
+    """
+
+    if self.volume_store is None:
+      store = VolumeStore()
+      for well in self.get_all_items():
+        well.tracker = store.attach(well.tracker)
+      self.volume_store = store
+    return self.volume_store
+
   def disable_volume_trackers(self) -> None:
     """Disable volume tracking for all wells in the plate."""
 
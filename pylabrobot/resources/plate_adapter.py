@@ -122,8 +122,13 @@ class PlateAdapter(Resource):
     plate_dx, plate_dy = float(x_locations[0]), float(y_locations[0])
     plate_item_dx = abs(calculate_well_spacing(x_locations))
     plate_item_dy = abs(calculate_well_spacing(y_locations))
-    well_size_x = resource.children[0].get_absolute_size_x()
-    well_size_y = resource.children[0].get_absolute_size_y()
+    # The size of the wells in the plate's rotation relative to this adapter. The absolute size
+    # would include the rotation of the plate's current parent, if any.
+    well = resource.children[0]
+    if (resource.rotation.z + well.rotation.z) % 180 == 0:
+      well_size_x, well_size_y = well.get_size_x(), well.get_size_y()
+    else:
+      well_size_x, well_size_y = well.get_size_y(), well.get_size_x()
     # true_dz = resource.get_size_z() - resource.children[0].get_size_z()
 
     # Well-grid to hole-grid compatibility check
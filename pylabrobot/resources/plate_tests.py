@@ -83,3 +83,35 @@ class TestLid(unittest.TestCase):
 
     self.assertIn(plate.get_well("B2"), plate.get_quadrant(4))
     self.assertEqual(len(plate.get_quadrant(4)), 384 // 4)
+
+  def test_get_well_dz(self):
+    plate = Plate(
+      "plate",
+      size_x=10,
+      size_y=10,
+      size_z=10,
+      ordered_items=create_ordered_items_2d(
+        Well,
+        num_items_x=2,
+        num_items_y=1,
+        dx=1,
+        dy=1,
+        dz=1.234,
+        item_dx=1,
+        item_dy=1,
+        size_x=1,
+        size_y=1,
+        size_z=1,
+      ),
+    )
+    self.assertEqual(plate.get_well_dz(), 1.23)
+
+    well = Well("other_well", size_x=1, size_y=1, size_z=1)
+    plate.assign_child_resource(well, location=Coordinate(5, 5, 2))
+    with self.assertRaises(AssertionError):
+      plate.get_well_dz()
+    plate.unassign_child_resource(well)
+    self.assertEqual(plate.get_well_dz(), 1.23)
+
+    plate.assign_child_resource(Lid("lid", size_x=10, size_y=10, size_z=2, nesting_z_height=1))
+    self.assertEqual(plate.get_well_dz(), 1.23)
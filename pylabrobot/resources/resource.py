@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import contextlib
+import copy
 import itertools
-import json
 import logging
 import sys
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from pylabrobot.serializer import deserialize, serialize
+from pylabrobot.utils import json_codec
 from pylabrobot.utils.linalg import matrix_vector_multiply_3x3
-from pylabrobot.utils.object_parsing import find_subclass
+from pylabrobot.utils.object_parsing import find_subclass, register_subclass
 
 from .coordinate import Coordinate
 from .errors import NoLocationError, ResourceNotFoundError
@@ -19,6 +21,9 @@ if sys.version_info >= (3, 11):
 else:
   from typing_extensions import Self
 
+if TYPE_CHECKING:
+  from .resource_index import ResourceIndex
+
 logger = logging.getLogger("pylabrobot")
 
 
@@ -28,6 +33,35 @@ WillUnassignResourceCallback = Callable[["Resource"], None]
 DidUnassignResourceCallback = Callable[["Resource"], None]
 ResourceDidUpdateState = Callable[[Dict[str, Any]], None]
 
+# State versions. Every state change gets a new, larger version. Versions are global, so that they
+# can be compared between trees. See `Resource.serialize_state_delta`.
+_state_versions = itertools.count(1)
+
+# Key in the `copy.deepcopy` memo holding the ids of the resources in the subtree being copied.
+_COPY_SUBTREE_MEMO_KEY = "_plr_copy_subtree"
+
+_CALLBACK_ATTRIBUTES = (
+  "_will_assign_resource_callbacks",
+  "_did_assign_resource_callbacks",
+  "_will_unassign_resource_callbacks",
+  "_did_unassign_resource_callbacks",
+  "_resource_state_updated_callbacks",
+)
+
+# Callback slots of the tip and volume trackers, stored in the `tracker` attribute of resources.
+_TRACKER_CALLBACK_ATTRIBUTES = ("_callback", "_change_callback")
+
+
+def _copy_callback(callback: Callable, memo: Dict[Any, Any]) -> Optional[Callable]:
+  """Copy a callback bound to a resource in the subtree being copied, so that it is bound to the
+  copy of that resource. Other callbacks are not copied, and `None` is returned."""
+
+  subtree_ids = memo.get(_COPY_SUBTREE_MEMO_KEY)
+  bound_to = getattr(callback, "__self__", None)
+  if bound_to is None or (subtree_ids is not None and id(bound_to) not in subtree_ids):
+    return None
+  return copy.deepcopy(callback, memo)
+
 
 class Resource:
   """Base class for deck resources.
@@ -57,13 +91,32 @@ class Resource:
     self._size_y = size_y
     self._size_z = size_z
     self._local_size_z = size_z
+
+    # Cached absolute transform. Invalidated when the location, rotation or parent of this resource
+    # or any of its ancestors changes. See :meth:`_invalidate_absolute_transform`.
+    self._absolute_rotation: Optional[Rotation] = None
+    self._absolute_rotation_matrix: Optional[List[List[float]]] = None
+    self._absolute_origin: Optional[Coordinate] = None
+
+    self._location: Optional[Coordinate] = None
+    self.parent: Optional[Resource] = None
+    self.children: List[Resource] = []
+
+    self._rotation: Optional[Rotation] = None
     self.rotation = rotation or Rotation()
     self.category = category
     self.model = model
 
-    self.location: Optional[Coordinate] = None
-    self.parent: Optional[Resource] = None
-    self.children: List[Resource] = []
+    # Name -> resource index of the whole tree. This dictionary is shared by all resources in a
+    # tree, and is merged and split when subtrees are assigned and unassigned.
+    self._name_index: Dict[str, Resource] = {name: self}
+
+    # Name -> version of the last state change, for all resources in the tree, ordered by version.
+    # Shared by the tree like `_name_index`. See `serialize_state_delta`.
+    self._state_log: Dict[str, int] = {name: next(_state_versions)}
+
+    # Index of the descendants of this resource, created by the first query. See `ResourceIndex`.
+    self._query_index: Optional[ResourceIndex] = None
 
     self._will_assign_resource_callbacks: List[WillAssignResourceCallback] = []
     self._did_assign_resource_callbacks: List[DidAssignResourceCallback] = []
@@ -71,6 +124,10 @@ class Resource:
     self._did_unassign_resource_callbacks: List[DidUnassignResourceCallback] = []
     self._resource_state_updated_callbacks: List[ResourceDidUpdateState] = []
 
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    register_subclass(Resource, cls)  # so that `deserialize` can find the class by name
+
   def get_size_x(self) -> float:
     """Local size in the x direction."""
     return self._size_x
@@ -99,6 +156,62 @@ class Resource:
       "parent_name": self.parent.name if self.parent is not None else None,
     }
 
+  @property
+  def location(self) -> Optional[Coordinate]:
+    """The location of this resource, relative to its parent. None if undefined."""
+    return self._location
+
+  @location.setter
+  def location(self, location: Optional[Coordinate]):
+    self._location = location
+    self._invalidate_absolute_transform()
+
+    ancestor = self.parent
+    while ancestor is not None:
+      if ancestor._query_index is not None:
+        ancestor._query_index._location_changed(self)
+      ancestor._descendant_location_changed(self)
+      ancestor = ancestor.parent
+
+  def _descendant_location_changed(self, resource: Resource):
+    """Called when the location or rotation of `resource`, a descendant of this resource, is set."""
+
+  @property
+  def rotation(self) -> Rotation:
+    """The rotation of this resource, relative to its parent."""
+    assert self._rotation is not None
+    return self._rotation
+
+  @rotation.setter
+  def rotation(self, rotation: Rotation):
+    if self._rotation is not None:
+      self._rotation.deregister_change_callback(self._rotation_changed)
+    self._rotation = rotation
+    rotation.register_change_callback(self._rotation_changed)
+    self._rotation_changed()
+
+  def _rotation_changed(self):
+    self._invalidate_absolute_transform()
+    ancestor = self.parent
+    while ancestor is not None:
+      ancestor._descendant_location_changed(self)
+      ancestor = ancestor.parent
+
+  def _invalidate_absolute_transform(self):
+    """Drop the cached absolute transform of this resource and all of its descendants.
+
+    A descendant can only hold a cached transform if its parent does, so the recursion stops at the
+    first resource without a cache.
+    """
+
+    if self._absolute_rotation is None and self._absolute_origin is None:
+      return
+    self._absolute_rotation = None
+    self._absolute_rotation_matrix = None
+    self._absolute_origin = None
+    for child in self.children:
+      child._invalidate_absolute_transform()
+
   @property
   def name(self) -> str:
     """Get the name of this resource."""
@@ -113,9 +226,19 @@ class Resource:
 
     if self.parent is not None:
       raise RuntimeError("Cannot change the name of a resource that is assigned.")
+    if name == self._name:
+      return
+    if name in self._name_index:
+      raise ValueError(f"Resource with name '{name}' already exists in the tree.")
+    del self._name_index[self._name]
+    self._name_index[name] = self
+    del self._state_log[self._name]
+    self._state_log[name] = next(_state_versions)
     self._name = name
 
   def __eq__(self, other):
+    if self is other:
+      return True
     return (
       isinstance(other, Resource)
       and self.name == other.name
@@ -135,7 +258,9 @@ class Resource:
     )
 
   def __hash__(self) -> int:
-    return hash(repr(self))
+    # Equal resources always have equal names, and names are unique within a tree. Hashing the name
+    # is consistent with `__eq__` and much cheaper than hashing the full representation.
+    return hash(self.name)
 
   def get_anchor(self, x: str, y: str, z: str) -> Coordinate:
     """Get a relative location within the resource.
@@ -197,9 +322,38 @@ class Resource:
 
   def get_absolute_rotation(self) -> Rotation:
     """Get the absolute rotation of this resource."""
-    if self.parent is None:
-      return self.rotation
-    return self.parent.get_absolute_rotation() + self.rotation
+    if self._absolute_rotation is None:
+      if self.parent is None:
+        self._absolute_rotation = Rotation(self.rotation.x, self.rotation.y, self.rotation.z)
+      else:
+        self._absolute_rotation = self.parent.get_absolute_rotation() + self.rotation
+    return self._absolute_rotation
+
+  def _get_absolute_rotation_matrix(self) -> List[List[float]]:
+    if self._absolute_rotation_matrix is None:
+      self._absolute_rotation_matrix = self.get_absolute_rotation().get_rotation_matrix()
+    return self._absolute_rotation_matrix
+
+  def _get_absolute_origin(self) -> Coordinate:
+    """Get the absolute location of the origin (left front bottom corner) of this resource. The
+    result is cached until the location, rotation or parent of this resource or any of its
+    ancestors changes."""
+
+    if self._absolute_origin is None:
+      if self.location is None:
+        raise NoLocationError(f"Resource {self.name} has no location.")
+
+      if self.parent is None:
+        self._absolute_origin = self.location
+      else:
+        rotated_location = Coordinate(
+          *matrix_vector_multiply_3x3(
+            self.parent._get_absolute_rotation_matrix(),
+            self.location.vector(),
+          )
+        )
+        self._absolute_origin = self.parent._get_absolute_origin() + rotated_location
+    return self._absolute_origin
 
   def get_absolute_location(self, x: str = "l", y: str = "f", z: str = "b") -> Coordinate:
     """Get the absolute location of this resource, probably within the
@@ -212,31 +366,21 @@ class Resource:
       z: `"t"`/`"top"`, `"c"`/`"center"`, or `"b"`/`"bottom"`
     """
 
-    if self.location is None:
-      raise NoLocationError(f"Resource {self.name} has no location.")
-
+    origin = self._get_absolute_origin()
     rotated_anchor = Coordinate(
       *matrix_vector_multiply_3x3(
-        self.get_absolute_rotation().get_rotation_matrix(),
+        self._get_absolute_rotation_matrix(),
         self.get_anchor(x=x, y=y, z=z).vector(),
       )
     )
+    return origin + rotated_anchor
 
-    if self.parent is None:
-      return self.location + rotated_anchor
-
-    parent_pos = self.parent.get_absolute_location()
-    rotated_location = Coordinate(
-      *matrix_vector_multiply_3x3(
-        self.parent.get_absolute_rotation().get_rotation_matrix(),
-        self.location.vector(),
-      )
-    )
-    return parent_pos + rotated_location + rotated_anchor
-
-  def _get_rotated_corners(self) -> List[Coordinate]:
-    absolute_rotation = self.get_absolute_rotation()
-    rot_mat = absolute_rotation.get_rotation_matrix()
+  def _get_rotated_corners(self, rotation: Optional[Rotation] = None) -> List[Coordinate]:
+    """The corners of this resource rotated by `rotation`, or by its absolute rotation if `None`."""
+    if rotation is None:
+      rot_mat = self._get_absolute_rotation_matrix()
+    else:
+      rot_mat = rotation.get_rotation_matrix()
     return [
       Coordinate(*matrix_vector_multiply_3x3(rot_mat, corner.vector()))
       for corner in [
@@ -266,6 +410,23 @@ class Resource:
     rotated_corners = self._get_rotated_corners()
     return max(c.z for c in rotated_corners) - min(c.z for c in rotated_corners)
 
+  def get_rotated_size(self, rotation: Rotation) -> Coordinate:
+    """Get the size of the axis aligned bounding box of this resource if its absolute rotation were
+    `rotation`. Unlike `rotated(...).get_absolute_size_x()`, this does not copy the resource.
+
+    Examples:
+      >>> plate.get_rotated_size(plate.rotation + Rotation(z=90)).x  # the width after a turn
+
+      85.48
+    """
+
+    rotated_corners = self._get_rotated_corners(rotation)
+    return Coordinate(
+      max(c.x for c in rotated_corners) - min(c.x for c in rotated_corners),
+      max(c.y for c in rotated_corners) - min(c.y for c in rotated_corners),
+      max(c.z for c in rotated_corners) - min(c.z for c in rotated_corners),
+    )
+
   def assign_child_resource(
     self,
     resource: Resource,
@@ -300,8 +461,9 @@ class Resource:
     if resource.parent is not None:
       resource.parent.unassign_child_resource(resource)
     resource.parent = self
-    resource.location = location
+    resource.location = location  # also invalidates the cached absolute transform of the subtree
     self.children.append(resource)
+    self._merge_name_index(resource)
 
     # Register callbacks on the new child resource so that they can be propagated up the tree.
     resource.register_will_assign_resource_callback(self._call_will_assign_resource_callbacks)
@@ -372,16 +534,43 @@ class Resource:
     return self.parent.get_root()
 
   def _check_naming_conflicts(self, resource: Resource):
-    """Recursively check for naming conflicts in the resource tree."""
-    if resource.name == self.name:
-      raise ValueError(f"Resource with name '{resource.name}' already exists in the tree.")
+    """Check for naming conflicts between the tree of this resource and the subtree of `resource`.
 
-    # check if the name of the resource we are currently checking already exists in this subtree
-    for child in self.children:
-      child._check_naming_conflicts(resource)
-    # check if the name of any of the children of the resource already exists in this subtree
-    for child in resource.children:
-      self._check_naming_conflicts(child)
+    This is a lookup in the name index shared by the tree, so it is linear in the size of the
+    subtree being assigned and independent of the size of this tree.
+    """
+
+    for r in [resource] + resource.get_all_children():
+      if r.name in self._name_index:
+        raise ValueError(f"Resource with name '{r.name}' already exists in the tree.")
+
+  def _merge_name_index(self, resource: Resource):
+    """Merge the name index of `resource`, which was the root of its own tree, into the index of
+    this tree."""
+
+    index = self._name_index
+    state_log = self._state_log
+    for r in list(resource._name_index.values()):
+      index[r.name] = r
+      r._name_index = index
+      # The state of the new resources is new to this tree.
+      state_log[r.name] = next(_state_versions)
+      r._state_log = state_log
+
+  def _split_name_index(self, resource: Resource):
+    """Move the subtree of `resource`, which was just unassigned, to its own name index."""
+
+    index = self._name_index
+    state_log = self._state_log
+    new_index: Dict[str, Resource] = {}
+    new_state_log: Dict[str, int] = {}
+    for r in [resource] + resource.get_all_children():
+      del index[r.name]
+      del state_log[r.name]
+      new_index[r.name] = r
+      new_state_log[r.name] = next(_state_versions)
+      r._name_index = new_index
+      r._state_log = new_state_log
 
   def unassign_child_resource(self, resource: Resource):
     """Unassign a child resource from this resource.
@@ -404,8 +593,9 @@ class Resource:
 
     # Update the tree structure
     resource.parent = None
-    resource.location = None
+    resource.location = None  # also invalidates the cached absolute transform of the subtree
     self.children.remove(resource)
+    self._split_name_index(resource)
 
     # Delete callbacks on the child resource so that they are not propagated up the tree.
     resource.deregister_will_assign_resource_callback(self._call_will_assign_resource_callbacks)
@@ -442,16 +632,15 @@ class Resource:
       ValueError: If no resource with the given name exists.
     """
 
-    if self.name == name:
-      return self
+    resource = self._name_index.get(name)
 
-    for child in self.children:
-      try:
-        return child.get_resource(name)
-      except ResourceNotFoundError:
-        pass
-
-    raise ResourceNotFoundError(f"Resource with name '{name}' does not exist.")
+    # The index is shared by the whole tree, so make sure the resource is in the subtree of self.
+    ancestor = resource
+    while ancestor is not None and ancestor is not self:
+      ancestor = ancestor.parent
+    if resource is None or ancestor is None:
+      raise ResourceNotFoundError(f"Resource with name '{name}' does not exist.")
+    return resource
 
   def rotate(self, x: float = 0, y: float = 0, z: float = 0):
     """Rotate counter-clockwise by the given number of degrees."""
@@ -461,8 +650,61 @@ class Resource:
     self.rotation.z = (self.rotation.z + z) % 360
 
   def copy(self) -> Self:
-    resource_copy = self.__class__.deserialize(self.serialize(), allow_marshal=True)
-    resource_copy.load_all_state(self.serialize_all_state())
+    """Return a deep copy of this resource and all of its children, including their state.
+
+    The copy is made attribute by attribute, without going through serialization. It is not assigned
+    to a parent and has no location. Only callbacks bound to resources in the copied subtree are
+    carried over, also those registered on the trackers, so callbacks registered by eg. a liquid
+    handler or a visualizer are not.
+    """
+
+    subtree = [self] + self.get_all_children()
+    memo: Dict[Any, Any] = {_COPY_SUBTREE_MEMO_KEY: {id(r) for r in subtree}}
+    resource_copy = copy.deepcopy(self, memo)
+
+    resource_copy.parent = None
+    resource_copy.location = None
+    name_index: Dict[str, Resource] = {}
+    state_log: Dict[str, int] = {}
+    for r in [resource_copy] + resource_copy.get_all_children():
+      name_index[r.name] = r
+      r._name_index = name_index
+      state_log[r.name] = next(_state_versions)
+      r._state_log = state_log
+      r._query_index = None
+    return resource_copy
+
+  def __deepcopy__(self, memo: Dict[Any, Any]) -> Self:
+    subtree_ids = memo.get(_COPY_SUBTREE_MEMO_KEY)
+    if subtree_ids is not None and id(self) not in subtree_ids:
+      # Resources outside of the subtree being copied (eg. the parent) are referenced, not copied.
+      return self
+
+    cls = self.__class__
+    resource_copy = cls.__new__(cls)
+    memo[id(self)] = resource_copy
+    for key, value in self.__dict__.items():
+      if key in {"_name_index", "_state_log", "_query_index"} and subtree_ids is not None:
+        # rebuilt by `copy`
+        continue
+      if key in _CALLBACK_ATTRIBUTES:
+        continue
+      resource_copy.__dict__[key] = copy.deepcopy(value, memo)
+
+    # Callbacks are copied last, when all resources they may be bound to are in the memo.
+    for key in _CALLBACK_ATTRIBUTES:
+      callbacks = []
+      for callback in self.__dict__[key]:
+        callback_copy = _copy_callback(callback, memo)
+        if callback_copy is not None:
+          callbacks.append(callback_copy)
+      resource_copy.__dict__[key] = callbacks
+    tracker = self.__dict__.get("tracker")
+    if tracker is not None:
+      for key in _TRACKER_CALLBACK_ATTRIBUTES:
+        callback = getattr(tracker, key)
+        callback_copy = None if callback is None else _copy_callback(callback, memo)
+        setattr(resource_copy.__dict__["tracker"], key, callback_copy)
     return resource_copy
 
   def rotated(self, x: float = 0, y: float = 0, z: float = 0) -> Self:
@@ -472,6 +714,29 @@ class Resource:
     new_resource.rotate(x=x, y=y, z=z)
     return new_resource
 
+  @contextlib.contextmanager
+  def temporarily_rotated(self, x: float = 0, y: float = 0, z: float = 0) -> Iterator[Self]:
+    """Rotate this resource by the given number of degrees inside a `with` block, and restore its
+    rotation afterwards.
+
+    Use this instead of :meth:`rotated` to ask about the size or child locations of a resource in
+    a hypothetical rotation. Nothing is copied, so it is cheap for resources with many children,
+    like plates. The resource stays assigned to its parent, so absolute locations and sizes still
+    include the rotation of the parent.
+
+    Examples:
+      >>> with plate.temporarily_rotated(z=90) as rotated_plate:
+      ...   location = plate_holder.get_default_child_location(rotated_plate)
+    """
+
+    rotation = self.rotation
+    original = (rotation.x, rotation.y, rotation.z)
+    self.rotate(x=x, y=y, z=z)
+    try:
+      yield self
+    finally:
+      rotation.x, rotation.y, rotation.z = original
+
   def center(self, x: bool = True, y: bool = True, z: bool = False) -> Coordinate:
     """Get the center of this resource.
 
@@ -571,9 +836,7 @@ class Resource:
       >>> deck.save("my_layout.json")
     """
 
-    serialized = self.serialize()
-    with open(fn, "w", encoding="utf-8") as f:
-      json.dump(serialized, f, indent=indent)
+    json_codec.save(self.serialize(), fn, indent=indent)
 
   @classmethod
   def deserialize(cls, data: dict, allow_marshal: bool = False) -> Self:
@@ -594,10 +857,13 @@ class Resource:
 
     data_copy = data.copy()  # copy data because we will be modifying it
 
-    subclass = find_subclass(data["type"], cls=Resource)
-    if subclass is None:
-      raise ValueError(f'Could not find subclass with name "{data["type"]}"')
-    assert issubclass(subclass, cls)  # mypy does not know the type after the None check...
+    if cls.__name__ == data["type"]:  # called on the class of the data, e.g. for children below
+      subclass = cls
+    else:
+      subclass = find_subclass(data["type"], cls=Resource)
+      if subclass is None:
+        raise ValueError(f'Could not find subclass with name "{data["type"]}"')
+      assert issubclass(subclass, cls)  # mypy does not know the type after the None check...
 
     for key in [
       "type",
@@ -617,7 +883,7 @@ class Resource:
       child = child_cls.deserialize(child_data, allow_marshal=allow_marshal)
       location_data = child_data.get("location", None)
       if location_data is not None:
-        location = cast(Coordinate, deserialize(location_data))
+        location = Coordinate.deserialize(location_data)
       else:
         raise ValueError(f"Child resource '{child.name}' has no location.")
       resource.assign_child_resource(child, location=location)
@@ -638,10 +904,7 @@ class Resource:
       >>> resource = Resource.deserialize("my_resource.json")
     """
 
-    with open(json_file, "r", encoding="utf-8") as f:
-      content = json.load(f)
-
-    return cls.deserialize(content)
+    return cls.deserialize(json_codec.load_file(json_file))
 
   def register_will_assign_resource_callback(self, callback: WillAssignResourceCallback):
     """Add a callback that will be called before a resource is assigned to this resource. These
@@ -701,10 +964,96 @@ class Resource:
       states of the resources.
     """
 
-    state = {self.name: self.serialize_state()}
-    for child in self.children:
-      state.update(child.serialize_all_state())
-    return state
+    return dict(self._iter_all_state())
+
+  def _iter_all_state(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield the name and serialized state of this resource and all children, depth first."""
+
+    stack = [self]
+    while len(stack) > 0:
+      resource = stack.pop()
+      yield resource.name, resource.serialize_state()
+      stack.extend(reversed(resource.children))
+
+  def get_state_version(self) -> int:
+    """Get the version of the last state change in the tree of this resource. Pass it to
+    :meth:`serialize_state_delta` later to get the state that changed since.
+
+    A resource that is assigned to a tree counts as changed. Versions are global, so they can be
+    compared between trees.
+    """
+
+    return next(reversed(self._state_log.values()))
+
+  def serialize_state_delta(self, since_version: int) -> Dict[str, Dict[str, Any]]:
+    """Serialize the state of the resources in this subtree that changed after `since_version`.
+
+    Changes are tracked as they happen, so the cost is proportional to the number of resources that
+    changed, not to the size of the tree.
+
+    Only the state of resources that are in the tree is reported, not changes to the tree itself:
+    a resource that is unassigned is not in the delta, and nothing records that it was removed.
+    Assigning and unassigning resources must be done on both trees, for example from the
+    callbacks registered with :meth:`register_did_assign_resource_callback` and
+    :meth:`register_did_unassign_resource_callback`, before :meth:`apply_state_delta` is used.
+
+    Examples:
+      Checkpointing a deck after every step:
+
+      >>> version = deck.get_state_version()
+      >>> await lh.aspirate(plate["A1:H1"], vols=[10] * 8)
+      >>> delta = deck.serialize_state_delta(version)  # the state of the 8 wells
+      >>> version = deck.get_state_version()
+      >>> other_deck.apply_state_delta(delta)
+
+    Args:
+      since_version: A version returned by :meth:`get_state_version`. Use 0 to get all state.
+
+    Returns:
+      A dictionary in the format of :meth:`serialize_all_state`, with the state of the resources
+      that changed, ordered by when they last changed.
+    """
+
+    changed: List[Resource] = []
+    for name in reversed(self._state_log):
+      if self._state_log[name] <= since_version:
+        break
+      changed.append(self._name_index[name])
+
+    if self.parent is not None:  # the log is shared by the whole tree, only keep this subtree
+      in_subtree = []
+      for resource in changed:
+        ancestor: Optional[Resource] = resource
+        while ancestor is not None and ancestor is not self:
+          ancestor = ancestor.parent
+        if ancestor is not None:
+          in_subtree.append(resource)
+      changed = in_subtree
+
+    return {resource.name: resource.serialize_state() for resource in reversed(changed)}
+
+  def apply_state_delta(self, delta: Dict[str, Dict[str, Any]]) -> None:
+    """Load state returned by :meth:`serialize_state_delta` or :meth:`serialize_all_state` into the
+    resources in this subtree with the same names.
+
+    Resources that were unassigned from the other tree are not removed from this subtree, see
+    :meth:`serialize_state_delta`.
+
+    Raises:
+      ResourceNotFoundError: If a resource in `delta` does not exist in this subtree, for example
+        because it was assigned to the other tree but not to this one.
+    """
+
+    for name, state in delta.items():
+      resource = self.get_resource(name)
+      resource.load_state(state)
+      resource._state_updated()
+
+  def _mark_state_changed(self) -> None:
+    """Record that the state of this resource changed, see :meth:`serialize_state_delta`."""
+    state_log = self._state_log
+    del state_log[self._name]
+    state_log[self._name] = next(_state_versions)
 
   # Developer note: this method deserializes the state of this resource only. If you want to
   # deserialize a custom state for a resource, override this method in the subclass.
@@ -719,12 +1068,17 @@ class Resource:
       child.load_state(state[child.name])
       child.load_all_state(state)
 
-  def save_state_to_file(self, fn: str, indent: Optional[int] = None):
+  def save_state_to_file(self, fn: str, indent: Optional[int] = None, compress: bool = False):
     """Save the state of this resource and all children to a JSON file.
 
+    The state is written while it is serialized, so the state of the whole tree is never held in
+    memory at once.
+
     Args:
       fn: File name. Caution: file will be overwritten.
       indent: Same as `json.dump`'s `indent` argument (for json pretty printing).
+      compress: If `True`, compress the file with gzip. This is useful for large checkpoints.
+        :meth:`load_state_from_file` detects compressed files automatically.
 
     Examples:
       Saving to a json file:
@@ -732,9 +1086,9 @@ class Resource:
       >>> deck.save_state_to_file("my_state.json")
     """
 
-    serialized = self.serialize_all_state()
-    with open(fn, "w", encoding="utf-8") as f:
-      json.dump(serialized, f, indent=indent)
+    json_codec.save(
+      json_codec.StreamedObject(self._iter_all_state()), fn, indent=indent, compress=compress
+    )
 
   def load_state_from_file(self, fn: str) -> None:
     """Load the state of this resource and all children from a JSON file.
@@ -748,9 +1102,7 @@ class Resource:
       >>> deck.load_state_from_file("my_state.json")
     """
 
-    with open(fn, "r", encoding="utf-8") as f:
-      content = json.load(f)
-    self.load_all_state(content)
+    self.load_all_state(json_codec.load_file(fn))
 
   def register_state_update_callback(self, callback: ResourceDidUpdateState):
     """Register a callback that will be called when the state of the resource changes."""
@@ -761,6 +1113,7 @@ class Resource:
     self._resource_state_updated_callbacks.remove(callback)
 
   def _state_updated(self):
+    self._mark_state_changed()
     for callback in self._resource_state_updated_callbacks:
       callback(self.serialize_state())
 
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
+
+if TYPE_CHECKING:
+  from .resource import Resource
+
+T = TypeVar("T", bound="Resource")
+
+# Resources by the sequence number of when they were added to the index. Resources are not used as
+# keys, because not all of them are hashable.
+_Bucket = Dict[int, "Resource"]
+
+_AXES = ("x", "y", "z")
+
+
+class ResourceIndex:
+  """Secondary indexes on the type, category, model and location of the descendants of a resource,
+  for fast queries. Use :meth:`of` to get the index of a resource, and :meth:`query` to search it.
+
+  The index is built on first use. It is kept up to date through the assign and unassign callbacks
+  of the resource, and when the location of an indexed resource is set. The category and model are
+  indexed when a resource is assigned. Query results are always checked against the current
+  attributes of a resource, but a resource whose category or model is changed after it is assigned
+  may not be found by these attributes.
+  """
+
+  def __init__(self, root: Resource):
+    self.root = root
+    self._seq = itertools.count()
+    self._seqs: Dict[int, int] = {}  # id of resource -> sequence number
+    self._all: _Bucket = {}
+    self._by_type: Dict[type, _Bucket] = {}
+    self._by_category: Dict[Optional[str], _Bucket] = {}
+    self._by_model: Dict[Optional[str], _Bucket] = {}
+    # axis -> coordinate -> bucket, of the location relative to the parent. The indexed location is
+    # remembered so that the resource can be found in its bucket when the location changes.
+    self._by_location: Dict[str, Dict[float, _Bucket]] = {axis: {} for axis in _AXES}
+    self._indexed_locations: Dict[int, Tuple[float, float, float]] = {}  # by sequence number
+
+    for child in root.children:
+      self._add(child)
+    root.register_did_assign_resource_callback(self._add)
+    root.register_will_unassign_resource_callback(self._remove)
+
+  @staticmethod
+  def of(resource: Resource) -> ResourceIndex:
+    """The index of the descendants of `resource`, created on first use."""
+    if resource._query_index is None:
+      resource._query_index = ResourceIndex(resource)
+    return resource._query_index
+
+  def __len__(self) -> int:
+    return len(self._all)
+
+  def _add(self, resource: Resource):
+    """Add a resource and its descendants, in depth first order."""
+
+    stack = [resource]
+    while len(stack) > 0:
+      r = stack.pop()
+      seq = next(self._seq)
+      self._seqs[id(r)] = seq
+      self._all[seq] = r
+      self._by_type.setdefault(type(r), {})[seq] = r
+      self._by_category.setdefault(r.category, {})[seq] = r
+      self._by_model.setdefault(r.model, {})[seq] = r
+      self._index_location(seq, r)
+      stack.extend(reversed(r.children))
+
+  def _remove(self, resource: Resource):
+    """Remove a resource and its descendants."""
+
+    stack = [resource]
+    while len(stack) > 0:
+      r = stack.pop()
+      seq = self._seqs.pop(id(r), None)
+      if seq is None:
+        continue
+      del self._all[seq]
+      self._discard(self._by_type, type(r), seq)
+      self._discard(self._by_category, r.category, seq)
+      self._discard(self._by_model, r.model, seq)
+      self._unindex_location(seq)
+      stack.extend(r.children)
+
+  @staticmethod
+  def _discard(buckets: Dict, key, seq: int):
+    if key in buckets and seq in buckets[key]:
+      keys = [key]
+    else:  # the attribute was changed after the resource was indexed
+      keys = [k for k, bucket in buckets.items() if seq in bucket]
+    for k in keys:
+      del buckets[k][seq]
+      if len(buckets[k]) == 0:
+        del buckets[k]
+
+  def _index_location(self, seq: int, resource: Resource):
+    location = resource.location
+    if location is None:
+      return
+    coordinates = (location.x, location.y, location.z)
+    for axis, value in zip(_AXES, coordinates):
+      self._by_location[axis].setdefault(value, {})[seq] = resource
+    self._indexed_locations[seq] = coordinates
+
+  def _unindex_location(self, seq: int):
+    coordinates = self._indexed_locations.pop(seq, None)
+    if coordinates is None:
+      return
+    for axis, value in zip(_AXES, coordinates):
+      self._discard(self._by_location[axis], value, seq)
+
+  def _location_changed(self, resource: Resource):
+    """Called when the location of a descendant of the root is set."""
+    seq = self._seqs.get(id(resource))
+    if seq is not None:
+      self._unindex_location(seq)
+      self._index_location(seq, resource)
+
+  def query(
+    self,
+    type_: Type[T] = None,  # type: ignore[assignment]
+    name: Optional[str] = None,
+    category: Optional[str] = None,
+    model: Optional[str] = None,
+    x: Optional[float] = None,
+    y: Optional[float] = None,
+    z: Optional[float] = None,
+  ) -> Iterator[T]:
+    """Lazily find the descendants of the root that match all given filters, in the order they were
+    added to the tree. See :func:`pylabrobot.resources.utils.query`.
+    """
+
+    # Start from the smallest bucket, and check the other filters on each resource.
+    candidates: List[Tuple[int, Iterable[Resource]]] = [(len(self._all), self._all.values())]
+    if type_ is not None:
+      buckets = [b for t, b in self._by_type.items() if issubclass(t, type_)]
+      candidates.append((sum(len(b) for b in buckets), _merge(buckets)))
+    if category is not None:
+      bucket = self._by_category.get(category, {})
+      candidates.append((len(bucket), bucket.values()))
+    if model is not None:
+      bucket = self._by_model.get(model, {})
+      candidates.append((len(bucket), bucket.values()))
+    for axis, value in zip(_AXES, (x, y, z)):
+      if value is not None:
+        bucket = self._by_location[axis].get(value, {})
+        # Resources are added to location buckets again when they move, so sort them.
+        candidates.append((len(bucket), [bucket[seq] for seq in sorted(bucket)]))
+    _, smallest = min(candidates, key=lambda c: c[0])
+
+    pattern = re.compile(name) if name is not None else None
+    return self._filter(list(smallest), type_, pattern, category, model, x, y, z)
+
+  @staticmethod
+  def _filter(
+    resources: List[Resource],
+    type_: Optional[type],
+    pattern: Optional[re.Pattern],
+    category: Optional[str],
+    model: Optional[str],
+    x: Optional[float],
+    y: Optional[float],
+    z: Optional[float],
+  ) -> Iterator:
+    for resource in resources:
+      if type_ is not None and not isinstance(resource, type_):
+        continue
+      if pattern is not None and pattern.match(resource.name) is None:
+        continue
+      if category is not None and resource.category != category:
+        continue
+      if model is not None and resource.model != model:
+        continue
+      if x is not None or y is not None or z is not None:
+        location = resource.location
+        if location is None:
+          continue
+        if x is not None and location.x != x:
+          continue
+        if y is not None and location.y != y:
+          continue
+        if z is not None and location.z != z:
+          continue
+      yield resource
+
+
+def _merge(buckets: List[_Bucket]) -> Iterable[Resource]:
+  """Merge buckets into one, ordered by sequence number."""
+  if len(buckets) == 1:
+    return buckets[0].values()
+  return (r for _, r in heapq.merge(*(b.items() for b in buckets)))
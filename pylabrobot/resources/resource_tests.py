@@ -1,12 +1,18 @@
+import gc
 import math
 import unittest
 import unittest.mock
 
+from pylabrobot.utils.object_parsing import find_subclass
+
 from .coordinate import Coordinate
 from .deck import Deck
 from .errors import ResourceNotFoundError
+from .plate import Plate
 from .resource import Resource
 from .rotation import Rotation
+from .utils import create_ordered_items_2d
+from .well import Well
 
 
 class TestResource(unittest.TestCase):
@@ -101,6 +107,44 @@ class TestResource(unittest.TestCase):
     with self.assertRaises(ValueError):
       root.assign_child_resource(grandchild2, location=Coordinate(5, 5, 5))
 
+  def test_name_index_merge_and_split(self):
+    root = Resource("root", size_x=10, size_y=10, size_z=10)
+    parent = Resource("parent", size_x=10, size_y=10, size_z=10)
+    child = Resource("child", size_x=5, size_y=5, size_z=5)
+    parent.assign_child_resource(child, location=Coordinate(5, 5, 5))
+    sibling = Resource("sibling", size_x=5, size_y=5, size_z=5)
+    root.assign_child_resource(sibling, location=Coordinate(0, 0, 0))
+
+    root.assign_child_resource(parent, location=Coordinate(5, 5, 5))
+    self.assertIs(root.get_resource("child"), child)
+    self.assertIs(parent.get_resource("child"), child)
+    with self.assertRaises(ResourceNotFoundError):  # not in the subtree of parent
+      parent.get_resource("sibling")
+    with self.assertRaises(ValueError):
+      root.assign_child_resource(
+        Resource("child", size_x=5, size_y=5, size_z=5), location=Coordinate(0, 0, 0)
+      )
+
+    root.unassign_child_resource(parent)
+    with self.assertRaises(ResourceNotFoundError):
+      root.get_resource("child")
+    self.assertIs(parent.get_resource("child"), child)
+    root.assign_child_resource(
+      Resource("child", size_x=5, size_y=5, size_z=5), location=Coordinate(0, 0, 0)
+    )
+
+  def test_rename_updates_name_index(self):
+    parent = Resource("parent", size_x=10, size_y=10, size_z=10)
+    parent.assign_child_resource(
+      Resource("child", size_x=5, size_y=5, size_z=5), location=Coordinate(0, 0, 0)
+    )
+    parent.name = "new_parent"
+    self.assertIs(parent.get_resource("new_parent"), parent)
+    with self.assertRaises(ResourceNotFoundError):
+      parent.get_resource("parent")
+    with self.assertRaises(ValueError):
+      parent.name = "child"
+
   def test_get_anchor(self):
     resource = Resource("test", size_x=12, size_y=12, size_z=12)
     self.assertEqual(
@@ -207,6 +251,13 @@ class TestResource(unittest.TestCase):
     child2 = Resource("child", size_x=5, size_y=5, size_z=5)
     self.assertEqual(child1, child2)
 
+  def test_hash(self):
+    r1 = Resource("r", size_x=10, size_y=10, size_z=10)
+    r2 = Resource("r", size_x=10, size_y=10, size_z=10)
+    self.assertEqual(hash(r1), hash(r2))
+    self.assertEqual(len({r1, r2}), 1)
+    self.assertEqual(len({r1, Resource("other", size_x=10, size_y=10, size_z=10)}), 2)
+
   def test_serialize(self):
     r = Resource("test", size_x=10, size_y=10, size_z=10)
     self.assertEqual(
@@ -292,6 +343,31 @@ class TestResource(unittest.TestCase):
     r.assign_child_resource(c, location=Coordinate.zero())
     self.assertEqual(Resource.deserialize(r.serialize()), r)
 
+  def test_deserialize_subclass(self):
+    class CustomResource(Resource):
+      pass
+
+    r = Resource("test", size_x=10, size_y=10, size_z=10)
+    c = CustomResource("child", size_x=1, size_y=1, size_z=1)
+    r.assign_child_resource(c, location=Coordinate(1, 2, 3))
+    deserialized = Resource.deserialize(r.serialize())
+    self.assertEqual(deserialized, r)
+    self.assertIsInstance(deserialized.get_resource("child"), CustomResource)
+
+    with self.assertRaises(ValueError):
+      Resource.deserialize({**c.serialize(), "type": "DoesNotExist"})
+
+  def test_deserialize_shadowed_subclass(self):
+    # a class with the same name as a library class, like one defined in a test
+    shadowing_class = type("Plate", (Resource,), {})
+    self.assertIs(find_subclass("Plate", cls=Resource), Plate)
+    del shadowing_class
+    gc.collect()
+    self.assertIs(find_subclass("Plate", cls=Resource), Plate)
+
+    plate = Plate("plate", size_x=1, size_y=1, size_z=1, ordered_items={})
+    self.assertIsInstance(Resource.deserialize(plate.serialize()), Plate)
+
   def test_get_center_offsets(self):
     r = Resource("test", size_x=10, size_y=120, size_z=10)
     self.assertEqual(r.centers(), [Coordinate(5.0, 60, 5.0)])
@@ -371,6 +447,263 @@ class TestResource(unittest.TestCase):
     self.assertAlmostEqual(r.get_absolute_size_y(), 100)
     self.assertEqual(c.get_absolute_location(), Coordinate(20, 10, 10))
 
+  def _make_chain(self, depth: int):
+    root = Resource("root", size_x=100, size_y=100, size_z=10)
+    root.location = Coordinate(1, 2, 3)
+    chain = [root]
+    for i in range(depth):
+      r = Resource(f"r{i}", size_x=10, size_y=10, size_z=10)
+      chain[-1].assign_child_resource(r, location=Coordinate(1, 1, 1))
+      chain.append(r)
+    return chain
+
+  def test_absolute_location_is_cached(self):
+    chain = self._make_chain(depth=10)
+    leaf = chain[-1]
+    self.assertEqual(leaf.get_absolute_location(), Coordinate(11, 12, 13))
+
+    with unittest.mock.patch.object(
+      Rotation, "get_rotation_matrix", side_effect=AssertionError("not cached")
+    ):
+      for _ in range(1000):
+        self.assertEqual(leaf.get_absolute_location(), Coordinate(11, 12, 13))
+        self.assertEqual(leaf.get_absolute_size_x(), 10)
+
+  def test_absolute_location_cache_invalidation(self):
+    chain = self._make_chain(depth=3)
+    leaf = chain[-1]
+    self.assertEqual(leaf.get_absolute_location(), Coordinate(4, 5, 6))
+
+    # location change of an ancestor
+    chain[1].location = Coordinate(2, 2, 2)
+    self.assertEqual(leaf.get_absolute_location(), Coordinate(5, 6, 7))
+
+    # rotation of an ancestor, both through `rotate` and through mutating the rotation directly
+    chain[0].rotate(z=90)
+    self.assertEqual(leaf.get_absolute_location(), Coordinate(-3, 6, 7))
+    self.assertEqual(leaf.get_absolute_rotation().z, 90)
+    chain[0].rotation.z = 0
+    self.assertEqual(leaf.get_absolute_location(), Coordinate(5, 6, 7))
+    chain[0].rotation = Rotation(z=180)
+    self.assertEqual(leaf.get_absolute_location(), Coordinate(-3, -2, 7))
+    chain[0].rotation = Rotation()
+
+    # reassignment to another parent
+    other = Resource("other", size_x=10, size_y=10, size_z=10)
+    other.location = Coordinate(100, 100, 100)
+    chain[2].unassign_child_resource(leaf)
+    other.assign_child_resource(leaf, location=Coordinate(1, 1, 1))
+    self.assertEqual(leaf.get_absolute_location(), Coordinate(101, 101, 101))
+
+
+class TestResourceCopy(unittest.TestCase):
+  def setUp(self) -> None:
+    self.deck = Deck()
+    self.plate = Plate(
+      "plate",
+      size_x=127,
+      size_y=86,
+      size_z=14,
+      ordered_items=create_ordered_items_2d(
+        Well,
+        num_items_x=12,
+        num_items_y=8,
+        dx=10,
+        dy=7,
+        dz=1,
+        item_dx=9,
+        item_dy=9,
+        size_x=7,
+        size_y=7,
+        size_z=10,
+        max_volume=300,
+      ),
+    )
+    self.deck.assign_child_resource(self.plate, location=Coordinate(100, 100, 0))
+    self.plate.get_well("A1").set_liquids([(None, 100)])
+
+  def test_copy(self):
+    plate_copy = self.plate.copy()
+    self.assertIsNot(plate_copy, self.plate)
+    self.assertIsNone(plate_copy.parent)
+    self.assertIsNone(plate_copy.location)
+    self.assertEqual(plate_copy.name, "plate")
+    self.assertEqual(plate_copy.children, self.plate.children)
+    self.assertEqual(plate_copy.serialize_all_state(), self.plate.serialize_all_state())
+    for well, well_copy in zip(self.plate.children, plate_copy.children):
+      self.assertIsNot(well, well_copy)
+      self.assertIs(well_copy.parent, plate_copy)
+      self.assertIsNot(well_copy.tracker, well.tracker)
+
+    # the copy has its own name index and can be assigned to another tree
+    self.assertIs(plate_copy.get_resource("plate_well_0_0"), plate_copy.get_well("A1"))
+    self.assertIs(self.deck.get_resource("plate_well_0_0"), self.plate.get_well("A1"))
+    other_deck = Deck()
+    other_deck.assign_child_resource(plate_copy, location=Coordinate(300, 100, 0))
+    self.assertIs(other_deck.get_resource("plate_well_0_0"), plate_copy.get_well("A1"))
+    self.assertEqual(plate_copy.get_well("A1").get_absolute_location(), Coordinate(310, 170, 1))
+
+  def test_copy_state_is_independent(self):
+    plate_copy = self.plate.copy()
+    plate_copy.get_well("A1").tracker.remove_liquid(50)
+    plate_copy.get_well("A1").tracker.commit()
+    self.assertEqual(plate_copy.get_well("A1").tracker.get_used_volume(), 50)
+    self.assertEqual(self.plate.get_well("A1").tracker.get_used_volume(), 100)
+
+  def test_copy_callbacks(self):
+    external_callback = unittest.mock.Mock()
+    self.plate.get_well("A1").register_state_update_callback(external_callback)
+
+    plate_copy = self.plate.copy()
+    state_callback = unittest.mock.Mock()
+    plate_copy.get_well("A1").register_state_update_callback(state_callback)
+    plate_copy.get_well("A1").set_liquids([(None, 10)])
+    state_callback.assert_called_once()
+    external_callback.assert_not_called()
+
+    # callbacks inside the subtree are propagated up the tree of the copy
+    did_assign = unittest.mock.Mock()
+    plate_copy.register_did_assign_resource_callback(did_assign)
+    child = Resource("child", size_x=1, size_y=1, size_z=1)
+    plate_copy.get_well("A1").assign_child_resource(child, location=Coordinate.zero())
+    did_assign.assert_called_once_with(child)
+
+  def test_copy_tracker_callbacks(self):
+    tracker_callback = unittest.mock.Mock()
+    self.plate.get_well("A1").tracker.register_callback(lambda: tracker_callback())
+
+    plate_copy = self.plate.copy()
+    plate_copy.get_well("A1").tracker.add_liquid(None, 10)
+    plate_copy.get_well("A1").tracker.commit()
+    tracker_callback.assert_not_called()
+
+    # callbacks bound to a resource in the subtree are bound to its copy
+    state_callback = unittest.mock.Mock()
+    well_copy = plate_copy.get_well("B1")
+    well_copy.register_state_update_callback(state_callback)
+    well_copy.tracker.add_liquid(None, 10)
+    well_copy.tracker.commit()
+    state_callback.assert_called()
+
+  def test_rotated(self):
+    plate_rotated = self.plate.rotated(z=90)
+    self.assertEqual(plate_rotated.rotation.z, 90)
+    self.assertEqual(self.plate.rotation.z, 0)
+    self.assertAlmostEqual(plate_rotated.get_absolute_size_x(), 86)
+
+  def test_temporarily_rotated(self):
+    with self.plate.temporarily_rotated(z=90) as plate_rotated:
+      self.assertIs(plate_rotated, self.plate)
+      self.assertEqual(self.plate.rotation.z, 90)
+      self.assertAlmostEqual(self.plate.get_absolute_size_x(), 86)
+    self.assertEqual(self.plate.rotation.z, 0)
+    self.assertAlmostEqual(self.plate.get_absolute_size_x(), 127)
+    self.assertEqual(self.plate.get_well("A1").get_absolute_location(), Coordinate(110, 170, 1))
+
+    with self.assertRaises(RuntimeError):
+      with self.plate.temporarily_rotated(z=270):
+        raise RuntimeError
+    self.assertEqual(self.plate.rotation.z, 0)
+
+  def test_get_rotated_size(self):
+    with unittest.mock.patch.object(Resource, "copy", side_effect=AssertionError("copied")):
+      size = self.plate.get_rotated_size(Rotation(z=90))
+    self.assertAlmostEqual(size.x, 86)
+    self.assertAlmostEqual(size.y, 127)
+    self.assertAlmostEqual(size.z, self.plate.get_size_z())
+    self.assertEqual(self.plate.rotation.z, 0)
+
+
+class TestResourceStateDelta(unittest.TestCase):
+  def setUp(self) -> None:
+    self.deck = Deck()
+    self.plate = Plate(
+      "plate",
+      size_x=127,
+      size_y=86,
+      size_z=14,
+      ordered_items=create_ordered_items_2d(
+        Well,
+        num_items_x=12,
+        num_items_y=8,
+        dx=10,
+        dy=7,
+        dz=1,
+        item_dx=9,
+        item_dy=9,
+        size_x=7,
+        size_y=7,
+        size_z=10,
+        max_volume=300,
+      ),
+    )
+    self.deck.assign_child_resource(self.plate, location=Coordinate(100, 100, 0))
+    for well in self.plate.get_all_items():
+      well.set_liquids([(None, 100)])
+
+  def test_delta(self):
+    version = self.deck.get_state_version()
+    self.assertEqual(self.deck.serialize_state_delta(version), {})
+
+    for well in self.plate["A1:H1"]:
+      well.tracker.remove_liquid(10)
+      well.tracker.commit()
+    delta = self.deck.serialize_state_delta(version)
+    self.assertEqual(list(delta), [f"plate_well_0_{i}" for i in range(8)])
+    self.assertEqual(delta["plate_well_0_0"], self.plate.get_well("A1").serialize_state())
+
+    version = self.deck.get_state_version()
+    self.plate.get_well("B2").tracker.add_liquid(None, 10)  # pending operations are state too
+    self.assertEqual(list(self.deck.serialize_state_delta(version)), ["plate_well_1_1"])
+    version = self.deck.get_state_version()
+    self.plate.get_well("B2").tracker.rollback()
+    self.assertEqual(list(self.deck.serialize_state_delta(version)), ["plate_well_1_1"])
+
+  def test_delta_since_zero(self):
+    self.assertEqual(self.deck.serialize_state_delta(0), self.deck.serialize_all_state())
+    self.assertEqual(self.plate.serialize_state_delta(0), self.plate.serialize_all_state())
+
+  def test_delta_of_subtree(self):
+    other = Resource("other", size_x=1, size_y=1, size_z=1)
+    self.deck.assign_child_resource(other, location=Coordinate(0, 0, 0))
+    version = self.deck.get_state_version()
+    other._state_updated()
+    self.plate.get_well("A1").set_liquids([(None, 1)])
+    self.assertEqual(list(self.plate.serialize_state_delta(version)), ["plate_well_0_0"])
+    self.assertEqual(list(self.deck.serialize_state_delta(version)), ["other", "plate_well_0_0"])
+
+  def test_assigned_resources_are_changed(self):
+    r = Resource("r", size_x=1, size_y=1, size_z=1)
+    r.assign_child_resource(Resource("c", size_x=1, size_y=1, size_z=1), location=Coordinate.zero())
+    version = self.deck.get_state_version()
+    self.deck.assign_child_resource(r, location=Coordinate(0, 0, 0))
+    self.assertEqual(list(self.deck.serialize_state_delta(version)), ["r", "c"])
+
+    version = self.deck.get_state_version()
+    self.deck.unassign_child_resource(self.plate)
+    self.assertIsNot(self.plate._state_log, self.deck._state_log)
+    self.plate.get_well("A1").set_liquids([(None, 1)])
+    self.assertEqual(self.deck.serialize_state_delta(version), {})
+    self.assertEqual(list(self.plate.serialize_state_delta(version))[-1], "plate_well_0_0")
+
+  def test_apply_state_delta(self):
+    plate_copy = self.plate.copy()
+    version = self.plate.get_state_version()
+    for well in self.plate["A1:H1"]:
+      well.tracker.remove_liquid(10)
+      well.tracker.commit()
+
+    state_callback = unittest.mock.Mock()
+    plate_copy.get_well("A1").register_state_update_callback(state_callback)
+    copy_version = plate_copy.get_state_version()
+    plate_copy.apply_state_delta(self.plate.serialize_state_delta(version))
+    self.assertEqual(plate_copy.serialize_all_state(), self.plate.serialize_all_state())
+    self.assertEqual(len(plate_copy.serialize_state_delta(copy_version)), 8)
+    state_callback.assert_called_once()
+
+    with self.assertRaises(ResourceNotFoundError):
+      plate_copy.apply_state_delta({"does_not_exist": {}})
+
 
 class TestResourceCallback(unittest.TestCase):
   def setUp(self) -> None:
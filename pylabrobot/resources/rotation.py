@@ -1,17 +1,57 @@
 import math
+from typing import Callable, Dict, List, Optional, Tuple
 
 from pylabrobot.utils.linalg import matrix_multiply_3x3
 
+RotationDidChangeCallback = Callable[[], None]
+
+# Rotation matrices by angles, shared by all rotations. Resources almost always use the same few
+# angles, so this stays small. It is bounded in case many different angles are used.
+_rotation_matrices: Dict[Tuple[float, float, float], List[List[float]]] = {}
+_MAX_CACHED_ROTATION_MATRICES = 1024
+
 
 class Rotation:
   """Represents a 3D rotation."""
 
   def __init__(self, x: float = 0, y: float = 0, z: float = 0):
+    self._rotation_matrix: Optional[List[List[float]]] = None
+    self._change_callbacks: List[RotationDidChangeCallback] = []
     self.x = x  # around x-axis, roll
     self.y = y  # around y-axis, pitch
     self.z = z  # around z-axis, yaw
 
+  def __setattr__(self, name, value):
+    super().__setattr__(name, value)
+    if name in {"x", "y", "z"}:
+      self._rotation_matrix = None
+      for callback in self._change_callbacks:
+        callback()
+
+  def register_change_callback(self, callback: RotationDidChangeCallback):
+    """Add a callback that will be called when any of the angles of this rotation change."""
+    self._change_callbacks.append(callback)
+
+  def deregister_change_callback(self, callback: RotationDidChangeCallback):
+    """Remove a callback that will be called when any of the angles of this rotation change."""
+    self._change_callbacks.remove(callback)
+
   def get_rotation_matrix(self):
+    """Get the rotation matrix. The matrix is cached until one of the angles changes."""
+    if self._rotation_matrix is None:
+      angles = (self.x, self.y, self.z)
+      rotation_matrix = _rotation_matrices.get(angles)
+      if rotation_matrix is None:
+        rotation_matrix = self._compute_rotation_matrix()
+        if len(_rotation_matrices) < _MAX_CACHED_ROTATION_MATRICES:
+          _rotation_matrices[angles] = rotation_matrix
+      self._rotation_matrix = rotation_matrix
+    return self._rotation_matrix
+
+  def _compute_rotation_matrix(self):
+    if self.x == 0 and self.y == 0 and self.z == 0:  # most resources are not rotated
+      return [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+
     # Create rotation matrices for each axis
     Rz = [
       [
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .errors import NoLocationError
+
+if TYPE_CHECKING:
+  from .resource import Resource
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+  """An axis-aligned box in absolute coordinates. Use `float("inf")` for unbounded sides."""
+
+  x_min: float
+  y_min: float
+  z_min: float
+  x_max: float
+  y_max: float
+  z_max: float
+
+  def intersects(self, other: BoundingBox) -> bool:
+    """Return `True` if the boxes overlap. Boxes that only touch do not overlap."""
+    return (
+      self.x_min < other.x_max
+      and other.x_min < self.x_max
+      and self.y_min < other.y_max
+      and other.y_min < self.y_max
+      and self.z_min < other.z_max
+      and other.z_min < self.z_max
+    )
+
+  def union(self, other: BoundingBox) -> BoundingBox:
+    """The smallest box containing both boxes."""
+    return BoundingBox(
+      x_min=min(self.x_min, other.x_min),
+      y_min=min(self.y_min, other.y_min),
+      z_min=min(self.z_min, other.z_min),
+      x_max=max(self.x_max, other.x_max),
+      y_max=max(self.y_max, other.y_max),
+      z_max=max(self.z_max, other.z_max),
+    )
+
+  @staticmethod
+  def of_resource(resource: Resource) -> BoundingBox:
+    """The bounding box of a resource, taking its absolute rotation into account.
+
+    Raises:
+      NoLocationError: If the resource or one of its ancestors has no location.
+    """
+
+    origin = resource.get_absolute_location()
+    rotation = resource.get_absolute_rotation()
+    if rotation.x % 360 == 0 and rotation.y % 360 == 0 and rotation.z % 90 == 0:
+      # Quarter turns around z only swap and mirror the sides, so no rotation matrix is needed.
+      size_x, size_y = resource.get_size_x(), resource.get_size_y()
+      x_min, x_max, y_min, y_max = {
+        0: (0, size_x, 0, size_y),
+        90: (-size_y, 0, 0, size_x),
+        180: (-size_x, 0, -size_y, 0),
+        270: (0, size_y, -size_x, 0),
+      }[round(rotation.z) % 360]
+      return BoundingBox(
+        x_min=origin.x + x_min,
+        y_min=origin.y + y_min,
+        z_min=origin.z,
+        x_max=origin.x + x_max,
+        y_max=origin.y + y_max,
+        z_max=origin.z + resource.get_size_z(),
+      )
+
+    corners = resource._get_rotated_corners()
+    return BoundingBox(
+      x_min=origin.x + min(c.x for c in corners),
+      y_min=origin.y + min(c.y for c in corners),
+      z_min=origin.z + min(c.z for c in corners),
+      x_max=origin.x + max(c.x for c in corners),
+      y_max=origin.y + max(c.y for c in corners),
+      z_max=origin.z + max(c.z for c in corners),
+    )
+
+  @staticmethod
+  def of_subtree(resource: Resource) -> Optional[BoundingBox]:
+    """The bounding box of a resource and all its children, or `None` if the resource has no
+    location. Children without a location are ignored."""
+
+    try:
+      box = BoundingBox.of_resource(resource)
+    except NoLocationError:
+      return None
+
+    stack = list(resource.children)
+    while len(stack) > 0:
+      child = stack.pop()
+      if child.location is None:
+        continue
+      box = box.union(BoundingBox.of_resource(child))
+      stack.extend(child.children)
+    return box
+
+
+class SpatialIndex:
+  """An index of resources by bounding box, to quickly find which resources occupy a region.
+
+  Boxes are kept sorted by their left side. A query only looks at the boxes whose left side is
+  between the left side of the region minus the width of the widest box, and the right side of the
+  region. That is a binary search plus the boxes close to the region, because the resources on a
+  deck are laid out side by side.
+  """
+
+  def __init__(self):
+    self._resources: Dict[str, Resource] = {}
+    self._boxes: Dict[str, BoundingBox] = {}
+    self._x_mins: List[float] = []  # sorted
+    self._names: List[str] = []  # in the same order as `_x_mins`
+    self._max_width = 0.0
+
+  def __len__(self) -> int:
+    return len(self._boxes)
+
+  def __contains__(self, name: str) -> bool:
+    return name in self._boxes
+
+  def insert(self, resource: Resource, box: BoundingBox) -> None:
+    """Add a resource, or update its box if it is already in the index."""
+
+    if resource.name in self._boxes:
+      self.remove(resource.name)
+    i = bisect.bisect_right(self._x_mins, box.x_min)
+    self._x_mins.insert(i, box.x_min)
+    self._names.insert(i, resource.name)
+    self._resources[resource.name] = resource
+    self._boxes[resource.name] = box
+    self._max_width = max(self._max_width, box.x_max - box.x_min)
+
+  def remove(self, name: str) -> None:
+    """Remove a resource from the index.
+
+    Raises:
+      KeyError: If the resource is not in the index.
+    """
+
+    box = self._boxes.pop(name)
+    del self._resources[name]
+    i = bisect.bisect_left(self._x_mins, box.x_min)
+    while self._names[i] != name:
+      i += 1
+    del self._x_mins[i]
+    del self._names[i]
+    if box.x_max - box.x_min >= self._max_width:
+      self._max_width = max((b.x_max - b.x_min for b in self._boxes.values()), default=0.0)
+
+  def get_bounding_box(self, name: str) -> BoundingBox:
+    """The box of a resource in the index.
+
+    Raises:
+      KeyError: If the resource is not in the index.
+    """
+    return self._boxes[name]
+
+  def query(self, region: BoundingBox) -> List[Resource]:
+    """The resources whose boxes overlap `region`, from left to right."""
+
+    start = bisect.bisect_left(self._x_mins, region.x_min - self._max_width)
+    end = bisect.bisect_left(self._x_mins, region.x_max)
+    return [
+      self._resources[name]
+      for name in self._names[start:end]
+      if self._boxes[name].intersects(region)
+    ]
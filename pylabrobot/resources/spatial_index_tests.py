@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from pylabrobot.resources.coordinate import Coordinate
+from pylabrobot.resources.resource import Resource
+from pylabrobot.resources.rotation import Rotation
+from pylabrobot.resources.spatial_index import BoundingBox, SpatialIndex
+
+
+class BoundingBoxTests(unittest.TestCase):
+  def test_intersects(self):
+    box = BoundingBox(0, 0, 0, 10, 10, 10)
+    self.assertTrue(box.intersects(BoundingBox(5, 5, 5, 15, 15, 15)))
+    self.assertTrue(box.intersects(BoundingBox(2, 2, 2, 3, 3, 3)))
+    self.assertFalse(box.intersects(BoundingBox(10, 0, 0, 20, 10, 10)))  # touching
+    self.assertFalse(box.intersects(BoundingBox(0, 0, 11, 10, 10, 20)))
+
+  def test_of_subtree(self):
+    parent = Resource("parent", size_x=10, size_y=10, size_z=10)
+    parent.location = Coordinate(1, 2, 3)
+    child = Resource("child", size_x=5, size_y=20, size_z=5)
+    parent.assign_child_resource(child, location=Coordinate(8, 0, 10))
+    parent.assign_child_resource(Resource("nowhere", 1, 1, 1), location=None)
+    self.assertEqual(BoundingBox.of_subtree(parent), BoundingBox(1, 2, 3, 14, 22, 18))
+    self.assertIsNone(BoundingBox.of_subtree(Resource("r", size_x=1, size_y=1, size_z=1)))
+
+  def test_of_rotated_resource(self):
+    r = Resource("r", size_x=10, size_y=20, size_z=5, rotation=Rotation(z=90))
+    r.location = Coordinate(100, 0, 0)
+    self.assertEqual(BoundingBox.of_resource(r), BoundingBox(80, 0, 0, 100, 10, 5))
+
+
+class SpatialIndexTests(unittest.TestCase):
+  def test_query_same_as_linear_search(self):
+    rng = random.Random(0)
+    index = SpatialIndex()
+    boxes = {}
+    for i in range(200):
+      x, y = rng.uniform(0, 1000), rng.uniform(0, 500)
+      box = BoundingBox(x, y, 0, x + rng.uniform(1, 100), y + rng.uniform(1, 100), 100)
+      resource = Resource(f"r{i}", size_x=1, size_y=1, size_z=1)
+      index.insert(resource, box)
+      boxes[resource.name] = (resource, box)
+    for i in range(0, 200, 3):  # remove some, including the widest
+      index.remove(f"r{i}")
+      del boxes[f"r{i}"]
+    self.assertEqual(len(index), len(boxes))
+
+    for _ in range(100):
+      x, y = rng.uniform(0, 1000), rng.uniform(0, 500)
+      region = BoundingBox(x, y, 0, x + rng.uniform(0, 50), y + rng.uniform(0, 50), 1)
+      expected = {name for name, (_, box) in boxes.items() if box.intersects(region)}
+      self.assertEqual({r.name for r in index.query(region)}, expected)
+
+  def test_insert_updates(self):
+    index = SpatialIndex()
+    r = Resource("r", size_x=1, size_y=1, size_z=1)
+    index.insert(r, BoundingBox(0, 0, 0, 1, 1, 1))
+    index.insert(r, BoundingBox(10, 0, 0, 11, 1, 1))
+    self.assertEqual(len(index), 1)
+    self.assertEqual(index.query(BoundingBox(0, 0, 0, 2, 2, 2)), [])
+    self.assertEqual(index.query(BoundingBox(10, 0, 0, 12, 2, 2)), [r])
@@ -0,0 +1,84 @@
+from typing import List, Sequence
+
+from .errors import NoTipError
+from .tip_rack import TipRack, TipSpot
+
+
+class TipInventory:
+  """Finds available tips across tip racks, for example all tip racks on a deck.
+
+  Each tip rack keeps bitsets of which of its tip spots have a tip and which are reserved, that are
+  updated when tips are picked up or dropped. Finding the next tips therefore does not check every
+  tip spot, see :meth:`pylabrobot.resources.TipRack.find_tip_spots`.
+
+  Examples:
+    Picking up the next column of tips on the deck:
+
+    >>> inventory = TipInventory(query(lh.deck, TipRack))
+    >>> tip_spots = inventory.get_next_tips(8, column_aligned=True)
+    >>> await lh.pick_up_tips(tip_spots)
+  """
+
+  def __init__(self, tip_racks: Sequence[TipRack]):
+    """
+    Args:
+      tip_racks: The tip racks to take tips from, in the order they should be used.
+    """
+    self.tip_racks = list(tip_racks)
+
+  def get_num_available_tips(self) -> int:
+    """The number of tips that are not reserved, in all tip racks."""
+    return sum(tip_rack.get_num_available_tips() for tip_rack in self.tip_racks)
+
+  def get_next_tips(
+    self,
+    n: int,
+    column_aligned: bool = False,
+    reserve: bool = True,
+  ) -> List[TipSpot]:
+    """Get the tip spots of the next `n` available tips, from the first tip racks.
+
+    Args:
+      n: The number of tips.
+      column_aligned: If `True`, the tips are in consecutive rows of one column of one tip rack, so
+        that they can be picked up by adjacent channels at once. Otherwise, the tips may be spread
+        over multiple tip racks.
+      reserve: If `True`, reserve the tip spots so that they are not returned again until they are
+        picked up or released with :meth:`release`.
+
+    Raises:
+      NoTipError: If there are not enough available tips.
+    """
+
+    if column_aligned:
+      for tip_rack in self.tip_racks:
+        tip_spots = tip_rack.find_tip_spots(n, column_aligned=True, reserve=reserve)
+        if tip_spots is not None:
+          return tip_spots
+      raise NoTipError(f"No {n} column aligned tips available.")
+
+    if self.get_num_available_tips() < n:
+      raise NoTipError(f"Not enough tips available, requested {n}.")
+    result: List[TipSpot] = []
+    for tip_rack in self.tip_racks:
+      num_tips = min(n - len(result), tip_rack.get_num_available_tips())
+      if num_tips > 0:
+        result.extend(tip_rack.find_tip_spots(num_tips, reserve=reserve) or [])
+      if len(result) == n:
+        break
+    return result
+
+  def release(self, tip_spots: Sequence[TipSpot]) -> None:
+    """Release reserved tip spots, so that they can be returned by :meth:`get_next_tips` again.
+
+    Raises:
+      ValueError: If a tip spot is not in a tip rack of this inventory.
+    """
+
+    for tip_spot in tip_spots:
+      if not any(tip_spot.parent is tip_rack for tip_rack in self.tip_racks):
+        raise ValueError(f"Tip spot '{tip_spot.name}' is not in a tip rack of this inventory.")
+    for tip_rack in self.tip_racks:
+      in_rack = [tip_spot for tip_spot in tip_spots if tip_spot.parent is tip_rack]
+      if len(in_rack) > 0:
+        tip_rack.release_tip_spots(in_rack)
@@ -0,0 +1,88 @@
+import unittest
+
+from pylabrobot.resources.errors import NoTipError
+from pylabrobot.resources.hamilton import HTF
+from pylabrobot.resources.tip_inventory import TipInventory
+
+
+class TipInventoryTests(unittest.TestCase):
+  def setUp(self):
+    super().setUp()
+    self.tip_rack_1 = HTF("tip_rack_1")
+    self.tip_rack_2 = HTF("tip_rack_2")
+    self.inventory = TipInventory([self.tip_rack_1, self.tip_rack_2])
+
+  def test_get_next_tips(self):
+    self.assertEqual(self.inventory.get_num_available_tips(), 192)
+    self.assertEqual(self.inventory.get_next_tips(3), self.tip_rack_1["A1:C1"])
+    self.assertEqual(self.inventory.get_next_tips(2), self.tip_rack_1["D1:E1"])
+    self.assertEqual(self.inventory.get_num_available_tips(), 187)
+
+  def test_get_next_tips_across_tip_racks(self):
+    self.inventory.get_next_tips(90)
+    tip_spots = self.inventory.get_next_tips(8)
+    self.assertEqual(tip_spots, self.tip_rack_1["C12:H12"] + self.tip_rack_2["A1:B1"])
+
+  def test_column_aligned(self):
+    self.tip_rack_1.set_tip_state({"C1": False})
+    self.assertEqual(self.inventory.get_next_tips(8, column_aligned=True), self.tip_rack_1["A2:H2"])
+    self.assertEqual(self.inventory.get_next_tips(2, column_aligned=True), self.tip_rack_1["A1:B1"])
+    # D1:H1 is the first run of 4, the run of 2 at G1:H1 can not wrap around into the next column
+    self.assertEqual(self.inventory.get_next_tips(4, column_aligned=True), self.tip_rack_1["D1:G1"])
+    self.assertEqual(self.inventory.get_next_tips(2, column_aligned=True), self.tip_rack_1["A3:B3"])
+
+  def test_column_aligned_next_tip_rack(self):
+    self.tip_rack_1.empty()
+    self.tip_rack_1.set_tip_state({f"A{column}": True for column in range(1, 13)})
+    self.assertEqual(self.inventory.get_next_tips(8, column_aligned=True), self.tip_rack_2["A1:H1"])
+
+  def test_not_enough_tips(self):
+    self.tip_rack_1.empty()
+    self.tip_rack_2.empty()
+    self.tip_rack_2.set_tip_state({f"A{column}": True for column in range(1, 13)})
+    with self.assertRaises(NoTipError):
+      self.inventory.get_next_tips(13)
+    with self.assertRaises(NoTipError):
+      self.inventory.get_next_tips(2, column_aligned=True)
+    self.assertEqual(len(self.inventory.get_next_tips(12)), 12)
+    self.assertEqual(self.inventory.get_num_available_tips(), 0)
+
+  def test_follows_tip_state(self):
+    tip_spot = self.tip_rack_1.get_item("A1")
+    tip_spot.tracker.remove_tip()
+    b1 = self.tip_rack_1.get_item("B1")
+    self.assertEqual(self.inventory.get_next_tips(1, reserve=False), [b1])
+    tip_spot.tracker.rollback()
+    self.assertEqual(self.inventory.get_next_tips(1, reserve=False), [tip_spot])
+
+  def test_reservation_ends_when_tip_is_picked_up(self):
+    tip_spots = self.inventory.get_next_tips(2)
+    tip_spots[0].tracker.remove_tip(commit=True)
+    self.assertEqual(self.tip_rack_1.get_reserved_tip_spots(), [tip_spots[1]])
+    tip_spots[0].tracker.add_tip(tip_spots[0].make_tip(), commit=True)
+    self.assertEqual(self.inventory.get_next_tips(1), [tip_spots[0]])
+
+  def test_reservation_ends_before_tips_are_counted(self):
+    tip_rack = HTF("tip_rack")
+    tip_spot = tip_rack.get_item("A1")
+    tip_rack.reserve_tip_spots([tip_spot])
+    tip_spot.tracker.remove_tip(commit=True)
+    self.assertEqual(tip_rack.get_reserved_tip_spots(), [])
+
+  def test_release(self):
+    tip_spots = self.inventory.get_next_tips(8)
+    self.inventory.release(tip_spots[2:])
+    self.assertEqual(self.inventory.get_next_tips(6), tip_spots[2:])
+    with self.assertRaises(ValueError):
+      self.inventory.release([HTF("other")["A1"][0]])
+
+  def test_reservations_are_state(self):
+    self.inventory.get_next_tips(3)
+    state = self.tip_rack_1.serialize_all_state()
+    self.assertEqual(state["tip_rack_1"], {"reserved": ["A1", "B1", "C1"]})
+
+    tip_rack = HTF("tip_rack_1")
+    tip_rack.load_all_state(state)
+    tip_rack.load_state(state["tip_rack_1"])
+    self.assertEqual(tip_rack.get_reserved_tip_spots(), tip_rack["A1:C1"])
+    self.assertEqual(tip_rack.find_tip_spots(1), [tip_rack.get_item("D1")])
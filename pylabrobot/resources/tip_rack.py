@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from abc import ABCMeta
-from typing import Any, Dict, List, Optional, Sequence, Union, cast
+from string import ascii_uppercase as LETTERS
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, cast
 
 from pylabrobot.resources.coordinate import Coordinate
 from pylabrobot.resources.tip import Tip, TipCreator
@@ -51,6 +52,12 @@ class TipSpot(Resource):
     self.make_tip = make_tip
 
     self.tracker.register_callback(self._state_updated)
+    self.tracker.register_change_callback(self._tip_state_changed)
+
+  def _tip_state_changed(self) -> None:
+    self._mark_state_changed()
+    if isinstance(self.parent, TipRack):
+      self.parent._tip_spot_changed(self)
 
   def get_tip(self) -> Tip:
     """Get a tip from the tip spot."""
@@ -125,6 +132,13 @@ class TipRack(ItemizedResource[TipSpot], metaclass=ABCMeta):
     model: Optional[str] = None,
     with_tips: bool = True,
   ):
+    # Bitsets of the tip spots, by index: spots that have a tip (including pending operations),
+    # computed on first use, and spots that are reserved, see `find_tip_spots`. Children are
+    # assigned by the super constructor, which resets these, so they are set first.
+    self._tip_bits: Optional[int] = None
+    self._reserved_bits = 0
+    self._run_start_masks: Dict[int, int] = {}
+
     super().__init__(
       name,
       size_x,
@@ -189,10 +203,11 @@ class TipRack(ItemizedResource[TipSpot], metaclass=ABCMeta):
       should_have = cast(Dict[Union[int, str], bool], tips)  # type?
 
     for identifier, should_have_tip in should_have.items():
-      if should_have_tip and not self.get_item(identifier).has_tip():
-        self.get_item(identifier).tracker.add_tip(self.get_item(identifier).make_tip(), commit=True)
-      elif not should_have_tip and self.get_item(identifier).has_tip():
-        self.get_item(identifier).tracker.remove_tip(commit=True)
+      tip_spot = self.get_item(identifier)
+      if should_have_tip and not tip_spot.has_tip():
+        tip_spot.tracker.add_tip(tip_spot.make_tip(), commit=True)
+      elif not should_have_tip and tip_spot.has_tip():
+        tip_spot.tracker.remove_tip(commit=True)
 
   def disable_tip_trackers(self) -> None:
     """Disable tip tracking for all tips in this tip rack."""
@@ -218,6 +233,176 @@ class TipRack(ItemizedResource[TipSpot], metaclass=ABCMeta):
     """Get all tips in the tip rack."""
     return [ts.get_tip() for ts in self.get_all_items()]
 
+  def assign_child_resource(
+    self,
+    resource: Resource,
+    location: Optional[Coordinate],
+    reassign: bool = True,
+  ):
+    self._reset_tip_bits()
+    super().assign_child_resource(resource, location=location, reassign=reassign)
+
+  def unassign_child_resource(self, resource: Resource):
+    self._reset_tip_bits()
+    super().unassign_child_resource(resource)
+
+  def _reset_tip_bits(self) -> None:
+    """Reset the bitsets when the tip spots change, because they are by index."""
+    self._tip_bits = None
+    self._reserved_bits = 0
+    self._run_start_masks.clear()
+
+  def _get_tip_bits(self) -> int:
+    if self._tip_bits is None:
+      self._tip_bits = 0
+      for i, tip_spot in enumerate(self.get_all_items()):
+        if tip_spot.has_tip():
+          self._tip_bits |= 1 << i
+    return self._tip_bits
+
+  def _tip_spot_changed(self, tip_spot: TipSpot) -> None:
+    """Called when a tip is added to or removed from a tip spot in this rack."""
+
+    if self._tip_bits is None and self._reserved_bits == 0:
+      return
+    index = self.index_of_item(tip_spot)
+    if index is None:
+      return
+    bit = 1 << index
+    has_tip = tip_spot.has_tip()
+    if self._tip_bits is not None:
+      if has_tip:
+        self._tip_bits |= bit
+      else:
+        self._tip_bits &= ~bit
+    if not has_tip and self._reserved_bits & bit:  # the reservation is used
+      self._reserved_bits &= ~bit
+      self._state_updated()
+
+  def _get_run_start_mask(self, n: int) -> int:
+    """The spots where `n` spots in consecutive rows of the same column start."""
+
+    if n not in self._run_start_masks:
+      rows_columns = [
+        (LETTERS.find(i[:1]), int(i[1:]) if i[1:].isdigit() else -1) for i in self._ordering
+      ]
+      mask = 0
+      for i in range(len(rows_columns) - n + 1):
+        row, column = rows_columns[i]
+        if row < 0 or column < 0:  # not an identifier like "A1"
+          continue
+        if all(rows_columns[i + k] == (row + k, column) for k in range(1, n)):
+          mask |= 1 << i
+      self._run_start_masks[n] = mask
+    return self._run_start_masks[n]
+
+  def get_num_available_tips(self) -> int:
+    """The number of tip spots that have a tip and are not reserved."""
+    return bin(self._get_tip_bits() & ~self._reserved_bits).count("1")
+
+  def find_tip_spots(
+    self,
+    n: int,
+    column_aligned: bool = False,
+    reserve: bool = False,
+  ) -> Optional[List[TipSpot]]:
+    """Find the first `n` tip spots that have a tip and are not reserved.
+
+    The tips of the rack are kept in bitsets that are updated when tips are added or removed, so
+    this does not check every tip spot.
+
+    Examples:
+      Finding a column of 8 tips for an 8 channel pipetting head, and reserving them so that they
+      are not returned again while the operation is planned:
+
+      >>> tip_spots = tip_rack.find_tip_spots(8, column_aligned=True, reserve=True)
+      >>> await lh.pick_up_tips(tip_spots)
+
+    Args:
+      n: The number of tip spots.
+      column_aligned: If `True`, the tip spots are in consecutive rows of one column, so that they
+        can be picked up by adjacent channels at once.
+      reserve: If `True`, reserve the tip spots, see :meth:`reserve_tip_spots`.
+
+    Returns:
+      The tip spots, in order, or `None` if there are not enough available tips.
+    """
+
+    available = self._get_tip_bits() & ~self._reserved_bits
+    indices: List[int] = []
+    if column_aligned:
+      # Bit i of `starts` is set if spots i to i + n - 1 are all available.
+      starts = available & self._get_run_start_mask(n)
+      for k in range(1, n):
+        starts &= available >> k
+      if starts:
+        first = (starts & -starts).bit_length() - 1
+        indices = list(range(first, first + n))
+    else:
+      while available and len(indices) < n:
+        lowest = available & -available
+        indices.append(lowest.bit_length() - 1)
+        available ^= lowest
+
+    if len(indices) < n or n <= 0:
+      return None
+    tip_spots = self.get_items(indices)
+    if reserve:
+      self.reserve_tip_spots(tip_spots)
+    return tip_spots
+
+  def _bits_of(self, tip_spots: Sequence[TipSpot]) -> int:
+    bits = 0
+    for tip_spot in tip_spots:
+      index = self.index_of_item(tip_spot)
+      if index is None:
+        raise ValueError(f"Tip spot '{tip_spot.name}' is not in tip rack '{self.name}'.")
+      bits |= 1 << index
+    return bits
+
+  def reserve_tip_spots(self, tip_spots: Sequence[TipSpot]) -> None:
+    """Reserve tip spots, so that :meth:`find_tip_spots` does not return them until they are
+    released with :meth:`release_tip_spots`. This is useful when planning multiple operations before
+    executing them. A reservation ends when the tip is removed from the spot.
+
+    Reservations are part of the state of the tip rack, see :meth:`serialize_state`.
+
+    Raises:
+      ValueError: If a tip spot is not in this tip rack, or is already reserved.
+    """
+
+    bits = self._bits_of(tip_spots)
+    if self._reserved_bits & bits:
+      reserved = [ts.name for ts in tip_spots if self._reserved_bits & self._bits_of([ts])]
+      raise ValueError(f"Tip spots are already reserved: {reserved}")
+    self._reserved_bits |= bits
+    self._state_updated()
+
+  def release_tip_spots(self, tip_spots: Sequence[TipSpot]) -> None:
+    """Release reserved tip spots. Tip spots that are not reserved are ignored."""
+    self._reserved_bits &= ~self._bits_of(tip_spots)
+    self._state_updated()
+
+  def get_reserved_tip_spots(self) -> List[TipSpot]:
+    """Get the reserved tip spots, in order."""
+    return self.get_items(list(_iter_bits(self._reserved_bits)))
+
+  def serialize_state(self) -> Dict[str, Any]:
+    return {"reserved": [ts.get_identifier() for ts in self.get_reserved_tip_spots()]}
+
+  def load_state(self, state: Dict[str, Any]) -> None:
+    self._reserved_bits = 0
+    self._reserved_bits = self._bits_of(self.get_items(state.get("reserved", [])))
+    self._mark_state_changed()
+
+
+def _iter_bits(bits: int) -> Iterator[int]:
+  """Yield the indices of the set bits, from low to high."""
+  while bits:
+    lowest = bits & -bits
+    yield lowest.bit_length() - 1
+    bits ^= lowest
+
 
 class NestedTipRack(TipRack):
   """A nested tip rack."""
@@ -44,6 +44,7 @@ class TipTracker:
     self._tip_origin: Optional["TipSpot"] = None  # not currently in a transaction, do we need that?
 
     self._callback: Optional[TrackerCallback] = None
+    self._change_callback: Optional[TrackerCallback] = None
 
   @property
   def is_disabled(self) -> bool:
@@ -96,6 +97,8 @@ class TipTracker:
 
     if commit:
       self.commit()
+    else:
+      self._state_changed()
 
   def remove_tip(self, commit: bool = False) -> None:
     """Update the pending state with the operation, if the operation is valid"""
@@ -107,10 +110,13 @@ class TipTracker:
 
     if commit:
       self.commit()
+    else:
+      self._state_changed()
 
   def commit(self) -> None:
     """Commit the pending operations."""
     self._tip = self._pending_tip
+    self._state_changed()
     if self._callback is not None:
       self._callback()
 
@@ -118,11 +124,13 @@ class TipTracker:
     """Rollback the pending operations."""
     assert not self.is_disabled, "Tip tracker is disabled. Call `enable()`."
     self._pending_tip = self._tip
+    self._state_changed()
 
   def clear(self) -> None:
     """Clear the history."""
     self._tip = None
     self._pending_tip = None
+    self._state_changed()
 
   def serialize(self) -> dict:
     """Serialize the state of the tip tracker."""
@@ -137,6 +145,7 @@ class TipTracker:
 
     self._tip = cast(Optional[Tip], deserialize(state.get("tip")))
     self._pending_tip = cast(Optional[Tip], deserialize(state.get("pending_tip")))
+    self._state_changed()
 
   def get_tip_origin(self) -> Optional["TipSpot"]:
     """Get the origin of the current tip, if known."""
@@ -150,3 +159,14 @@ class TipTracker:
 
   def register_callback(self, callback: TrackerCallback) -> None:
     self._callback = callback
+
+  def register_change_callback(self, callback: TrackerCallback) -> None:
+    """Register a callback that is called on every change of the serialized state of this tracker,
+    including pending operations, rollbacks and loading state. Unlike the callback registered with
+    :meth:`register_callback`, this is meant for dirty tracking, see
+    :meth:`~pylabrobot.resources.Resource.serialize_state_delta`."""
+    self._change_callback = callback
+
+  def _state_changed(self) -> None:
+    if self._change_callback is not None:
+      self._change_callback()
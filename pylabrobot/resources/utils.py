@@ -1,9 +1,9 @@
-import re
 from string import ascii_uppercase as LETTERS
-from typing import Dict, List, Optional, Type, TypeVar
+from typing import Dict, Iterator, List, Optional, Type, TypeVar
 
 from pylabrobot.resources.coordinate import Coordinate
 from pylabrobot.resources.resource import Resource
+from pylabrobot.resources.resource_index import ResourceIndex
 
 T = TypeVar("T", bound=Resource)
 
@@ -189,39 +189,46 @@ def query(
   x: Optional[float] = None,
   y: Optional[float] = None,
   z: Optional[float] = None,
+  category: Optional[str] = None,
+  model: Optional[str] = None,
 ) -> List[U]:
   """Query resources based on their attributes.
 
+  All descendants of `root` are searched, in the order they were assigned. Queries use indexes on
+  the type, category, model and location of the descendants, see :class:`ResourceIndex`, which are
+  built by the first query on a root. Use :func:`iter_query` to get the results lazily.
+
+  Examples:
+    Finding all plates of a model on the deck:
+
+    >>> query(lh.deck, Plate, model="Cor_96_wellplate_360ul_Fb")
+
   Args:
     root: The root resource to search
     type_: The type of resources to search for
     name: The regular expression to match the name of the resources
-    x: The x-coordinate of the resources
-    y: The y-coordinate of the resources
-    z: The z-coordinate of the resources
+    x: The x-coordinate of the resources, relative to their parent
+    y: The y-coordinate of the resources, relative to their parent
+    z: The z-coordinate of the resources, relative to their parent
+    category: The category of the resources
+    model: The model of the resources
   """
-  matched: List[U] = []
-  for resource in root.children:
-    if type_ is not None and not isinstance(resource, type_):
-      continue
-    if name is not None and not re.match(name, resource.name):
-      continue
-    if x is not None and (resource.location is None or resource.location.x != x):
-      continue
-    if y is not None and (resource.location is None or resource.location.y != y):
-      continue
-    if z is not None and (resource.location is None or resource.location.z != z):
-      continue
-    matched.append(resource)
-
-    matched.extend(
-      query(
-        root=resource,
-        type_=type_,
-        name=name,
-        x=x,
-        y=y,
-        z=z,
-      )
-    )
-  return matched
+  return list(
+    iter_query(root, type_=type_, name=name, x=x, y=y, z=z, category=category, model=model)
+  )
+
+
+def iter_query(
+  root: Resource,
+  type_: Type[U] = Resource,  # type: ignore
+  name: Optional[str] = None,
+  x: Optional[float] = None,
+  y: Optional[float] = None,
+  z: Optional[float] = None,
+  category: Optional[str] = None,
+  model: Optional[str] = None,
+) -> Iterator[U]:
+  """Like :func:`query`, but returns an iterator over the matching resources."""
+  return ResourceIndex.of(root).query(
+    type_=type_, name=name, category=category, model=model, x=x, y=y, z=z
+  )
@@ -1,6 +1,6 @@
 from pylabrobot.resources.coordinate import Coordinate
 from pylabrobot.resources.resource import Resource
-from pylabrobot.resources.utils import query
+from pylabrobot.resources.utils import iter_query, query
 from pylabrobot.resources.well import Well
 
 
@@ -37,3 +37,58 @@ def test_deep():
   child1.assign_child_resource(grandchild, location=Coordinate(1, 1, 0))
 
   assert query(root, Resource) == [child1, grandchild]
+
+
+def test_query_below_non_matching_parent():
+  root = Resource(name="root", size_x=10, size_y=10, size_z=10)
+  child = Resource(name="child", size_x=5, size_y=5, size_z=5)
+  well = Well(name="well", size_x=3, size_y=3, size_z=3)
+  root.assign_child_resource(child, location=Coordinate(0, 0, 0))
+  child.assign_child_resource(well, location=Coordinate(1, 1, 0))
+  assert query(root, Well) == [well]
+  assert query(root, x=1) == [well]
+
+
+def test_query_category_model():
+  root = Resource(name="root", size_x=10, size_y=10, size_z=10)
+  r1 = Resource(name="r1", size_x=1, size_y=1, size_z=1, category="a", model="m1")
+  r2 = Resource(name="r2", size_x=1, size_y=1, size_z=1, category="a", model="m2")
+  root.assign_child_resource(r1, location=Coordinate(0, 0, 0))
+  root.assign_child_resource(r2, location=Coordinate(1, 0, 0))
+  assert query(root, category="a") == [r1, r2]
+  assert query(root, category="a", model="m2") == [r2]
+  assert query(root, model="m3") == []
+
+
+def test_query_index_updated():
+  root = Resource(name="root", size_x=10, size_y=10, size_z=10)
+  child = Resource(name="child", size_x=5, size_y=5, size_z=5)
+  well = Well(name="well", size_x=3, size_y=3, size_z=3)
+  child.assign_child_resource(well, location=Coordinate(1, 1, 0))
+  assert query(root, Well) == []  # builds the index
+
+  root.assign_child_resource(child, location=Coordinate(0, 0, 0))
+  assert query(root, Well) == [well]
+  assert query(root, x=1) == [well]
+
+  well.location = Coordinate(2, 1, 0)
+  assert query(root, x=1) == []
+  assert query(root, x=2) == [well]
+
+  child.unassign()
+  assert query(root, Resource) == []
+  assert query(child, Well) == [well]
+
+
+def test_iter_query():
+  root = Resource(name="root", size_x=10, size_y=10, size_z=10)
+  for i in range(3):
+    root.assign_child_resource(Well(f"well{i}", 1, 1, 1), location=Coordinate(i, 0, 0))
+  results = iter_query(root, Well)
+  assert next(results).name == "well0"
+  assert [r.name for r in results] == ["well1", "well2"]
+
+  copy = root.copy()
+  copy.assign_child_resource(Well("well3", 1, 1, 1), location=Coordinate(3, 0, 0))
+  assert len(query(copy, Well)) == 4
+  assert len(query(root, Well)) == 3
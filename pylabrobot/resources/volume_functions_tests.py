@@ -2,6 +2,9 @@ import math
 import unittest
 
 from pylabrobot.resources.height_volume_functions import (
+  _height_of_volume_in_spherical_cap,
+  calculate_liquid_height_in_container_2segments_round_ubottom,
+  calculate_liquid_height_in_container_2segments_square_ubottom,
   calculate_liquid_volume_container_2segments_round_ubottom,
   calculate_liquid_volume_container_2segments_round_vbottom,
   calculate_liquid_volume_container_2segments_square_ubottom,
@@ -119,3 +122,59 @@ class TestVolumeFunctions(unittest.TestCase):
       ),
       (2 / 3) * math.pi * (10 / 2) ** 3 + 10**2 * 10,
     )
+
+
+def _bisect_height_of_volume_in_spherical_cap(r: float, liquid_volume: float) -> float:
+  """The bisection that was used before the closed form, as a reference."""
+
+  low, high = 0.0, r
+  while high - low > 1e-9:
+    mid = (low + high) / 2
+    if (1 / 3) * math.pi * mid**2 * (3 * r - mid) < liquid_volume:
+      low = mid
+    else:
+      high = mid
+  return (low + high) / 2
+
+
+class TestHeightFunctions(unittest.TestCase):
+  """Tests for the height functions"""
+
+  def test_height_of_volume_in_spherical_cap(self):
+    for r in [0.5, 1.65, 3.45, 6.9, 20]:
+      max_volume = (2 / 3) * math.pi * r**3
+      for i in range(101):
+        liquid_volume = max_volume * i / 100
+        self.assertAlmostEqual(
+          _height_of_volume_in_spherical_cap(r=r, liquid_volume=liquid_volume),
+          _bisect_height_of_volume_in_spherical_cap(r=r, liquid_volume=liquid_volume),
+          places=7,
+        )
+
+    self.assertEqual(_height_of_volume_in_spherical_cap(r=5, liquid_volume=0), 0)
+    self.assertAlmostEqual(_height_of_volume_in_spherical_cap(r=5, liquid_volume=1e-9), 0, places=4)
+    with self.assertRaises(ValueError):
+      _height_of_volume_in_spherical_cap(r=5, liquid_volume=300)
+
+  def test_ubottom_height_volume_roundtrip(self):
+    for liquid_height in [0.01, 1, 2.5, 4.99, 5, 7, 15]:
+      self.assertAlmostEqual(
+        calculate_liquid_height_in_container_2segments_round_ubottom(
+          d=10,
+          h_cylinder=10,
+          liquid_volume=calculate_liquid_volume_container_2segments_round_ubottom(
+            d=10, h_cylinder=10, liquid_height=liquid_height
+          ),
+        ),
+        liquid_height,
+      )
+      self.assertAlmostEqual(
+        calculate_liquid_height_in_container_2segments_square_ubottom(
+          x=10,
+          h_cuboid=10,
+          liquid_volume=calculate_liquid_volume_container_2segments_square_ubottom(
+            x=10, h_cuboid=10, liquid_height=liquid_height
+          ),
+        ),
+        liquid_height,
+      )
@@ -1,7 +1,7 @@
 import contextlib
-import copy
 import sys
-from typing import Callable, List, Optional, Tuple, cast
+from array import array
+from typing import Callable, List, Optional, Set, Tuple, cast
 
 from pylabrobot.resources.errors import (
   TooLittleLiquidError,
@@ -82,6 +82,7 @@ class VolumeTracker:
     self.liquid_history = {liquid for liquid in (liquid_history or set()) if liquid is not None}
 
     self._callback: Optional[VolumeTrackerCallback] = None
+    self._change_callback: Optional[VolumeTrackerCallback] = None
 
   @property
   def is_disabled(self) -> bool:
@@ -115,6 +116,7 @@ class VolumeTracker:
     if not self.is_cross_contamination_tracking_disabled:
       self.liquid_history.update([liquid[0] for liquid in liquids])
 
+    self._state_changed()
     if self._callback is not None:
       self._callback()
 
@@ -126,19 +128,22 @@ class VolumeTracker:
         f"Container has too little liquid: {volume}uL > {self.get_used_volume()}uL."
       )
 
+    pending_liquids = self.pending_liquids
     removed_liquids = []
     removed_volume = 0.0
     while removed_volume < volume:
-      liquid, liquid_volume = self.pending_liquids.pop()
+      liquid, liquid_volume = pending_liquids.pop()
       removed_volume += liquid_volume
 
       # If we have more liquid than we need, put the excess back.
       if removed_volume > volume:
-        self.pending_liquids.append((liquid, removed_volume - volume))
+        pending_liquids.append((liquid, removed_volume - volume))
         removed_liquids.append((liquid, liquid_volume - (removed_volume - volume)))
       else:
         removed_liquids.append((liquid, liquid_volume))
+    self._pending_liquids_changed(-volume)
 
+    self._state_changed()
     if self._callback is not None:
       self._callback()
 
@@ -158,21 +163,27 @@ class VolumeTracker:
         self.liquid_history.add(liquid)
 
     # If the last liquid is the same as the one we want to add, just add the volume to it.
-    if len(self.pending_liquids) > 0:
-      last_pending_liquid_tuple = self.pending_liquids[-1]
+    pending_liquids = self.pending_liquids
+    if len(pending_liquids) > 0:
+      last_pending_liquid_tuple = pending_liquids[-1]
       if last_pending_liquid_tuple[0] == liquid:
-        self.pending_liquids[-1] = (
+        pending_liquids[-1] = (
           liquid,
           last_pending_liquid_tuple[1] + volume,
         )
       else:
-        self.pending_liquids.append((liquid, volume))
+        pending_liquids.append((liquid, volume))
     else:
-      self.pending_liquids.append((liquid, volume))
+      pending_liquids.append((liquid, volume))
+    self._pending_liquids_changed(volume)
 
+    self._state_changed()
     if self._callback is not None:
       self._callback()
 
+  def _pending_liquids_changed(self, volume_change: float) -> None:
+    """Called after `pending_liquids` was modified in place."""
+
   def get_used_volume(self) -> float:
     """Get the used volume of the container. Note that this includes pending operations."""
     return sum(volume for _, volume in self.pending_liquids)
@@ -205,8 +216,10 @@ class VolumeTracker:
     """Commit the pending operations."""
     assert not self.is_disabled, "Volume tracker is disabled. Call `enable()`."
 
-    self.liquids = copy.deepcopy(self.pending_liquids)
+    # Liquid is an enum and volumes are floats, so a shallow copy is enough.
+    self.liquids = list(self.pending_liquids)
 
+    self._state_changed()
     if self._callback is not None:
       self._callback()
 
@@ -214,10 +227,12 @@ class VolumeTracker:
     """Rollback the pending operations."""
     assert not self.is_disabled, "Volume tracker is disabled. Call `enable()`."
     self.pending_liquids.clear()
+    self._state_changed()
 
   def clear_cross_contamination_history(self) -> None:
     """Resets the liquid_history for cross contamination tracking. Use when there is a wash step."""
     self.liquid_history.clear()
+    self._state_changed()
 
   def serialize(self) -> dict:
     """Serialize the volume tracker."""
@@ -246,5 +261,180 @@ class VolumeTracker:
     if not self.is_cross_contamination_tracking_disabled:
       self.liquid_history = set(state["liquid_history"])
 
+    self._state_changed()
+
   def register_callback(self, callback: VolumeTrackerCallback) -> None:
     self._callback = callback
+
+  def register_change_callback(self, callback: VolumeTrackerCallback) -> None:
+    """Register a callback that is called on every change of the serialized state of this tracker,
+    including pending operations, rollbacks and loading state. Unlike the callback registered with
+    :meth:`register_callback`, this is meant for dirty tracking, see
+    :meth:`~pylabrobot.resources.Resource.serialize_state_delta`."""
+    self._change_callback = callback
+
+  def _state_changed(self) -> None:
+    if self._change_callback is not None:
+      self._change_callback()
+
+
+class VolumeStore:
+  """Columnar volume tracking for a group of containers, usually all wells of a plate.
+
+  The used volume of every container is kept in a flat array, so that used and free volume queries
+  are O(1), and the liquid layers of each container are kept in a table of lists. Only containers
+  that changed since the last commit are tracked, so :meth:`commit` and :meth:`rollback` of a whole
+  plate only copy what was touched and never deep copy.
+
+  Containers keep using the regular :class:`VolumeTracker` API through a
+  :class:`VolumeStoreTracker`, which is a view onto a single row of the store. Use
+  :meth:`~pylabrobot.resources.Plate.use_volume_store` to move the wells of a plate to a store.
+  """
+
+  def __init__(self) -> None:
+    self._max_volumes = array("d")
+    self._used_volumes = array("d")
+    self._committed_used_volumes = array("d")
+    self._layers: List[List[Tuple[Optional[Liquid], float]]] = []
+    self._committed_layers: List[List[Tuple[Optional[Liquid], float]]] = []
+    self._trackers: List["VolumeStoreTracker"] = []
+    self._dirty: Set[int] = set()
+
+  def __len__(self) -> int:
+    return len(self._trackers)
+
+  @property
+  def trackers(self) -> List["VolumeStoreTracker"]:
+    return self._trackers
+
+  def attach(self, tracker: VolumeTracker) -> "VolumeStoreTracker":
+    """Add a row to the store, initialized with the state of `tracker`, and return a view onto it
+    that can replace `tracker`."""
+
+    index = len(self._trackers)
+    self._max_volumes.append(tracker.max_volume)
+    self._used_volumes.append(0)
+    self._committed_used_volumes.append(0)
+    self._layers.append([])
+    self._committed_layers.append([])
+    view = VolumeStoreTracker(
+      store=self,
+      index=index,
+      max_volume=tracker.max_volume,
+      liquids=tracker.liquids,
+      pending_liquids=tracker.pending_liquids,
+      liquid_history=tracker.liquid_history,
+    )
+    view._is_disabled = tracker.is_disabled
+    view._is_cross_contamination_tracking_disabled = (
+      tracker.is_cross_contamination_tracking_disabled
+    )
+    view._callback = tracker._callback
+    view._change_callback = tracker._change_callback
+    self._trackers.append(view)
+    return view
+
+  def get_used_volumes(self) -> List[float]:
+    """Get the used volume of each container, including pending operations."""
+    return self._used_volumes.tolist()
+
+  def get_free_volumes(self) -> List[float]:
+    """Get the free volume of each container, including pending operations."""
+    return [m - u for m, u in zip(self._max_volumes, self._used_volumes)]
+
+  def _set_layers(self, index: int, layers: List[Tuple[Optional[Liquid], float]]) -> None:
+    self._layers[index] = layers
+    self._used_volumes[index] = sum(volume for _, volume in layers)
+    self._dirty.add(index)
+
+  def _set_committed_layers(self, index: int, layers: List[Tuple[Optional[Liquid], float]]) -> None:
+    self._committed_layers[index] = layers
+    self._committed_used_volumes[index] = sum(volume for _, volume in layers)
+    self._dirty.add(index)
+
+  def _commit_index(self, index: int) -> None:
+    self._committed_layers[index] = list(self._layers[index])
+    self._committed_used_volumes[index] = self._used_volumes[index]
+    self._dirty.discard(index)
+
+  def _rollback_index(self, index: int) -> None:
+    self._set_layers(index, [])
+
+  def commit(self) -> None:
+    """Commit the pending operations of all containers in the store."""
+
+    dirty, self._dirty = self._dirty, set()
+    self._committed_used_volumes[:] = self._used_volumes
+    for index in dirty:
+      self._committed_layers[index] = list(self._layers[index])
+
+    for index in sorted(dirty):
+      self._trackers[index]._state_changed()
+      callback = self._trackers[index]._callback
+      if callback is not None:
+        callback()
+
+  def rollback(self) -> None:
+    """Rollback the pending operations of all containers in the store, like
+    :meth:`VolumeTracker.rollback` of each of them."""
+
+    for index, tracker in enumerate(self._trackers):
+      self._set_layers(index, [])
+      tracker._state_changed()
+
+
+class VolumeStoreTracker(VolumeTracker):
+  """A :class:`VolumeTracker` that keeps its state in a row of a :class:`VolumeStore`."""
+
+  def __init__(
+    self,
+    store: VolumeStore,
+    index: int,
+    max_volume: float,
+    liquids: Optional[List[Tuple[Optional[Liquid], float]]] = None,
+    pending_liquids: Optional[List[Tuple[Optional[Liquid], float]]] = None,
+    liquid_history: Optional[set] = None,
+  ) -> None:
+    self._store = store
+    self._index = index
+    super().__init__(
+      max_volume=max_volume,
+      liquids=liquids,
+      pending_liquids=pending_liquids,
+      liquid_history=liquid_history,
+    )
+
+  @property  # type: ignore[override]
+  def liquids(self) -> List[Tuple[Optional[Liquid], float]]:
+    return self._store._committed_layers[self._index]
+
+  @liquids.setter
+  def liquids(self, liquids: List[Tuple[Optional[Liquid], float]]) -> None:
+    self._store._set_committed_layers(self._index, list(liquids))
+
+  @property  # type: ignore[override]
+  def pending_liquids(self) -> List[Tuple[Optional[Liquid], float]]:
+    return self._store._layers[self._index]
+
+  @pending_liquids.setter
+  def pending_liquids(self, pending_liquids: List[Tuple[Optional[Liquid], float]]) -> None:
+    self._store._set_layers(self._index, list(pending_liquids))
+
+  def _pending_liquids_changed(self, volume_change: float) -> None:
+    self._store._used_volumes[self._index] += volume_change
+    self._store._dirty.add(self._index)
+
+  def get_used_volume(self) -> float:
+    return self._store._used_volumes[self._index]
+
+  def commit(self) -> None:
+    assert not self.is_disabled, "Volume tracker is disabled. Call `enable()`."
+    self._store._commit_index(self._index)
+    self._state_changed()
+    if self._callback is not None:
+      self._callback()
+
+  def rollback(self) -> None:
+    assert not self.is_disabled, "Volume tracker is disabled. Call `enable()`."
+    self._store._rollback_index(self._index)
+    self._state_changed()
@@ -5,7 +5,7 @@ from pylabrobot.resources.errors import (
   TooLittleVolumeError,
 )
 from pylabrobot.resources.liquid import Liquid
-from pylabrobot.resources.volume_tracker import VolumeTracker
+from pylabrobot.resources.volume_tracker import VolumeStore, VolumeTracker
 
 
 class TestVolumeTracker(unittest.TestCase):
@@ -64,3 +64,80 @@ class TestVolumeTracker(unittest.TestCase):
 
     with self.assertRaises(TooLittleLiquidError):
       tracker.get_liquids(top_volume=600)
+
+
+class TestVolumeStore(unittest.TestCase):
+  def setUp(self):
+    self.store = VolumeStore()
+    self.trackers = [self.store.attach(VolumeTracker(max_volume=100)) for _ in range(4)]
+
+  def test_attach_keeps_state(self):
+    tracker = VolumeTracker(max_volume=100)
+    tracker.set_liquids([(Liquid.WATER, 20)])
+    tracker.disable()
+    view = self.store.attach(tracker)
+    self.assertEqual(view.liquids, [(Liquid.WATER, 20)])
+    self.assertEqual(view.get_used_volume(), 20)
+    self.assertTrue(view.is_disabled)
+    self.assertEqual(self.store.get_used_volumes(), [0, 0, 0, 0, 20])
+
+  def test_tracker_api(self):
+    tracker = self.trackers[0]
+    tracker.add_liquid(liquid=None, volume=60)
+    tracker.commit()
+    self.assertEqual(tracker.get_used_volume(), 60)
+    self.assertEqual(tracker.get_free_volume(), 40)
+
+    self.assertEqual(tracker.remove_liquid(volume=20), [(None, 20)])
+    self.assertEqual(tracker.get_used_volume(), 40)
+    self.assertEqual(tracker.liquids, [(None, 60)])
+    tracker.commit()
+    self.assertEqual(tracker.liquids, [(None, 40)])
+
+    with self.assertRaises(TooLittleLiquidError):
+      tracker.remove_liquid(volume=100)
+    with self.assertRaises(TooLittleVolumeError):
+      tracker.add_liquid(liquid=None, volume=100)
+
+  def test_commit_all(self):
+    callbacks = []
+    self.trackers[2].register_callback(lambda: callbacks.append(2))
+    for tracker in self.trackers:
+      tracker.add_liquid(liquid=Liquid.WATER, volume=10)
+    self.assertEqual([tracker.liquids for tracker in self.trackers], [[]] * 4)
+
+    self.assertEqual(callbacks, [2])
+
+    self.store.commit()
+    self.assertEqual([tracker.liquids for tracker in self.trackers], [[(Liquid.WATER, 10)]] * 4)
+    self.assertEqual(self.store.get_used_volumes(), [10] * 4)
+    self.assertEqual(callbacks, [2, 2])
+
+  def test_rollback_all(self):
+    self.trackers[0].set_liquids([(Liquid.WATER, 50)])
+    self.trackers[0].remove_liquid(volume=30)
+    self.trackers[1].add_liquid(liquid=None, volume=10)
+
+    self.store.rollback()
+    self.assertEqual(self.store.get_used_volumes(), [0, 0, 0, 0])
+    self.assertEqual(self.trackers[0].liquids, [(Liquid.WATER, 50)])
+    self.assertEqual([tracker.pending_liquids for tracker in self.trackers], [[]] * 4)
+
+  def test_rollback_matches_volume_tracker(self):
+    reference = VolumeTracker(max_volume=100)
+    for tracker in (reference, self.trackers[0]):
+      tracker.add_liquid(liquid=Liquid.WATER, volume=50)
+      tracker.commit()
+      tracker.remove_liquid(volume=30)
+      tracker.rollback()
+    self.assertEqual(self.trackers[0].serialize(), reference.serialize())
+    self.assertEqual(self.trackers[0].get_used_volume(), reference.get_used_volume())
+
+  def test_serialize(self):
+    self.trackers[0].set_liquids([(Liquid.WATER, 50)])
+    reference = VolumeTracker(max_volume=100)
+    reference.set_liquids([(Liquid.WATER, 50)])
+    self.assertEqual(self.trackers[0].serialize(), reference.serialize())
+
+    self.trackers[1].load_state(reference.serialize())
+    self.assertEqual(self.trackers[1].get_used_volume(), 50)
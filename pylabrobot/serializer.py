@@ -16,12 +16,21 @@ else:
 JSON: TypeAlias = Union[Dict[str, "JSON"], List["JSON"], str, int, float, bool, None]
 
 
+# Classes found by `get_plr_class_from_string`, by name.
+_plr_classes: Dict[str, type] = {}
+
+
 def get_plr_class_from_string(klass_type: str):
+  if klass_type in _plr_classes:
+    return _plr_classes[klass_type]
+
   import pylabrobot.liquid_handling as lh_module
   import pylabrobot.resources as resource_module
 
-  for name, obj in inspect.getmembers(resource_module) + inspect.getmembers(lh_module):
-    if inspect.isclass(obj) and name == klass_type:
+  for module in (resource_module, lh_module):
+    obj = getattr(module, klass_type, None)
+    if inspect.isclass(obj):
+      _plr_classes[klass_type] = obj
       return obj
   raise ValueError(f"Could not find class {klass_type}")
 
@@ -85,6 +94,8 @@ def deserialize(data: JSON, allow_marshal: bool = False) -> Any:
       if klass_type == "cell":
         return types.CellType(deserialize(data["contents"], allow_marshal=allow_marshal))
       klass = get_plr_class_from_string(klass_type)
+      if not any(isinstance(v, (dict, list)) for v in data.values()):
+        return klass(**data)  # fast path for flat classes like Coordinate and Rotation
       params = {k: deserialize(v, allow_marshal=allow_marshal) for k, v in data.items()}
       return klass(**params)
     return {k: deserialize(v, allow_marshal=allow_marshal) for k, v in data.items()}
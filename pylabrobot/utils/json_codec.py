@@ -0,0 +1,207 @@
+"""Fast JSON encoding and decoding for layouts and state.
+
+The fastest available backend is used: `orjson <https://github.com/ijl/orjson>`_ or `msgspec
+<https://jcristharif.com/msgspec/>`_ if installed, and the standard library `json` module
+otherwise. Files are written in a streaming way: large objects are encoded and written in chunks, so
+the full JSON document is never held in memory. Files can optionally be gzip compressed, which is
+useful for large state checkpoints. :func:`load_file` detects compressed files automatically.
+
+Non-finite floats can not be represented in JSON. `json` writes them as the invalid `NaN` and
+`Infinity`, while orjson and msgspec write `null`. Use :func:`pylabrobot.serializer.serialize` to
+convert them to strings first.
+"""
+
+import gzip
+import json
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union, cast
+
+try:
+  import orjson  # type: ignore
+
+  USE_ORJSON = True
+except ImportError:
+  USE_ORJSON = False
+
+try:
+  import msgspec  # type: ignore
+
+  USE_MSGSPEC = True
+except ImportError:
+  USE_MSGSPEC = False
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Containers up to this depth are written item by item. Deeper values are encoded in one go by the
+# backend, which is much faster. For a deck, a chunk is about the size of a plate.
+_STREAM_DEPTH = 4
+
+_WRITE_BLOCK_SIZE = 1 << 16
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+  return cast(bytes, orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+
+
+def _msgspec_dumps(obj: Any) -> bytes:
+  return cast(bytes, msgspec.json.encode(obj))
+
+
+def _json_dumps(obj: Any) -> bytes:
+  return json.dumps(obj).encode("utf-8")
+
+
+def _msgspec_loads(data: Union[str, bytes]) -> Any:
+  return msgspec.json.decode(data)
+
+
+# name: (dumps, loads, item separator, key separator). The json backend uses the same separators as
+# `json.dumps`, so that its output is unchanged.
+_Backend = Tuple[Callable[[Any], bytes], Callable[[Union[str, bytes]], Any], bytes, bytes]
+_backends: Dict[str, _Backend] = {"json": (_json_dumps, json.loads, b", ", b": ")}
+if USE_MSGSPEC:
+  _backends["msgspec"] = (_msgspec_dumps, _msgspec_loads, b",", b":")
+if USE_ORJSON:
+  _backends["orjson"] = (_orjson_dumps, orjson.loads, b",", b":")
+
+_backend = "orjson" if USE_ORJSON else ("msgspec" if USE_MSGSPEC else "json")
+
+
+def get_backend() -> str:
+  """The name of the backend that is used: `"orjson"`, `"msgspec"` or `"json"`."""
+  return _backend
+
+
+def set_backend(name: str) -> None:
+  """Set the backend to use, for example `"json"` for output that is identical to `json.dumps`.
+
+  Raises:
+    ValueError: if the backend is unknown or not installed.
+  """
+
+  global _backend
+  if name not in _backends:
+    raise ValueError(f"JSON backend '{name}' is not available, choose from {list(_backends)}.")
+  _backend = name
+
+
+class StreamedObject:
+  """A JSON object whose items are produced while it is written, so that the whole object is never
+  held in memory. Each item is encoded as one chunk, unless its value is a `StreamedObject` too.
+  Can only be iterated once.
+
+  Examples:
+    >>> json_codec.save(StreamedObject((r.name, r.serialize_state()) for r in resources), "s.json")
+  """
+
+  def __init__(self, items: Iterable[Tuple[str, Any]]):
+    self.items = items
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+  """Encode an object as a JSON string."""
+  return b"".join(iterencode(obj, indent=indent)).decode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+  """Decode a JSON string."""
+  return _backends[_backend][1](data)
+
+
+def _key_to_str(key: Any) -> str:
+  """Convert a key to a string, like `json` does."""
+  if isinstance(key, (int, float)) or key is None:  # also bool
+    return json.dumps(key)
+  raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def iterencode(obj: Any, indent: Optional[int] = None) -> Iterator[bytes]:
+  """Encode an object as JSON, in chunks.
+
+  Args:
+    obj: The object to encode. May be or contain :class:`StreamedObject` s.
+    indent: Same as `json.dump`'s `indent` argument. Indented JSON is always encoded with `json`.
+  """
+
+  if indent is not None:
+    if isinstance(obj, StreamedObject):
+      obj = dict(obj.items)
+    for chunk in json.JSONEncoder(indent=indent).iterencode(obj):
+      yield chunk.encode("utf-8")
+    return
+
+  encode, _, item_separator, key_separator = _backends[_backend]
+
+  def _iterencode(obj: Any, depth: int) -> Iterator[bytes]:
+    if isinstance(obj, StreamedObject):  # each item is a chunk
+      separator = b"{"
+      for key, value in obj.items:
+        if not isinstance(key, str):
+          key = _key_to_str(key)
+        if isinstance(value, StreamedObject):
+          yield separator + encode(key) + key_separator
+          yield from _iterencode(value, depth + 1)
+        else:
+          yield separator + encode(key) + key_separator + encode(value)
+        separator = item_separator
+      yield b"{}" if separator == b"{" else b"}"
+    elif isinstance(obj, dict) and depth < _STREAM_DEPTH:
+      separator = b"{"
+      for key, value in obj.items():
+        if not isinstance(key, str):
+          key = _key_to_str(key)
+        yield separator + encode(key) + key_separator
+        yield from _iterencode(value, depth + 1)
+        separator = item_separator
+      yield b"{}" if separator == b"{" else b"}"
+    elif isinstance(obj, (list, tuple)) and depth < _STREAM_DEPTH:
+      separator = b"["
+      for value in obj:
+        yield separator
+        yield from _iterencode(value, depth + 1)
+        separator = item_separator
+      yield b"[]" if separator == b"[" else b"]"
+    else:
+      yield encode(obj)
+
+  yield from _iterencode(obj, 0)
+
+
+def dump(obj: Any, fp: IO[bytes], indent: Optional[int] = None) -> None:
+  """Write an object as JSON to a binary file, see :func:`iterencode`."""
+
+  # Chunks are often small, so they are collected and written in larger blocks.
+  block = bytearray()
+  for chunk in iterencode(obj, indent=indent):
+    block += chunk
+    if len(block) >= _WRITE_BLOCK_SIZE:
+      fp.write(block)
+      block.clear()
+  fp.write(block)
+
+
+def load(fp: IO[bytes]) -> Any:
+  """Read JSON from a binary file."""
+  return loads(fp.read())
+
+
+def save(obj: Any, fn: str, indent: Optional[int] = None, compress: bool = False) -> None:
+  """Write an object to a JSON file.
+
+  Args:
+    obj: The object to write, see :func:`iterencode`.
+    fn: File name. Caution: file will be overwritten.
+    indent: Same as `json.dump`'s `indent` argument (for json pretty printing).
+    compress: If `True`, compress the file with gzip.
+  """
+
+  with (gzip.open(fn, "wb", compresslevel=6) if compress else open(fn, "wb")) as f:
+    dump(obj, f, indent=indent)
+
+
+def load_file(fn: str) -> Any:
+  """Read a JSON file written by :func:`save`, or any other JSON file, compressed or not."""
+
+  with open(fn, "rb") as f:
+    compressed = f.read(2) == _GZIP_MAGIC
+  with (gzip.open(fn, "rb") if compressed else open(fn, "rb")) as f:
+    return load(f)
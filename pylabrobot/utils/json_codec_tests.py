@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+
+from . import json_codec
+
+DATA = {
+  "name": "deck",
+  "children": [
+    {"name": "plate", "children": [{"name": "A1", "liquids": [[None, 10.5]], "x": {"y": {}}}]},
+    {"name": "trough", "children": [], "location": {"x": 0, "y": -1.25, "z": 1e-5}},
+  ],
+  "empty": {},
+  "unicode": "µl",
+  "deep": [[[[[[1, [2, {"a": [3]}]]]]]]],
+  "flags": [True, False, None],
+}
+
+
+class TestJSONCodec(unittest.TestCase):
+  def setUp(self):
+    self.backend = json_codec.get_backend()
+
+  def tearDown(self):
+    json_codec.set_backend(self.backend)
+
+  def _backends(self):
+    for backend in json_codec._backends:
+      with self.subTest(backend=backend):
+        json_codec.set_backend(backend)
+        yield backend
+
+  def test_roundtrip(self):
+    for _ in self._backends():
+      self.assertEqual(json_codec.loads(json_codec.dumps(DATA)), DATA)
+      self.assertEqual(json.loads(json_codec.dumps(DATA)), DATA)
+
+  def test_json_backend_same_as_json(self):
+    json_codec.set_backend("json")
+    self.assertEqual(json_codec.dumps(DATA), json.dumps(DATA))
+    self.assertEqual(json_codec.dumps(DATA, indent=2), json.dumps(DATA, indent=2))
+    self.assertEqual(json_codec.dumps({1: "a", True: 2}), json.dumps({1: "a", True: 2}))
+
+  def test_non_str_keys(self):
+    for _ in self._backends():
+      self.assertEqual(json_codec.loads(json_codec.dumps({1: 2, None: 3})), {"1": 2, "null": 3})
+      with self.assertRaises(TypeError):
+        json_codec.dumps({(1, 2): 3})
+
+  def test_unknown_backend(self):
+    with self.assertRaises(ValueError):
+      json_codec.set_backend("does_not_exist")
+
+  def test_streamed_object(self):
+    def items():
+      for i in range(3):
+        yield f"item_{i}", {"i": i}
+
+    expected = {"item_0": {"i": 0}, "item_1": {"i": 1}, "item_2": {"i": 2}}
+    for _ in self._backends():
+      streamed = json_codec.StreamedObject(items())
+      self.assertEqual(json_codec.loads(json_codec.dumps(streamed)), expected)
+      streamed = json_codec.StreamedObject(items())
+      self.assertEqual(json.loads(json_codec.dumps(streamed, indent=2)), expected)
+      self.assertEqual(json_codec.dumps(json_codec.StreamedObject([])), "{}")
+
+  def test_save_load_file(self):
+    fn = os.path.join(tempfile.mkdtemp(), "data.json")
+    for _ in self._backends():
+      for compress in (False, True):
+        json_codec.save(DATA, fn, compress=compress)
+        self.assertEqual(json_codec.load_file(fn), DATA)
+      with open(fn, "w", encoding="utf-8") as f:  # written by another program
+        json.dump(DATA, f, indent=4)
+      self.assertEqual(json_codec.load_file(fn), DATA)
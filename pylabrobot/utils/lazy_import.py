@@ -0,0 +1,102 @@
+"""Lazy loading of the public names of a package, using module level `__getattr__` (PEP 562).
+
+Importing a package like `pylabrobot.resources` used to import every submodule, including all
+labware catalogues. Packages that use :func:`lazy_import` only import a submodule when one of its
+names is first accessed, so that a script only pays for what it uses.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+# Packages that use lazy_import, see `import_all`.
+_lazy_packages: List[str] = []
+
+
+def lazy_import(
+  package: str,
+  attributes: Dict[str, str],
+  star_modules: Sequence[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+  """Create the `__getattr__` and `__dir__` functions for a package with lazily imported names.
+
+  Names are resolved, in order, from `attributes`, from the submodules of the package, and from the
+  public names of `star_modules` (the modules that the package used to `import *` from). Resolved
+  names are stored in the package, so that `__getattr__` is only called once per name.
+  `from package import *` imports everything.
+
+  Examples:
+    In `__init__.py`:
+
+    >>> __getattr__, __dir__ = lazy_import(__name__, {"Plate": ".plate"}, star_modules=[".nest"])
+
+  Args:
+    package: The name of the package, `__name__` in its `__init__.py`.
+    attributes: Map of names to the (relative) modules that define them.
+    star_modules: (Relative) modules all public names of which are exported by the package.
+
+  Returns:
+    The `__getattr__` and `__dir__` functions for the package.
+  """
+
+  def _star_names(module) -> List[str]:
+    if "__all__" in vars(module) or hasattr(module, "__getattr__"):
+      return list(module.__all__)
+    return [name for name in vars(module) if not name.startswith("_")]
+
+  def _all() -> List[str]:
+    names = dict.fromkeys(attributes)
+    for star_module in star_modules:
+      names.update(dict.fromkeys(_star_names(importlib.import_module(star_module, package))))
+    return list(names)
+
+  def _resolve(name: str) -> Any:
+    if name in attributes:
+      return getattr(importlib.import_module(attributes[name], package), name)
+
+    if name == "__all__":
+      return _all()
+    if name.startswith("__"):
+      raise AttributeError(name)
+
+    try:
+      return importlib.import_module(f".{name}", package)
+    except ModuleNotFoundError as e:
+      if e.name != f"{package}.{name}":  # the submodule exists, but one of its imports is missing
+        raise
+
+    if not name.startswith("_"):
+      for star_module in star_modules:
+        module = importlib.import_module(star_module, package)
+        if "__all__" in vars(module) and name not in module.__all__:
+          continue
+        try:
+          return getattr(module, name)
+        except AttributeError:
+          pass
+
+    raise AttributeError(name)
+
+  def __getattr__(name: str) -> Any:
+    try:
+      value = _resolve(name)
+    except AttributeError:
+      raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+    setattr(sys.modules[package], name, value)
+    return value
+
+  def __dir__() -> List[str]:
+    return sorted(set(vars(sys.modules[package])) | set(_all()))
+
+  _lazy_packages.append(package)
+  return __getattr__, __dir__
+
+
+def import_all() -> None:
+  """Import all names of all packages that use :func:`lazy_import`. This is needed to find a class
+  by name among the subclasses of another class, for example when deserializing."""
+
+  for package in list(_lazy_packages):
+    module = sys.modules[package]
+    for name in module.__all__:
+      getattr(module, name)
@@ -0,0 +1,82 @@
+import ast
+import importlib
+import inspect
+import subprocess
+import sys
+import unittest
+
+LAZY_PACKAGES = [
+  "pylabrobot.resources",
+  "pylabrobot.liquid_handling",
+  "pylabrobot.liquid_handling.backends",
+]
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+  return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+
+def _type_checking_imports(package: str):
+  """The (module, names) imported in the `if TYPE_CHECKING:` block of a package."""
+  module = importlib.import_module(package)
+  assert module.__file__ is not None
+  with open(module.__file__, "r", encoding="utf-8") as f:
+    tree = ast.parse(f.read())
+  (block,) = [
+    node
+    for node in tree.body
+    if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+  ]
+  for node in block.body:
+    assert isinstance(node, ast.ImportFrom)
+    yield "." * node.level + (node.module or ""), [alias.name for alias in node.names]
+
+
+class TestLazyImport(unittest.TestCase):
+  def test_public_names(self):
+    """Every name that used to be imported eagerly resolves to the same object."""
+
+    for package in LAZY_PACKAGES:
+      module = importlib.import_module(package)
+      for submodule_name, names in _type_checking_imports(package):
+        submodule = importlib.import_module(submodule_name, package)
+        if names == ["*"] and hasattr(submodule, "__getattr__"):  # also lazy
+          names = submodule.__all__
+        elif names == ["*"]:
+          names = [n for n, v in vars(submodule).items() if not n.startswith("_")]
+          names = [n for n in names if not inspect.ismodule(getattr(submodule, n))]
+        for name in names:
+          self.assertIs(getattr(module, name), getattr(submodule, name), f"{package}.{name}")
+          self.assertIn(name, module.__all__)
+          self.assertIn(name, dir(module))
+
+  def test_unknown_name(self):
+    import pylabrobot.resources
+
+    with self.assertRaises(AttributeError):
+      pylabrobot.resources.does_not_exist  # type: ignore[attr-defined]
+    self.assertFalse(hasattr(pylabrobot.resources, "__wrapped__"))
+
+  def test_submodules_are_not_imported(self):
+    # Eagerly importing all backends and resources took more than a second. Check which modules are
+    # imported, instead of the time it takes, so that this does not depend on the machine.
+    for package in LAZY_PACKAGES:
+      modules = _run(f"import sys, {package}; print(' '.join(sys.modules))").stdout.split()
+      for module in [
+        "pylabrobot.liquid_handling.backends.hamilton.STAR",
+        "pylabrobot.liquid_handling.backends.tecan.EVO",
+        "pylabrobot.liquid_handling.liquid_handler",
+        "pylabrobot.resources.hamilton",
+        "pylabrobot.resources.tecan",
+        "pylabrobot.resources.opentrons",
+        "IPython",
+      ]:
+        self.assertNotIn(module, modules, f"imported by {package}")
+
+  def test_find_subclass_imports_lazy_modules(self):
+    code = (
+      "from pylabrobot.resources import Resource;"
+      "from pylabrobot.utils.object_parsing import find_subclass;"
+      "print(find_subclass('HamiltonSTARDeck', Resource).__module__)"
+    )
+    self.assertEqual(_run(code).stdout.strip(), "pylabrobot.resources.hamilton.hamilton_decks")
@@ -1,8 +1,16 @@
+# The products are summed starting from the integer 0, like `sum` does, so that the results,
+# including their types and the signs of zeros, are the same as those of the original `sum` based
+# versions.
+
+
 def matrix_multiply_3x3(A, B):
   """Multiplies two 3x3 matrices A and B."""
-  return [[sum(A[i][k] * B[k][j] for k in range(3)) for j in range(3)] for i in range(3)]
+  return [
+    [0 + A[i][0] * B[0][j] + A[i][1] * B[1][j] + A[i][2] * B[2][j] for j in range(3)]
+    for i in range(3)
+  ]
 
 
 def matrix_vector_multiply_3x3(A, v):
   """Multiplies a 3x3 matrix A with a 3x1 vector v."""
-  return [sum(A[i][j] * v[j] for j in range(3)) for i in range(3)]
+  return [0 + A[i][0] * v[0] + A[i][1] * v[1] + A[i][2] * v[2] for i in range(3)]
@@ -17,3 +17,14 @@ class TestLinalg(unittest.TestCase):
     B = [1, 2, 3]
     C = matrix_vector_multiply_3x3(A, B)
     assert C == [14, 32, 50]
+
+  def test_same_as_sum(self):
+    # types and signs of zeros are the same as when summing the products with `sum`
+    A = [[1.0, 0.0, 0.0], [0.0, -1.0, 0.0], [0.0, 0.0, 1.0]]
+    v = [0, 0.0, 2]
+    expected = [sum(A[i][j] * v[j] for j in range(3)) for i in range(3)]
+    self.assertEqual(
+      [repr(c) for c in matrix_vector_multiply_3x3(A, v)], [repr(c) for c in expected]
+    )
+    expected = [[sum(A[i][k] * A[k][j] for k in range(3)) for j in range(3)] for i in range(3)]
+    self.assertEqual(repr(matrix_multiply_3x3(A, A)), repr(expected))
@@ -1,11 +1,71 @@
-from typing import Optional, Type, TypeVar
+import weakref
+from typing import Dict, MutableMapping, Optional, Type, TypeVar
+
+from pylabrobot.utils.lazy_import import import_all
 
 T = TypeVar("T")
 
+# Subclasses of registry root classes by name, see `register_subclass`. Classes are weakly
+# referenced so that classes defined in a local scope, like in tests, can be garbage collected.
+_registries: Dict[type, MutableMapping[str, type]] = {}
+
+
+def register_subclass(root: type, subclass: type) -> None:
+  """Register a subclass of `root`, so that :func:`find_subclass` can find it by name without
+  walking the class hierarchy. Call this from `root.__init_subclass__`. If multiple subclasses have
+  the same name, the one registered first is found while it exists, so that a class defined in eg. a
+  test does not shadow a library class with the same name.
+
+  Args:
+    root: The class whose subclasses are registered, like `Resource`.
+    subclass: The subclass to register.
+  """
+
+  registry = _registries.setdefault(root, weakref.WeakValueDictionary())
+  if registry.get(subclass.__name__) is None:
+    registry[subclass.__name__] = subclass
+
+
+def _get_registry(cls: type) -> Optional[MutableMapping[str, type]]:
+  for base in cls.__mro__:
+    if base in _registries:
+      return _registries[base]
+  return None
+
+
+def _walk_subclasses(class_name: str, cls: Type[T]) -> Optional[Type[T]]:
+  if cls.__name__ == class_name:
+    return cls
+  for subclass in cls.__subclasses__():
+    subclass_ = _walk_subclasses(class_name=class_name, cls=subclass)
+    if subclass_ is not None:
+      return subclass_
+  return None
+
+
+def _find_subclass(class_name: str, cls: Type[T]) -> Optional[Type[T]]:
+  if cls.__name__ == class_name:
+    return cls
+
+  registry = _get_registry(cls)
+  if registry is not None:
+    subclass = registry.get(class_name)
+    if subclass is not None and issubclass(subclass, cls):
+      return subclass
+
+  # Not registered, or the registered class with this name was garbage collected or is not a
+  # subclass of `cls`, while another class with the same name may be.
+  return _walk_subclasses(class_name=class_name, cls=cls)
+
 
 def find_subclass(class_name: str, cls: Type[T]) -> Optional[Type[T]]:
   """Recursively find a subclass with the correct name.
 
+  Subclasses of classes that register their subclasses (see :func:`register_subclass`) are looked
+  up by name. Subclasses can only be found once the module that defines them is imported. If no
+  subclass is found, the modules of lazily imported packages are imported, and the search is
+  repeated.
+
   Args:
     class_name: The name of the class to find.
     cls: The class to search in.
@@ -14,10 +74,8 @@ def find_subclass(class_name: str, cls: Type[T]) -> Optional[Type[T]]:
     The class with the given name, or `None` if no such class exists.
   """
 
-  if cls.__name__ == class_name:
-    return cls
-  for subclass in cls.__subclasses__():
-    subclass_ = find_subclass(class_name=class_name, cls=subclass)
-    if subclass_ is not None:
-      return subclass_
-  return None
+  subclass = _find_subclass(class_name=class_name, cls=cls)
+  if subclass is None:
+    import_all()
+    subclass = _find_subclass(class_name=class_name, cls=cls)
+  return subclass
@@ -0,0 +1,79 @@
+import gc
+import unittest
+
+from .object_parsing import find_subclass, register_subclass
+
+
+class Base:
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    register_subclass(Base, cls)
+
+
+class A(Base):
+  pass
+
+
+class B(A):
+  pass
+
+
+class TestFindSubclass(unittest.TestCase):
+  def test_find_subclass(self):
+    self.assertIs(find_subclass("Base", cls=Base), Base)
+    self.assertIs(find_subclass("A", cls=Base), A)
+    self.assertIs(find_subclass("B", cls=Base), B)
+    self.assertIs(find_subclass("B", cls=A), B)
+    self.assertIsNone(find_subclass("A", cls=B))
+    self.assertIsNone(find_subclass("DoesNotExist", cls=Base))
+
+  def test_unregistered_class(self):
+    class Root:
+      pass
+
+    class Child(Root):
+      pass
+
+    self.assertIs(find_subclass("Child", cls=Root), Child)
+
+  def test_redefined_class(self):
+    class C(Base):
+      pass
+
+    first = C
+
+    class C(Base):  # type: ignore[no-redef]
+      pass
+
+    second = C
+    self.assertIs(find_subclass("C", cls=Base), first)
+
+    del C, first
+    gc.collect()
+    self.assertIs(find_subclass("C", cls=Base), second)
+
+    del second
+    gc.collect()
+    self.assertIsNone(find_subclass("C", cls=Base))
+
+  def test_shadowing_class(self):
+    class A(Base):  # pylint: disable=redefined-outer-name
+      pass
+
+    self.assertIsNot(A, globals()["A"])
+    self.assertIs(find_subclass("A", cls=Base), globals()["A"])
+    del A
+    gc.collect()
+    self.assertIs(find_subclass("A", cls=Base), globals()["A"])
+
+  def test_registered_class_of_other_branch(self):
+    class D(A):
+      pass
+
+    class Other(Base):
+      pass
+
+    class D(Other):  # type: ignore[no-redef]
+      pass
+
+    self.assertIs(find_subclass("D", cls=Other), D)
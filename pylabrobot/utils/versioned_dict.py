@@ -0,0 +1,60 @@
+"""A dictionary that counts its changes."""
+
+from typing import Dict, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class VersionedDict(Dict[K, V]):
+  """A dict whose `version` changes whenever it is modified, so that data derived from it, like a
+  sorted index, can be rebuilt when it is out of date, also after the dict is modified in place.
+
+  Examples:
+    >>> d = VersionedDict({1: "a"})
+    >>> version = d.version
+    >>> d[2] = "b"
+    >>> d.version != version
+    True
+  """
+
+  version = 0
+
+  def _changed(self) -> None:
+    self.version += 1
+
+  def __setitem__(self, key, value):
+    super().__setitem__(key, value)
+    self._changed()
+
+  def __delitem__(self, key):
+    super().__delitem__(key)
+    self._changed()
+
+  def __ior__(self, other):
+    result = super().__ior__(other)
+    self._changed()
+    return result
+
+  def update(self, *args, **kwargs):
+    super().update(*args, **kwargs)
+    self._changed()
+
+  def setdefault(self, key, default=None):
+    result = super().setdefault(key, default)
+    self._changed()
+    return result
+
+  def pop(self, *args):
+    result = super().pop(*args)
+    self._changed()
+    return result
+
+  def popitem(self):
+    result = super().popitem()
+    self._changed()
+    return result
+
+  def clear(self):
+    super().clear()
+    self._changed()
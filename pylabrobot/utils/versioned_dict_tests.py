@@ -0,0 +1,31 @@
+import unittest
+
+from .versioned_dict import VersionedDict
+
+
+class TestVersionedDict(unittest.TestCase):
+  def test_version_changes(self):
+    d: VersionedDict[int, int] = VersionedDict({1: 1})
+    self.assertEqual(d, {1: 1})
+
+    modifications = [
+      lambda: d.__setitem__(2, 2),
+      lambda: d.__delitem__(2),
+      lambda: d.update({3: 3}),
+      lambda: d.__ior__({4: 4}),
+      lambda: d.setdefault(5, 5),
+      lambda: d.pop(5),
+      lambda: d.popitem(),
+      lambda: d.clear(),
+    ]
+    for modify in modifications:
+      version = d.version
+      modify()
+      self.assertNotEqual(d.version, version)
+    self.assertEqual(d, {})
+
+  def test_versions_are_per_dict(self):
+    a: VersionedDict[int, int] = VersionedDict()
+    b: VersionedDict[int, int] = VersionedDict()
+    a[1] = 1
+    self.assertEqual(b.version, 0)
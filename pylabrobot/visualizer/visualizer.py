@@ -21,6 +21,7 @@ except ImportError:
 
 from pylabrobot.__version__ import STANDARD_FORM_JSON_VERSION
 from pylabrobot.resources import Resource
+from pylabrobot.utils import json_codec
 
 logger = logging.getLogger("pylabrobot")
 
@@ -47,6 +48,8 @@ class Visualizer:
     fs_host: str = "127.0.0.1",
     fs_port: int = 1337,
     open_browser: bool = True,
+    state_update_interval: float = 0.05,
+    max_state_update_interval: float = 1.0,
   ):
     """Create a new Visualizer. Use :meth:`.setup` to start the visualization.
 
@@ -58,6 +61,11 @@ class Visualizer:
       fs_port: The port of the file server. If this port is in use, the port will be incremented
         until a free port is found.
       open_browser: If `True`, the visualizer will open a browser window when it is started.
+      state_update_interval: State updates are collected for this many seconds and sent to the
+        browser as a single `set_state` event. With `0`, updates are collected until the next
+        iteration of the event loop.
+      max_state_update_interval: When the browser is slow to receive events, state updates are
+        sent less often, but at least every this many seconds.
     """
 
     self.setup_finished = False
@@ -71,7 +79,7 @@ class Visualizer:
     # register for callbacks
     def register_state_update(resource):
       resource.register_state_update_callback(
-        lambda _: self._handle_state_update_callback(resource)
+        lambda state: self._handle_state_update_callback(resource, state)
       )
       for child in resource.children:
         register_state_update(child)
@@ -98,6 +106,16 @@ class Visualizer:
 
     self.received: List[dict] = []
 
+    # State updates waiting to be sent: name -> serialized state. Callbacks are called from the
+    # thread of the protocol, and the updates are sent from the event loop, so this is guarded by a
+    # lock.
+    self.state_update_interval = state_update_interval
+    self.max_state_update_interval = max_state_update_interval
+    self._state_update_delay = state_update_interval
+    self._pending_state_updates: Dict[str, Dict[str, Any]] = {}
+    self._state_updates_lock = threading.Lock()
+    self._state_update_task: Optional[asyncio.Task] = None
+
   @property
   def websocket(
     self,
@@ -159,7 +177,7 @@ class Visualizer:
       except asyncio.CancelledError:
         return
 
-      data = json.loads(message)
+      data = json_codec.loads(message)
       self.received.append(data)
 
       # If the event is "ready", then we can save the connection and send the saved messages.
@@ -185,7 +203,7 @@ class Visualizer:
       "data": data,
       "event": event,
     }
-    return json.dumps(command_data), id_
+    return json_codec.dumps(command_data), id_
 
   def has_connection(self) -> bool:
     """Return `True` if a websocket connection has been established."""
@@ -406,6 +424,9 @@ class Visualizer:
     self._fst = None
 
     # -- websocket --
+    if self._loop is not None:
+      self.loop.call_soon_threadsafe(self._cancel_state_updates)
+
     if self.has_connection():
       # send stop event to the browser
       await self.send_command("stop", wait_for_response=False)
@@ -457,7 +478,7 @@ class Visualizer:
     # register for callbacks
     def register_state_update(resource: Resource):
       resource.register_state_update_callback(
-        lambda _: self._handle_state_update_callback(resource)
+        lambda state: self._handle_state_update_callback(resource, state)
       )
       for child in resource.children:
         register_state_update(child)
@@ -477,16 +498,70 @@ class Visualizer:
     """Called when a resource is unassigned from a resource already in the tree starting from the
     root resource. This method will send an event about the removed resource"""
 
+    # The browser does not know the resources after they are removed.
+    with self._state_updates_lock:
+      for r in [resource] + resource.get_all_children():
+        self._pending_state_updates.pop(r.name, None)
+
     # Send a `resource_unassigned` event to the browser.
     data = {"resource_name": resource.name}
     fut = self.send_command(event="resource_unassigned", data=data, wait_for_response=False)
     asyncio.run_coroutine_threadsafe(fut, self.loop)
 
-  def _handle_state_update_callback(self, resource: Resource) -> None:
-    """Called when the state of a resource is updated. This method will send an event to the
-    browser about the updated state."""
+  def _handle_state_update_callback(self, resource: Resource, state: Dict[str, Any]) -> None:
+    """Called when the state of a resource is updated. The state will be sent to the browser in the
+    next `set_state` event, see :meth:`_send_state_updates`.
 
-    # Send a `set_state` event to the browser.
-    data = {resource.name: resource.serialize_state()}
-    fut = self.send_command(event="set_state", data=data, wait_for_response=False)
-    asyncio.run_coroutine_threadsafe(fut, self.loop)
+    The state is serialized by the resource when it is updated, on the thread of the protocol, so
+    the state that is sent is never that of a half finished update. Later updates of the same
+    resource replace the pending state.
+    """
+
+    if self._loop is None:  # the state is sent when the browser connects
+      return
+
+    with self._state_updates_lock:
+      start_task = len(self._pending_state_updates) == 0 and self._state_update_task is None
+      self._pending_state_updates[resource.name] = state
+    if start_task:
+      self.loop.call_soon_threadsafe(self._start_state_updates)
+
+  def _start_state_updates(self) -> None:
+    with self._state_updates_lock:
+      if self._state_update_task is None:
+        self._state_update_task = self.loop.create_task(self._send_state_updates())
+
+  def _cancel_state_updates(self) -> None:
+    if self._state_update_task is not None:
+      self._state_update_task.cancel()
+    self._state_update_task = None
+    with self._state_updates_lock:
+      self._pending_state_updates.clear()
+
+  async def _send_state_updates(self) -> None:
+    """Send the state of all updated resources in one `set_state` event per interval, until there
+    are no more updates. An operation on a 96 or 384 well plate updates many resources at once.
+
+    The interval grows when sending takes long, for example because the browser is slow to receive
+    events, so that events do not pile up, and shrinks again when the browser catches up.
+    """
+
+    while True:
+      await asyncio.sleep(self._state_update_delay)
+
+      with self._state_updates_lock:
+        if len(self._pending_state_updates) == 0:
+          self._state_update_task = None
+          return
+        # Taken under the lock, so that resources unassigned before this are not in the event,
+        # and `set_state` is sent before their `resource_unassigned` event.
+        data, self._pending_state_updates = self._pending_state_updates, {}
+
+      start = time.monotonic()
+      await self.send_command(event="set_state", data=data, wait_for_response=False)
+      duration = time.monotonic() - start
+
+      self._state_update_delay = min(
+        max(self.state_update_interval, 2 * duration, self._state_update_delay / 2),
+        self.max_state_update_interval,
+      )
@@ -149,3 +149,39 @@ class VisualizerCommandTests(unittest.IsolatedAsyncioTestCase):
       call_args["data"]["plate_01_well_11_7"]["liquids"],
       [[None, 500]],
     )
+
+  async def test_state_updates_coalesced(self):
+    """Test that the state updates of a single operation are sent in one event."""
+    plate = Cor_96_wellplate_360ul_Fb(name="plate_01")
+    self.r.assign_child_resource(plate, location=Coordinate(0, 0, 0))
+    time.sleep(0.1)
+    self.vis.send_command.reset_mock()  # type: ignore[attr-defined]
+
+    for _ in range(3):
+      plate.set_well_liquids((None, 100))
+    time.sleep(0.2)
+    self.vis.send_command.assert_called_once()  # type: ignore[attr-defined]
+    call_args = self.vis.send_command.call_args[1]  # type: ignore[attr-defined]
+    self.assertEqual(call_args["event"], "set_state")
+    self.assertEqual(len(call_args["data"]), 96)
+
+  async def test_state_serialized_when_updated(self):
+    """The state that is sent is the state at the time of the update, serialized on the thread of
+    the protocol, not when the update is sent."""
+    plate = Cor_96_wellplate_360ul_Fb(name="plate_01")
+    self.r.assign_child_resource(plate, location=Coordinate(0, 0, 0))
+    well = plate.get_well("A1")
+    well.set_liquids([(None, 100)])
+    well.tracker.liquids = [(None, 5)]  # changed without a state update
+    time.sleep(0.2)
+    call_args = self.vis.send_command.call_args[1]  # type: ignore[attr-defined]
+    self.assertEqual(call_args["data"][well.name]["liquids"], [[None, 100]])
+
+  async def test_state_updates_of_unassigned_resource_dropped(self):
+    plate = Cor_96_wellplate_360ul_Fb(name="plate_01")
+    self.r.assign_child_resource(plate, location=Coordinate(0, 0, 0))
+    plate.set_well_liquids((None, 100))
+    self.r.unassign_child_resource(plate)
+    time.sleep(0.2)
+    events = [c[1]["event"] for c in self.vis.send_command.call_args_list]  # type: ignore
+    self.assertNotIn("set_state", events)
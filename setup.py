@@ -66,7 +66,13 @@ setup(
   long_description_content_type="text/markdown",
   install_requires=["typing_extensions"],
   url="https://github.com/pylabrobot/pylabrobot.git",
-  package_data={"pylabrobot": ["visualizer/*"]},
+  package_data={
+    "pylabrobot": [
+      "visualizer/*",
+      "liquid_handling/liquid_classes/*.json",
+      "liquid_handling/liquid_classes/hamilton/*.json",
+    ],
+  },
   extras_require={
     "fw": extras_fw,
     "http": extras_http,
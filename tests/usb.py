@@ -1,3 +1,6 @@
+import threading
+
+
 class MockDev:
   def __init__(self, send_response=None):
     self.send_response = send_response
@@ -21,3 +24,40 @@ class MockDev:
 class MockEndpoint:
   def __init__(self):
     self.wMaxPacketSize = 64
+
+
+class LoopbackDev:
+  """A fake USB device that answers every write with `respond(data)`, split into packets. Reads
+  block until a packet is available or the timeout expires, like a real device."""
+
+  def __init__(self, respond=None, packet_size=64):
+    self.respond = respond or (lambda data: data)
+    self.packet_size = packet_size
+    self.written = []
+    self._packets = []
+    self._condition = threading.Condition()
+
+  def write(self, endpoint, data, timeout=None):
+    if isinstance(data, str):
+      data = data.encode("utf-8")
+    self.written.append(bytes(data))
+    response = self.respond(bytes(data))
+    if response is not None:
+      self.inject(response)
+    return len(data)
+
+  def inject(self, response: bytes):
+    """Make the device send `response`, as if it were sent by the machine."""
+    with self._condition:
+      for i in range(0, len(response), self.packet_size):
+        self._packets.append(response[i : i + self.packet_size])
+      if len(response) % self.packet_size == 0:
+        self._packets.append(b"")  # terminate with a zero length packet
+      self._condition.notify_all()
+
+  def read(self, endpoint, size, timeout=None):
+    with self._condition:
+      self._condition.wait_for(lambda: len(self._packets) > 0, timeout=(timeout or 0) / 1000)
+      if len(self._packets) == 0:
+        return b""
+      return self._packets.pop(0)
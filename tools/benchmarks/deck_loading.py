@@ -0,0 +1,49 @@
+"""Benchmark serializing and deserializing a large, fully loaded STAR deck.
+
+Usage: python tools/benchmarks/deck_loading.py
+"""
+
+import json
+import timeit
+
+from pylabrobot.resources import Cor_96_wellplate_360ul_Fb, Deck
+from pylabrobot.resources.hamilton import (
+  HT,
+  PLT_CAR_L5AC_A00,
+  TIP_CAR_480_A00,
+  STARDeck,
+)
+
+
+def make_deck() -> STARDeck:
+  """A STAR deck with 4 tip carriers and 5 plate carriers, every site filled (3840 tip spots and
+  2400 wells)."""
+
+  deck = STARDeck()
+  for i in range(4):
+    tip_car = TIP_CAR_480_A00(name=f"tip_carrier_{i}")
+    for j in range(5):
+      tip_car[j] = HT(name=f"tips_{i}_{j}")
+    deck.assign_child_resource(tip_car, rails=1 + i * 6)
+  for i in range(5):
+    plt_car = PLT_CAR_L5AC_A00(name=f"plate_carrier_{i}")
+    for j in range(5):
+      plt_car[j] = Cor_96_wellplate_360ul_Fb(name=f"plate_{i}_{j}")
+    deck.assign_child_resource(plt_car, rails=25 + i * 6)
+  return deck
+
+
+def bench(name: str, func, number: int = 5):
+  t = timeit.timeit(func, number=number) / number
+  print(f"{name:<40} {t * 1e3:8.1f} ms")
+
+
+def main():
+  deck = make_deck()
+  data = json.loads(json.dumps(deck.serialize()))
+  bench("serialize", deck.serialize)
+  bench("deserialize", lambda: Deck.deserialize(data))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,44 @@
+"""Benchmark parsing of Hamilton firmware responses.
+
+Usage: python tools/benchmarks/fw_parsing.py
+"""
+
+import timeit
+
+from pylabrobot.liquid_handling.backends.hamilton.STAR import parse_star_fw_string
+from pylabrobot.liquid_handling.backends.hamilton.vantage import parse_vantage_fw_string
+
+# (response, fmt) pairs, in the shape of responses received from the machines.
+STAR_RESPONSES = [
+  ("C0QMid0001", ""),  # plain acknowledgement
+  ("C0RTid0012er00/00rt0 0 0 0 0 0 0 0", "rt# (n)"),  # request_tip_presence
+  ("C0RDid0013er00/00rd2450", "rd####"),  # request_z_pos_channel_n
+  ("C0RYid0014er00/00ry1650 1560 1470 1380 1290 1200 1110 1020", "ry#### (n)"),
+  (
+    "C0TRid0010er00/00kz381 356 365 000 000 000 000 000vz303 360 368 000 000 000 000 000",
+    "kz### (n)vz### (n)",
+  ),
+  ("C0RMid0004er00/00kb11kp08", "kb**kp##"),
+]
+
+VANTAGE_RESPONSES = [
+  ("A1PMDAid1111", None),
+  ("A1PMRTid0005rt0 1 0 1 0 1 0 1", {"rt": "[int]"}),
+  ('A1AMRQid0000er0et""', {"er": "int", "et": "str"}),
+]
+
+
+def bench(name: str, func, number: int = 20000):
+  t = timeit.timeit(func, number=number) / number
+  print(f"{name:<90} {t * 1e6:8.2f} us")
+
+
+def main():
+  for resp, fmt in STAR_RESPONSES:
+    bench(f"STAR    {resp[:60]!r} {fmt!r}", lambda: parse_star_fw_string(resp, fmt))
+  for resp, vfmt in VANTAGE_RESPONSES:
+    bench(f"Vantage {resp[:60]!r} {vfmt!r}", lambda: parse_vantage_fw_string(resp, vfmt))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,55 @@
+"""Benchmark querying resources on a large, fully loaded STAR deck, with indexes and with a
+recursive scan of the tree.
+
+Usage: python tools/benchmarks/query.py
+"""
+
+import re
+import timeit
+
+from deck_loading import make_deck
+
+from pylabrobot.resources import Plate, Resource, TipRack
+from pylabrobot.resources.resource_index import ResourceIndex
+from pylabrobot.resources.utils import query
+
+
+def scan(root: Resource, type_=Resource, name=None, model=None, z=None):
+  """A recursive scan of all resources, like `query` without indexes."""
+  matched = []
+  for resource in root.children:
+    if (
+      isinstance(resource, type_)
+      and (name is None or re.match(name, resource.name))
+      and (model is None or resource.model == model)
+      and (z is None or (resource.location is not None and resource.location.z == z))
+    ):
+      matched.append(resource)
+    matched.extend(scan(resource, type_=type_, name=name, model=model, z=z))
+  return matched
+
+
+def bench(name: str, func, number: int = 100):
+  t = timeit.timeit(func, number=number) / number
+  print(f"{name:<50} {t * 1e3:8.3f} ms")
+
+
+def main():
+  deck = make_deck()
+  plate = deck.get_resource("plate_0_0")
+  queries = {
+    "plates of a model": dict(type_=Plate, model=plate.model),
+    "tip racks": dict(type_=TipRack),
+    "name pattern": dict(name=r"plate_1_\d$"),
+    "at a z coordinate": dict(z=plate.location.z),
+  }
+
+  bench("build index (first query)", lambda: ResourceIndex(deck), number=5)
+  for description, kwargs in queries.items():
+    assert [r.name for r in query(deck, **kwargs)] == [r.name for r in scan(deck, **kwargs)]
+    bench(f"{description}: scan", lambda: scan(deck, **kwargs))
+    bench(f"{description}: query", lambda: query(deck, **kwargs))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,55 @@
+"""Benchmark saving the layout and state of a large, fully loaded STAR deck to a file.
+
+Usage: python tools/benchmarks/state_checkpoint.py
+"""
+
+import json
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+from deck_loading import make_deck
+
+from pylabrobot.resources import set_tip_tracking, set_volume_tracking
+from pylabrobot.utils import json_codec
+
+
+def bench(name: str, func, number: int = 5):
+  t = timeit.timeit(func, number=number) / number
+  tracemalloc.start()
+  func()
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  print(f"{name:<40} {t * 1e3:8.1f} ms {peak / 1e6:8.1f} MB peak")
+
+
+def main():
+  set_tip_tracking(True)
+  set_volume_tracking(True)
+  deck = make_deck()
+  fn = os.path.join(tempfile.mkdtemp(), "state.json")
+  print(f"JSON backend: {json_codec.get_backend()}")
+
+  def save_json():
+    with open(fn, "w", encoding="utf-8") as f:
+      json.dump(deck.serialize_all_state(), f)
+
+  def save_layout_json():
+    with open(fn, "w", encoding="utf-8") as f:
+      json.dump(deck.serialize(), f)
+
+  bench("json.dump(serialize())", save_layout_json)
+  bench("save", lambda: deck.save(fn))
+  bench("load_from_json_file", lambda: deck.load_from_json_file(fn), number=1)
+
+  bench("json.dump(serialize_all_state())", save_json)
+  bench("save_state_to_file", lambda: deck.save_state_to_file(fn))
+  print(f"{'':<40} {os.path.getsize(fn) / 1e6:8.2f} MB file")
+  bench("save_state_to_file(compress=True)", lambda: deck.save_state_to_file(fn, compress=True))
+  print(f"{'':<40} {os.path.getsize(fn) / 1e6:8.2f} MB file")
+  bench("load_state_from_file", lambda: deck.load_state_from_file(fn))
+
+
+if __name__ == "__main__":
+  main()
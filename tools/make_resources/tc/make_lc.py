@@ -1,5 +1,8 @@
-"""Convert liquid classes from EVOware into Python."""
+"""Convert liquid classes from EVOware into the JSON format of
+pylabrobot/liquid_handling/liquid_classes/tecan.json."""
 
+import ast
+import json
 from xml.etree.ElementTree import parse
 
 from pylabrobot.liquid_handling.liquid_classes.tecan import from_str
@@ -10,6 +13,7 @@ path = "DefaultLCs.xml"
 
 def main(lc):
   et = parse(path)
+  records = []
 
   for liquid_class in et.getroot():
     liquid = from_str(liquid_class.attrib["name"])
@@ -81,17 +85,19 @@ def main(lc):
         "dispense_retract_offset": disp[5].attrib["offset"],
       }
 
-      lc.write(f"\n\n")
-      lc.write(
-        f"mapping[({mnv}, {mxv}, LiquidClass.{liquid.name}, TipType.{tip.name})] = TecanLiquidClass(\n"
-      )
-      for k, v in glb.items():
-        lc.write(f"  {k}={v},\n")
-      for k, v in sub.items():
-        lc.write(f"  {k}={v},\n")
-      lc.write(f")\n")
+      record = {
+        "min_volume": ast.literal_eval(mnv),
+        "max_volume": ast.literal_eval(mxv),
+        "liquid": liquid.name,
+        "tip_type": tip.name,
+      }
+      record.update({k: ast.literal_eval(v) for k, v in glb.items()})
+      record.update({k: ast.literal_eval(v) for k, v in sub.items()})
+      records.append(record)
+
+  lc.write("[\n" + ",\n".join(json.dumps(record) for record in records) + "\n]\n")
 
 
 if __name__ == "__main__":
-  with open("liquid_classes.py", "w") as liquid_classes:
+  with open("tecan.json", "w") as liquid_classes:
     main(liquid_classes)